@@ -0,0 +1,48 @@
+"""
+Measures bulk insert throughput (documents per second) against a running RavenDB server.
+
+    python benchmarks/bulk_insert_benchmark.py --url http://127.0.0.1:8080 --database bench --count 100000
+"""
+
+import argparse
+import time
+
+from ravendb import DocumentStore
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions
+
+
+class BenchmarkDocument:
+    def __init__(self, name: str = None, description: str = None, tags: list = None, price: float = None):
+        self.name = name
+        self.description = description
+        self.tags = tags
+        self.price = price
+
+
+def run(store: DocumentStore, count: int, use_compression: bool) -> float:
+    start = time.perf_counter()
+    with store.bulk_insert(options=BulkInsertOptions(use_compression=use_compression)) as bulk_insert:
+        for i in range(count):
+            document = BenchmarkDocument(f"item {i}", "lorem ipsum dolor sit amet " * 4, ["a", "b", "c"], i * 1.5)
+            bulk_insert.store_as(document, f"BenchmarkDocuments/{i}")
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--database", default="bench")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--compression", action="store_true", help="gzip the bulk insert stream")
+    args = parser.parse_args()
+
+    with DocumentStore(args.url, args.database) as store:
+        store.initialize()
+        for run_number in range(1, args.runs + 1):
+            docs_per_second = run(store, args.count, args.compression)
+            print(f"run {run_number}: {args.count} documents, {docs_per_second:,.0f} docs/sec")
+
+
+if __name__ == "__main__":
+    main()
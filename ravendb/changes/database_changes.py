@@ -1,7 +1,7 @@
 import base64
 import ssl
 from threading import Lock
-from typing import TYPE_CHECKING, Dict, Optional, Callable, Any, List
+from typing import TYPE_CHECKING, Dict, Optional, Callable, Any, List, Tuple, Iterator
 
 from websocket import WebSocket
 
@@ -21,7 +21,6 @@ import websocket
 from ravendb.exceptions.exceptions import NotSupportedException
 from ravendb.exceptions.exceptions import ChangeProcessingException
 from ravendb.tools.utils import Utils
-import copy
 from time import sleep
 from concurrent.futures import ThreadPoolExecutor, TimeoutError, Future
 import logging
@@ -31,6 +30,73 @@ if TYPE_CHECKING:
     from ravendb.http.request_executor import RequestExecutor
 
 
+class _PrefixTrie:
+    """
+    Maps prefixes to observables - match walks the key once and yields observables of every prefix it starts with,
+    so its cost depends on the key length and not on the number of prefixes.
+    """
+
+    _VALUES = ""  # every other node key is a single character
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+
+    def add(self, prefix: str, observable: Observable) -> None:
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[self._VALUES] = node.get(self._VALUES, ()) + (observable,)
+
+    def match(self, key: str) -> Iterator[Observable]:
+        node = self._root
+        for char in key:
+            yield from node.get(self._VALUES, ())
+            node = node.get(char)
+            if node is None:
+                return
+        yield from node.get(self._VALUES, ())
+
+
+class _ObservablesIndex:
+    """
+    Observables of a single change type, indexed by the change property their filter compares with (case-insensitive),
+    so a change is handed only to the observables it can match.
+    Lookups don't take locks - additions replace tuples and dicts instead of changing the ones that are being read.
+    """
+
+    def __init__(self):
+        self._unindexed: Tuple[Observable, ...] = ()
+        self._by_value: Dict[str, Dict[str, Tuple[Observable, ...]]] = {}
+        self._by_prefix: Dict[str, _PrefixTrie] = {}
+
+    def add(
+        self, observable: Observable, property_name: Optional[str] = None, value: Any = None, by_prefix: bool = False
+    ) -> None:
+        if property_name is None:
+            self._unindexed += (observable,)
+        elif by_prefix:
+            if property_name not in self._by_prefix:
+                self._by_prefix = {**self._by_prefix, property_name: _PrefixTrie()}
+            self._by_prefix[property_name].add(value.casefold(), observable)
+        else:
+            if property_name not in self._by_value:
+                self._by_value = {**self._by_value, property_name: {}}
+            observables = self._by_value[property_name]
+            key = str(value).casefold()
+            observables[key] = observables.get(key, ()) + (observable,)
+
+    def matching(self, change: DatabaseChange) -> Iterator[Observable]:
+        yield from self._unindexed
+        for property_name, observables in self._by_value.items():
+            value = getattr(change, property_name, None)
+            if value is not None:
+                yield from observables.get(str(value).casefold(), ())
+        for property_name, trie in self._by_prefix.items():
+            value = getattr(change, property_name, None)
+            if value is not None:
+                yield from trie.match(value.casefold())
+
+
 class DatabaseChanges:
     def __init__(
         self,
@@ -50,6 +116,8 @@ class DatabaseChanges:
         self._on_close = on_close
         self.on_error = on_error
         self._observables_by_group: Dict[str, Dict[str, Observable[DatabaseChange]]] = {}
+        self._observables_indexes: Dict[str, _ObservablesIndex] = {}
+        self._observables_lock = Lock()
 
         self._executor = executor if executor else ThreadPoolExecutor(max_workers=10)
         self._worker = self._executor.submit(self.do_work)
@@ -152,16 +220,19 @@ class DatabaseChanges:
                         future = self._confirmations.pop(command_id)
                         future.set_result("done complete future")
                 else:
+                    observables_index = self._observables_indexes.get(response_type)
+                    if observables_index is None:
+                        continue
                     change_json_dict: Optional[Dict[str, Any]] = response.get("Value", None)
-                    self._notify_subscribers(
-                        response_type, change_json_dict, copy.copy(self._observables_by_group[response_type])
-                    )
+                    self._notify_subscribers(response_type, change_json_dict, observables_index)
             except Exception as e:
                 self.notify_about_error(e)
                 raise ChangeProcessingException(e)
 
     @staticmethod
-    def _notify_subscribers(type_of_change: str, change_json_dict: Dict[str, Any], observables: Dict[str, Observable]):
+    def _notify_subscribers(
+        type_of_change: str, change_json_dict: Dict[str, Any], observables_index: _ObservablesIndex
+    ) -> None:
         if type_of_change == "DocumentChange":
             result = DocumentChange.from_json(change_json_dict)
         elif type_of_change == "IndexChange":
@@ -177,7 +248,8 @@ class DatabaseChanges:
         else:
             raise NotSupportedException(type_of_change)
 
-        for observable in observables.values():
+        # the index narrows observables down to the candidates, their filters still have the last word
+        for observable in observables_index.matching(result):
             observable.send(result)
 
     def close(self):
@@ -193,6 +265,7 @@ class DatabaseChanges:
                 confirmation.cancel()
 
         self._observables_by_group.clear()
+        self._observables_indexes.clear()
         if self._on_close:
             self._on_close(self._database_name)
 
@@ -234,6 +307,8 @@ class DatabaseChanges:
             "watch-index",
             "unwatch-index",
             index_name,
+            dispatch_property="name",
+            dispatch_value=index_name,
         )(lambda x: x.name.casefold() == index_name.casefold())
         return observable
 
@@ -244,13 +319,21 @@ class DatabaseChanges:
             "watch-operation",
             "unwatch-operation",
             str(operation_id),
+            dispatch_property="operation_id",
+            dispatch_value=operation_id,
         )(lambda x: x.operation_id == str(operation_id))
         return observable
 
     def for_document(self, doc_id: str) -> Observable[DocumentChange]:
-        observable = self.get_or_add_observable("DocumentChange", "docs/" + doc_id, "watch-doc", "unwatch-doc", doc_id)(
-            lambda x: x.key.casefold() == doc_id.casefold()
-        )
+        observable = self.get_or_add_observable(
+            "DocumentChange",
+            "docs/" + doc_id,
+            "watch-doc",
+            "unwatch-doc",
+            doc_id,
+            dispatch_property="key",
+            dispatch_value=doc_id,
+        )(lambda x: x.key.casefold() == doc_id.casefold())
         return observable
 
     def for_documents_start_with(self, doc_id_prefix: str) -> Observable[DocumentChange]:
@@ -260,6 +343,9 @@ class DatabaseChanges:
             "watch-prefix",
             "unwatch-prefix",
             doc_id_prefix,
+            dispatch_property="key",
+            dispatch_value=doc_id_prefix,
+            dispatch_by_prefix=True,
         )(lambda x: x.key is not None and x.key.casefold().startswith(doc_id_prefix.casefold()))
         return observable
 
@@ -270,6 +356,8 @@ class DatabaseChanges:
             "watch-collection",
             "unwatch-collection",
             collection_name,
+            dispatch_property="collection_name",
+            dispatch_value=collection_name,
         )(lambda x: x.collection_name.casefold() == collection_name.casefold())
         return observable
 
@@ -291,6 +379,8 @@ class DatabaseChanges:
             "watch-timeseries",
             "unwatch-timeseries",
             time_series_name,
+            dispatch_property="name",
+            dispatch_value=time_series_name,
         )(lambda x: x.name.casefold() == time_series_name.casefold())
         return observable
 
@@ -319,6 +409,8 @@ class DatabaseChanges:
             unwatch_command,
             resource_name=value,
             resources_names=values,
+            dispatch_property="document_id",
+            dispatch_value=doc_id,
         )(get_lambda())
         return observable
 
@@ -337,6 +429,8 @@ class DatabaseChanges:
             "watch-counter",
             "unwatch-counter",
             counter_name,
+            dispatch_property="name",
+            dispatch_value=counter_name,
         )(lambda x: x.name.casefold() == counter_name.casefold())
         return observable
 
@@ -353,6 +447,8 @@ class DatabaseChanges:
             "watch-document-counters",
             "unwatch-document-counters",
             resource_name=doc_id,
+            dispatch_property="document_id",
+            dispatch_value=doc_id,
         )(lambda x: x.document_id.casefold() == doc_id.casefold())
         return observable
 
@@ -371,6 +467,8 @@ class DatabaseChanges:
             "watch-document-counter",
             "unwatch-document-counter",
             resources_names=[doc_id, counter_name],
+            dispatch_property="document_id",
+            dispatch_value=doc_id,
         )(lambda x: x.document_id.casefold() == doc_id.casefold() and x.name.casefold())
         return observable
 
@@ -382,31 +480,41 @@ class DatabaseChanges:
         unwatch_command: str,
         resource_name: Optional[str] = None,
         resources_names: Optional[List[str]] = None,
+        dispatch_property: Optional[str] = None,
+        dispatch_value: Any = None,
+        dispatch_by_prefix: bool = False,
     ):
-        if group not in self._observables_by_group:
-            self._observables_by_group[group] = {}
-
-        if name not in self._observables_by_group[group]:
-
-            def on_disconnect():
-                try:
-                    if self.client_websocket.connected:
-                        self.send(unwatch_command, resource_name, resources_names)
-                except websocket.WebSocketException:
-                    pass
-
-            def on_connect():
-                self.send(watch_command, resource_name, resources_names)
-
-            observable = Observable(
-                on_connect=on_connect,
-                on_disconnect=on_disconnect,
-                executor=self._executor,
-            )
-            self._observables_by_group[group][name] = observable
-            if self._immediate_connection != 0:
-                observable.set(self._executor.submit(observable.on_connect))
-        return self._observables_by_group[group][name]
+        """
+        Observables created with dispatch_property get only changes whose property equals dispatch_value
+        (or starts with it, when dispatch_by_prefix is set) - others are handed every change of the group
+        """
+        with self._observables_lock:
+            if group not in self._observables_by_group:
+                self._observables_by_group[group] = {}
+                self._observables_indexes[group] = _ObservablesIndex()
+
+            if name not in self._observables_by_group[group]:
+
+                def on_disconnect():
+                    try:
+                        if self.client_websocket.connected:
+                            self.send(unwatch_command, resource_name, resources_names)
+                    except websocket.WebSocketException:
+                        pass
+
+                def on_connect():
+                    self.send(watch_command, resource_name, resources_names)
+
+                observable = Observable(
+                    on_connect=on_connect,
+                    on_disconnect=on_disconnect,
+                    executor=self._executor,
+                )
+                self._observables_by_group[group][name] = observable
+                self._observables_indexes[group].add(observable, dispatch_property, dispatch_value, dispatch_by_prefix)
+                if self._immediate_connection != 0:
+                    observable.set(self._executor.submit(observable.on_connect))
+            return self._observables_by_group[group][name]
 
     def send(self, command: str, value: Optional[str], values: Optional[List[str]] = None):
         current_command_id = 0
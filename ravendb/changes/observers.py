@@ -1,13 +1,64 @@
 from __future__ import annotations
+import itertools
+from collections import OrderedDict
 from concurrent.futures import Future, ThreadPoolExecutor
-from threading import Lock
-from typing import Callable, Generic, TypeVar, Optional
+from datetime import timedelta
+from enum import Enum
+from threading import Condition, Lock
+from typing import Any, Callable, Generic, Hashable, TypeVar, Optional
 
 from ravendb.tools.concurrentset import ConcurrentSet
+from ravendb.tools.utils import Utils
 
 _T_Change = TypeVar("_T_Change")
 
 
+class OverflowPolicy(Enum):
+    DROP_OLDEST = "DropOldest"
+    COALESCE = "Coalesce"
+    BLOCK = "Block"
+
+
+class DeliveryOptions:
+    """
+    Subscribing with delivery options moves the observer off the changes reader thread - changes are queued
+    and delivered on the executor of the observable, so a slow observer doesn't hold back the other ones.
+
+    :param max_queue_size: how many undelivered changes the observer keeps
+    :param overflow_policy: what happens to a change that doesn't fit into the queue - DROP_OLDEST drops
+        the oldest queued change, COALESCE replaces the queued change with the same coalesce key (and drops
+        the oldest one when there's none) and BLOCK makes the reader wait until the observer catches up -
+        the whole connection waits with it, other observers and subscription confirmations included
+    :param coalesce_key: key of a change for COALESCE policy, by default the id or name of what has changed
+    :param batch_interval: when set, the observer gets a list of the changes queued during the interval
+        instead of the changes one by one
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1024,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        coalesce_key: Optional[Callable[[Any], Hashable]] = None,
+        batch_interval: Optional[timedelta] = None,
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be greater than 0")
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.coalesce_key = coalesce_key or _default_coalesce_key
+        self.batch_interval = batch_interval
+
+
+def _default_coalesce_key(change: Any) -> Hashable:
+    return (
+        change.__class__,
+        getattr(change, "key", None),
+        getattr(change, "document_id", None),
+        getattr(change, "name", None),
+        getattr(change, "operation_id", None),
+    )
+
+
 class Observable(Generic[_T_Change]):
     def __init__(
         self,
@@ -37,13 +88,18 @@ class Observable(Generic[_T_Change]):
         except Exception as e:
             self.error(e)
 
-    def subscribe(self, on_next_callback: Callable[[], None]) -> Callable[[], None]:
+    def subscribe(
+        self, on_next_callback: Callable[[], None], delivery: Optional[DeliveryOptions] = None
+    ) -> Callable[[], None]:
         """
         @param func on_next_callback: The action that observer will do when changes happens
+        @param DeliveryOptions delivery: Queue the changes and deliver them on the executor
         :return: method that close the subscriber
         """
         self.inc()
         observer = ActionObserver(on_next=on_next_callback)
+        if delivery is not None:
+            observer = QueuedObserver(observer, delivery, self._executor)
         self._subscribers.add(observer)
 
         def close_action() -> None:
@@ -54,12 +110,17 @@ class Observable(Generic[_T_Change]):
 
         return close_action
 
-    def subscribe_with_observer(self, observer: ActionObserver) -> Callable[[], None]:
+    def subscribe_with_observer(
+        self, observer: ActionObserver, delivery: Optional[DeliveryOptions] = None
+    ) -> Callable[[], None]:
         """
         @param Observer observer: The observer that will do action when changes happens
+        @param DeliveryOptions delivery: Queue the changes and deliver them on the executor
         :return: method that close the subscriber
         """
         self.inc()
+        if delivery is not None:
+            observer = QueuedObserver(observer, delivery, self._executor)
         self._subscribers.add(observer)
 
         def close_action() -> None:
@@ -88,7 +149,7 @@ class Observable(Generic[_T_Change]):
                     if f.cancelled():
                         self._future_set.cancel()
                     elif f.exception():
-                        self._future_set.set_exception(f.exception)
+                        self._future_set.set_exception(f.exception())
                     else:
                         self._future_set.set_result(None)
                 except Exception:
@@ -151,3 +212,130 @@ class ActionObserver:
     @property
     def on_completed_callback(self):
         return self._on_completed_callback
+
+
+class QueuedObserver:
+    """
+    Wraps an observer - on_next only queues the change, a task on the executor delivers it.
+    At most one delivery task per observer is running, so the observer gets its changes in order.
+    Batches are collected on a timer, the executor is busy only while a batch is being delivered.
+    """
+
+    def __init__(self, observer: ActionObserver, options: DeliveryOptions, executor: ThreadPoolExecutor):
+        if executor is None:
+            raise ValueError("Queued delivery requires an executor")
+        self._observer = observer
+        self._options = options
+        self._executor = executor
+        self._queue: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sequence = itertools.count()
+        self._condition = Condition()
+        self._delivering = False
+        self._closed = False
+        self._completion_requested = False
+        self._completed = False
+        self.dropped = 0
+
+    def on_next(self, value: _T_Change) -> None:
+        options = self._options
+        with self._condition:
+            if options.overflow_policy == OverflowPolicy.COALESCE:
+                key = options.coalesce_key(value)
+                if key in self._queue:
+                    # keeps the position in the queue, the observer gets only the latest change
+                    self._queue[key] = value
+                    self.dropped += 1
+                    return
+            else:
+                key = next(self._sequence)
+
+            if options.overflow_policy == OverflowPolicy.BLOCK:
+                while len(self._queue) >= options.max_queue_size and not self._closed:
+                    self._condition.wait()
+            elif len(self._queue) >= options.max_queue_size:
+                self._queue.popitem(last=False)
+                self.dropped += 1
+
+            if self._closed:
+                return
+
+            self._queue[key] = value
+            if self._delivering:
+                return
+            self._delivering = True
+
+        self.__schedule()
+
+    def on_error(self, exception: Exception) -> None:
+        self._observer.on_error(exception)
+
+    def on_completed(self) -> None:
+        with self._condition:
+            # changes that are already queued are still delivered, the delivery task completes the observer after them
+            self._closed = True
+            self._completion_requested = True
+            self._condition.notify_all()
+            if self._delivering:
+                return
+        self.__complete()
+
+    @property
+    def on_completed_callback(self):
+        # the queue has to be closed even when the wrapped observer doesn't care about completion
+        return self.on_completed
+
+    def __schedule(self) -> None:
+        interval = self._options.batch_interval
+        if interval is None:
+            self.__submit()
+        else:
+            Utils.start_a_timer(interval.total_seconds(), self.__submit, name="changes-batch", daemon=True)
+
+    def __submit(self) -> None:
+        try:
+            self._executor.submit(self.__deliver)
+        except RuntimeError:
+            # executor was shut down - changes were closed
+            with self._condition:
+                self._queue.clear()
+                self._delivering = False
+                self._closed = True
+                self._condition.notify_all()
+                if not self._completion_requested:
+                    return
+            self.__complete()
+
+    def __deliver(self) -> None:
+        options = self._options
+        # other observers get their turn on the executor after a batch or a queue length worth of changes
+        for _ in range(1 if options.batch_interval is not None else options.max_queue_size):
+            with self._condition:
+                drained = not self._queue
+                if drained:
+                    self._delivering = False
+                    completion_requested = self._completion_requested
+                elif options.batch_interval is not None:
+                    value = list(self._queue.values())
+                    self._queue.clear()
+                else:
+                    value = self._queue.popitem(last=False)[1]
+                self._condition.notify_all()
+
+            if drained:
+                if completion_requested:
+                    self.__complete()
+                return
+
+            try:
+                self._observer.on_next(value)
+            except Exception as e:
+                self._observer.on_error(e)
+
+        self.__schedule()
+
+    def __complete(self) -> None:
+        with self._condition:
+            if self._completed:
+                return
+            self._completed = True
+        self._observer.on_completed()
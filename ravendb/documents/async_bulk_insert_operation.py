@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional, TYPE_CHECKING, AsyncIterator
+
+import requests
+
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions, BulkInsertOperation
+from ravendb.documents.commands.bulkinsert import GetNextOperationIdCommand, KillOperationCommand
+from ravendb.documents.identity.hilo import GenerateEntityIdOnTheClient
+from ravendb.documents.operations.misc import GetOperationStateOperation
+from ravendb.exceptions.documents.bulkinsert import BulkInsertAbortedException
+from ravendb.exceptions.raven_exceptions import RavenException
+from ravendb.extensions.http_extensions import HttpExtensions
+from ravendb.http.raven_command import RavenCommand
+from ravendb.http.server_node import ServerNode
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
+from ravendb.primitives import constants
+
+if TYPE_CHECKING:
+    from ravendb.documents.store.async_document_store import AsyncDocumentStore
+
+
+class AsyncBulkInsertOperation:
+    """
+    Bulk insert for asyncio applications. Documents are serialized into 1 MB chunks which are streamed
+    to the server by the request running on the event loop, store() awaits when max_buffers_in_flight chunks
+    are waiting for the network.
+    """
+
+    class _BulkInsertCommand(RavenCommand[None]):
+        def __init__(
+            self,
+            key: int,
+            data: AsyncIterator[bytes],
+            node_tag: Optional[str],
+            skip_overwrite_if_unchanged: bool,
+            use_compression: bool,
+        ):
+            super().__init__()
+            self._key = key
+            self._data = data
+            self._selected_node_tag = node_tag
+            self._skip_overwrite_if_unchanged = skip_overwrite_if_unchanged
+            self._use_compression = use_compression
+
+        def create_request(self, node: ServerNode) -> requests.Request:
+            request = requests.Request(
+                "POST",
+                f"{node.url}/databases/{node.database}/bulk_insert?id={self._key}"
+                f"&skipOverwriteIfUnchanged={'true' if self._skip_overwrite_if_unchanged else 'false'}",
+                data=self._data,
+            )
+
+            if self._use_compression:
+                request.data = HttpExtensions.gzip_compress_async_stream(request.data)
+                request.headers[constants.Headers.CONTENT_ENCODING] = "gzip"
+
+            return request
+
+        def set_response(self, response: Optional[str], from_cache: bool) -> None:
+            raise NotImplementedError("Not Implemented")
+
+        def is_read_request(self) -> bool:
+            return False
+
+    def __init__(self, database: str = None, store: AsyncDocumentStore = None, options: BulkInsertOptions = None):
+        if not database or database.isspace():
+            raise RuntimeError(
+                "Cannot start bulk insert operation without specifying a name of a database to operate on. "
+                "Database name can be passed as an argument when bulk insert is being created or "
+                "default database can be defined using 'DocumentStore.database' property."
+            )
+
+        self._options = options or BulkInsertOptions()
+        self.use_compression = bool(self._options.use_compression)
+        self._request_executor = store.get_request_executor(database)
+        self._conventions = self._request_executor.conventions
+
+        self._max_size_in_buffer = 1024 * 1024
+        self._buffer = bytearray()
+        self._buffers_to_send: asyncio.Queue = asyncio.Queue(self._options.max_buffers_in_flight)
+
+        self._operation_id = -1
+        self._node_tag: Optional[str] = None
+        self._first = True
+        self._ongoing_bulk_insert_execute_task: Optional[asyncio.Task] = None
+
+        self._generate_entity_id_on_the_client = GenerateEntityIdOnTheClient(
+            self._conventions, lambda entity: self._conventions.generate_document_id(database, entity)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def store(self, entity: object, metadata: Optional[MetadataAsDictionary] = None) -> str:
+        if metadata is not None and constants.Documents.Metadata.ID in metadata:
+            key = metadata[constants.Documents.Metadata.ID]
+        else:
+            key = await self._get_id(entity)
+
+        await self.store_as(entity, key, metadata or MetadataAsDictionary())
+        return key
+
+    async def store_as(self, entity: object, key: str, metadata: Optional[MetadataAsDictionary] = None) -> None:
+        BulkInsertOperation._verify_valid_key(key)
+        await self._ensure_ongoing_operation()
+
+        metadata = metadata if metadata is not None else MetadataAsDictionary()
+        BulkInsertOperation._fill_metadata_if_needed(self._conventions, entity, metadata)
+
+        if not self._first:
+            self._buffer += b","
+        self._first = False
+
+        BulkInsertOperation._write_put_command(self._buffer.extend, self._conventions, key, entity, metadata)
+
+        if len(self._buffer) >= self._max_size_in_buffer:
+            await self._flush()
+
+    async def close(self) -> None:
+        if self._ongoing_bulk_insert_execute_task is None:
+            return  # closing without calling a single store
+
+        flush_ex = None
+        try:
+            self._buffer += b"]"
+            await self._flush()
+            await self._hand_over(None)
+        except Exception as e:
+            flush_ex = e
+
+        try:
+            await self._ongoing_bulk_insert_execute_task
+        except Exception as e:
+            await self._throw_bulk_insert_aborted(e, flush_ex)
+
+        if flush_ex is not None:
+            await self._throw_bulk_insert_aborted(None, flush_ex)
+
+    async def abort(self) -> None:
+        if self._operation_id == -1:
+            return  # nothing was done, nothing to kill
+
+        try:
+            await self._request_executor.execute_command(KillOperationCommand(self._operation_id, self._node_tag))
+        except RavenException as e:
+            raise BulkInsertAbortedException(
+                "Unable to kill this bulk insert operation, because it was not found on the server", e
+            )
+
+    async def _ensure_ongoing_operation(self) -> None:
+        if self._ongoing_bulk_insert_execute_task is None:
+            command = GetNextOperationIdCommand()
+            await self._request_executor.execute_command(command)
+            self._operation_id = command.result
+            self._node_tag = command.node_tag
+
+            bulk_command = AsyncBulkInsertOperation._BulkInsertCommand(
+                self._operation_id,
+                self._send_data(),
+                self._node_tag,
+                self._options.skip_overwrite_if_unchanged,
+                self.use_compression,
+            )
+            self._ongoing_bulk_insert_execute_task = asyncio.ensure_future(
+                self._request_executor.execute_command(bulk_command)
+            )
+            self._buffer += b"["
+            return
+
+        if self._ongoing_bulk_insert_execute_task.done():
+            await self._throw_bulk_insert_aborted(self._ongoing_bulk_insert_execute_task.exception(), None)
+
+    async def _send_data(self) -> AsyncIterator[bytes]:
+        while True:
+            data = await self._buffers_to_send.get()
+            if data is None:
+                return
+            yield data
+
+    async def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        await self._hand_over(data)
+
+    async def _hand_over(self, data: Optional[bytes]) -> None:
+        put = asyncio.ensure_future(self._buffers_to_send.put(data))
+        # the request may fail while we wait for a free slot, nobody would take the data then
+        await asyncio.wait((put, self._ongoing_bulk_insert_execute_task), return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            await self._throw_bulk_insert_aborted(self._ongoing_bulk_insert_execute_task.exception(), None)
+
+    async def _throw_bulk_insert_aborted(self, e: Optional[BaseException], flush_ex: Optional[BaseException]):
+        error_from_server = None
+        try:
+            error_from_server = await self._get_exception_from_operation()
+        except Exception:
+            pass  # server is probably down, will propagate the original exception
+
+        if error_from_server is not None:
+            raise error_from_server
+
+        raise BulkInsertAbortedException("Failed to execute bulk insert", e or flush_ex)
+
+    async def _get_exception_from_operation(self) -> Optional[BulkInsertAbortedException]:
+        state_request = GetOperationStateOperation.GetOperationStateCommand(self._operation_id, self._node_tag)
+        await self._request_executor.execute_command(state_request)
+
+        if "Faulted" != state_request.result["Status"]:
+            return None
+
+        result = state_request.result["Result"]
+        if result["$type"].startswith("Raven.Client.Documents.Operations.OperationExceptionResult"):
+            return BulkInsertAbortedException(result["Error"])
+
+        return None
+
+    async def _get_id(self, entity: object) -> str:
+        success, key = self._generate_entity_id_on_the_client.try_get_id_from_instance(entity)
+        if success:
+            return key
+
+        # generating the id may need a new HiLo range from the server
+        key = await asyncio.get_running_loop().run_in_executor(
+            None, self._generate_entity_id_on_the_client.generate_document_key_for_storage, entity
+        )
+        self._generate_entity_id_on_the_client.try_set_identity(entity, key)
+        return key
@@ -3,16 +3,15 @@ from __future__ import annotations
 from datetime import datetime
 from abc import ABC
 
-import _queue
 import concurrent
-import json
-from concurrent.futures import Future
-from copy import deepcopy
-from queue import Queue
-from threading import Lock, Semaphore
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, Queue
+from threading import Lock, Condition, Thread
 from typing import Optional, TYPE_CHECKING, List, TypeVar, Type, Generic, Callable
 
 import requests
+import urllib3
 
 from ravendb.documents.session.time_series import (
     ITimeSeriesValuesBindable,
@@ -22,6 +21,7 @@ from ravendb.documents.session.time_series import (
 from ravendb.documents.time_series import TimeSeriesOperations
 from ravendb.primitives import constants
 from ravendb.exceptions.raven_exceptions import RavenException
+from ravendb.extensions.http_extensions import HttpExtensions
 from ravendb.http.server_node import ServerNode
 from ravendb.http.raven_command import RavenCommand
 from ravendb.documents.operations.misc import GetOperationStateOperation
@@ -30,47 +30,94 @@ from ravendb.documents.session.document_info import DocumentInfo
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 from ravendb.documents.commands.batches import CommandType
 from ravendb.documents.commands.bulkinsert import GetNextOperationIdCommand, KillOperationCommand
-from ravendb.exceptions.documents.bulkinsert import BulkInsertAbortedException
+from ravendb.exceptions.documents.bulkinsert import BulkInsertAbortedException, ParallelBulkInsertAbortedException
 from ravendb.documents.identity.hilo import GenerateEntityIdOnTheClient
 from ravendb.tools.utils import Utils
 
 if TYPE_CHECKING:
     from ravendb.documents.store.definition import DocumentStore
+    from ravendb.documents.conventions import DocumentConventions
 
 
 _T_TS_Bindable = TypeVar("_T_TS_Bindable", bound=ITimeSeriesValuesBindable)
 
 
+# urllib3 before 2.0 sends chunked bodies with chunk.encode("utf8") on anything that isn't bytes
+_CHUNKED_BODY_ACCEPTS_MEMORYVIEW = int(urllib3.__version__.split(".")[0]) >= 2
+
+
 class BulkInsertOperation:
     class _BufferExposer:
-        def __init__(self):
+        def __init__(self, buffer_size: int, max_buffers_in_flight: int):
             self._ongoing_operation = Future()  # todo: is there any reason to use Futures? (look at error handling)
-            self._yield_buffer_semaphore = Semaphore(1)
-            self._buffers_to_flush_queue = Queue()
             self.output_stream_mock = Future()
 
-        def enqueue_buffer_for_flush(self, buffer: bytearray):
-            self._buffers_to_flush_queue.put(bytes(buffer))
+            self._buffers_to_flush_queue = deque()
+            self._max_buffers_in_flight = max_buffers_in_flight
+            self._buffers_to_flush_condition = Condition()
+            self._consumer_closed = False
+
+            self._buffer_size = buffer_size
+            self._free_buffers: List[bytearray] = []
+            self._free_buffers_lock = Lock()
+
+        def rent_buffer(self) -> bytearray:
+            with self._free_buffers_lock:
+                if self._free_buffers:
+                    return self._free_buffers.pop()
+            return bytearray(self._buffer_size)
+
+        def return_buffer(self, buffer: bytearray) -> None:
+            with self._free_buffers_lock:
+                self._free_buffers.append(buffer)
+
+        def enqueue_buffer_for_flush(self, buffer: bytearray, length: int):
+            # ownership of the buffer goes to send_data, it's returned to the pool once sent
+            with self._buffers_to_flush_condition:
+                # backpressure - the writer waits for the network instead of piling up buffers in memory
+                while len(self._buffers_to_flush_queue) >= self._max_buffers_in_flight and not self._consumer_closed:
+                    self._buffers_to_flush_condition.wait()
+
+                if self._consumer_closed:
+                    return  # request is gone, the error surfaces from the bulk insert task
+
+                self._buffers_to_flush_queue.append((buffer, length))
+                self._buffers_to_flush_condition.notify_all()
 
-        # todo: blocking semaphore acquired and released on enter and exit from bulk insert operation context manager
         def send_data(self):
             while True:
-                try:
-                    buffer_to_flush = self._buffers_to_flush_queue.get(timeout=0.05)  # todo: adjust this pooling time
-                    yield buffer_to_flush
-                except Exception as e:
-                    if not isinstance(e, _queue.Empty) or self.is_operation_finished():
-                        break
-                    continue  # expected Empty exception coming from queue, operation isn't finished yet
+                with self._buffers_to_flush_condition:
+                    while not self._buffers_to_flush_queue and not self.is_operation_finished():
+                        self._buffers_to_flush_condition.wait()
+
+                    if not self._buffers_to_flush_queue:
+                        break  # operation finished and everything was sent
+
+                    buffer, length = self._buffers_to_flush_queue.popleft()
+                    self._buffers_to_flush_condition.notify_all()
+
+                # the chunk is written to the socket (or compressed) before the generator is resumed
+                with memoryview(buffer) as view, view[:length] as chunk:
+                    yield chunk if _CHUNKED_BODY_ACCEPTS_MEMORYVIEW else bytes(chunk)
+                self.return_buffer(buffer)
 
         def is_operation_finished(self) -> bool:
             return self._ongoing_operation.done()
 
         def finish_operation(self):
-            self._ongoing_operation.set_result(None)
+            with self._buffers_to_flush_condition:
+                self._ongoing_operation.set_result(None)
+                self._buffers_to_flush_condition.notify_all()
 
         def error_on_processing_request(self, exception: Exception):
-            self._ongoing_operation.set_exception(exception)
+            with self._buffers_to_flush_condition:
+                self._ongoing_operation.set_exception(exception)
+                self._buffers_to_flush_condition.notify_all()
+
+        def close_consumer(self):
+            with self._buffers_to_flush_condition:
+                self._consumer_closed = True
+                self._buffers_to_flush_condition.notify_all()
 
         def error_on_request_start(self, exception: Exception):
             self.output_stream_mock.set_exception(exception)
@@ -91,13 +138,19 @@ class BulkInsertOperation:
             self._skip_overwrite_if_unchanged = skip_overwrite_if_unchanged
 
         def create_request(self, node: ServerNode) -> requests.Request:
-            return requests.Request(
+            request = requests.Request(
                 "POST",
                 f"{node.url}/databases/{node.database}/bulk_insert?id={self._key}"
                 f"&skipOverwriteIfUnchanged={'true' if self._skip_overwrite_if_unchanged else 'false'}",
                 data=self._buffer_exposer.send_data(),
             )
 
+            if self.use_compression:
+                request.data = HttpExtensions.gzip_compress_stream(request.data)
+                request.headers[constants.Headers.CONTENT_ENCODING] = "gzip"
+
+            return request
+
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
             raise NotImplementedError("Not Implemented")
 
@@ -110,35 +163,41 @@ class BulkInsertOperation:
             except Exception as e:
                 self._buffer_exposer.error_on_request_start(e)
 
-    def __init__(self, database: str = None, store: "DocumentStore" = None, options: BulkInsertOptions = None):
-        self.use_compression = False
+    def __init__(
+        self,
+        database: str = None,
+        store: "DocumentStore" = None,
+        options: BulkInsertOptions = None,
+        node_tag: Optional[str] = None,
+        thread_pool_executor: Optional[ThreadPoolExecutor] = None,
+    ):
 
         self._ongoing_bulk_insert_execute_task: Optional[Future] = None
         self._first = True
         self._in_progress_command: Optional[CommandType] = None
         self._operation_id = -1
-        self._node_tag = None
+        self._node_tag = node_tag
         self._concurrent_check_flag = 0
         self._concurrent_check_lock = Lock()
 
-        self._thread_pool_executor = store.thread_pool_executor
+        self._thread_pool_executor = thread_pool_executor or store.thread_pool_executor
         self._conventions = store.conventions
         if not database or database.isspace():
             self._throw_no_database()
 
-        self._use_compression = options.use_compression if options else False
+        self.use_compression = bool(options.use_compression) if options else False
         self._options = options or BulkInsertOptions()
         self._request_executor = store.get_request_executor(database)
 
-        self._enqueue_current_buffer_async = Future()
-        self._enqueue_current_buffer_async.set_result(None)
-
         self._max_size_in_buffer = 1024 * 1024
 
-        self._current_data_buffer = bytearray()
-
         self._time_series_batch_size = self._conventions.time_series_batch_size
-        self._buffer_exposer = BulkInsertOperation._BufferExposer()
+        self._buffer_exposer = BulkInsertOperation._BufferExposer(
+            self._max_size_in_buffer, self._options.max_buffers_in_flight
+        )
+
+        self._current_data_buffer = self._buffer_exposer.rent_buffer()
+        self._current_data_buffer_position = 0
 
         self._generate_entity_id_on_the_client = GenerateEntityIdOnTheClient(
             self._request_executor.conventions,
@@ -160,12 +219,10 @@ class BulkInsertOperation:
             return
 
         # process the leftovers and finish the stream
-        if self._current_data_buffer:
+        if self._ongoing_bulk_insert_execute_task is not None:
             try:
                 self._write_string_no_escape("]")
-                self._enqueue_current_buffer_async.result()  # wait for enqueue
-                buffer = self._current_data_buffer
-                self._buffer_exposer.enqueue_buffer_for_flush(buffer)
+                self._flush_current_buffer()
             except Exception as e:
                 flush_ex = e
 
@@ -204,21 +261,22 @@ class BulkInsertOperation:
         if self._operation_id != -1:
             return
 
-        bulk_insert_get_id_request = GetNextOperationIdCommand()
+        bulk_insert_get_id_request = GetNextOperationIdCommand(self._node_tag)
         self._request_executor.execute_command(bulk_insert_get_id_request)
         self._operation_id = bulk_insert_get_id_request.result
         self._node_tag = bulk_insert_get_id_request.node_tag
 
-    def _fill_metadata_if_needed(self, entity: object, metadata: MetadataAsDictionary):
+    @staticmethod
+    def _fill_metadata_if_needed(conventions: DocumentConventions, entity: object, metadata: MetadataAsDictionary):
         # add collection name to metadata if needed
         if constants.Documents.Metadata.COLLECTION not in metadata:
-            collection = self._request_executor.conventions.get_collection_name(entity)
+            collection = conventions.get_collection_name(entity)
             if collection is not None:
                 metadata[constants.Documents.Metadata.COLLECTION] = collection
 
         # add type path to metadata if needed
         if constants.Documents.Metadata.RAVEN_PYTHON_TYPE not in metadata:
-            python_type = self._request_executor.conventions.get_python_class_name(entity.__class__)
+            python_type = conventions.get_python_class_name(entity.__class__)
             if python_type is not None:
                 metadata[constants.Documents.Metadata.RAVEN_PYTHON_TYPE] = python_type
 
@@ -240,7 +298,7 @@ class BulkInsertOperation:
             self._verify_valid_key(key)
             self._ensure_ongoing_operation()
 
-            self._fill_metadata_if_needed(entity, metadata)
+            self._fill_metadata_if_needed(self._request_executor.conventions, entity, metadata)
             self._end_previous_command_if_needed()  # counters & time series commands shall end before pushing docs
 
             try:
@@ -250,14 +308,7 @@ class BulkInsertOperation:
                 self._first = False
                 self._in_progress_command = CommandType.NONE
 
-                self._write_string_no_escape('{"Id":"')
-                self._write_string(key)
-                self._write_string_no_escape('","Type":"PUT","Document":')
-
-                self._flush_if_needed()
-
-                self._write_document(entity, metadata)
-                self._write_string_no_escape("}")
+                self._write_put_command(self._write_bytes, self._conventions, key, entity, metadata)
                 # todo: self._flush_if_needed() - causes error - https://issues.hibernatingrhinos.com/issue/RDBC-701
             except Exception as e:
                 self._handle_errors(key, e)
@@ -286,18 +337,17 @@ class BulkInsertOperation:
         return __return_func
 
     def _flush_if_needed(self) -> None:
-        if len(self._current_data_buffer) > self._max_size_in_buffer or self._enqueue_current_buffer_async.done():
-            self._enqueue_current_buffer_async.result()  # wait
-
-            buffer = deepcopy(self._current_data_buffer)
-            self._current_data_buffer.clear()
+        if self._current_data_buffer_position >= self._max_size_in_buffer:
+            self._flush_current_buffer()
 
-            # todo: check if it's better to create a new bytearray of max size instead of clearing it (possible dealloc)
-
-            def __enqueue_buffer_for_flush(flushed_buffer: bytearray):
-                self._buffer_exposer.enqueue_buffer_for_flush(flushed_buffer)
+    def _flush_current_buffer(self) -> None:
+        if self._current_data_buffer_position == 0:
+            return
 
-            self._enqueue_current_buffer_async = self._thread_pool_executor.submit(__enqueue_buffer_for_flush, buffer)
+        # hand the filled buffer over as is and continue writing into a pooled one - no copies
+        self._buffer_exposer.enqueue_buffer_for_flush(self._current_data_buffer, self._current_data_buffer_position)
+        self._current_data_buffer = self._buffer_exposer.rent_buffer()
+        self._current_data_buffer_position = 0
 
     def _end_previous_command_if_needed(self) -> None:
         if self._in_progress_command == CommandType.COUNTERS:
@@ -305,25 +355,53 @@ class BulkInsertOperation:
         elif self._in_progress_command == CommandType.TIME_SERIES:
             self.TimeSeriesBulkInsert._throw_already_running_time_series()
 
-    def _write_string(self, input_string: str) -> None:
-        for i in range(len(input_string)):
-            c = input_string[i]
-            if '"' == c:
-                if i == 0 or input_string[i - 1] != "\\":
-                    self._current_data_buffer += bytearray("\\", encoding="utf-8")
+    def _write_bytes(self, data: bytes) -> None:
+        position = self._current_data_buffer_position
+        end = position + len(data)
+        if end <= self._max_size_in_buffer:
+            self._current_data_buffer[position:end] = data
+            self._current_data_buffer_position = end
+            return
+
+        # doesn't fit - fill up the current buffer, flush it and continue with the rest in the next ones
+        with memoryview(data) as view:
+            offset = 0
+            while offset < len(view):
+                position = self._current_data_buffer_position
+                count = min(self._max_size_in_buffer - position, len(view) - offset)
+                self._current_data_buffer[position : position + count] = view[offset : offset + count]
+                self._current_data_buffer_position += count
+                offset += count
+                if self._current_data_buffer_position == self._max_size_in_buffer:
+                    self._flush_current_buffer()
 
-            self._current_data_buffer += bytearray(c, encoding="utf-8")
+    def _write_string(self, input_string: str) -> None:
+        # escape in one go using json encoder, dropping the surrounding quotes
+        self._write_bytes(self._conventions.json_codec.dumps_bytes(input_string)[1:-1])
 
     def _write_comma(self) -> None:
-        self._current_data_buffer += bytearray(",", encoding="utf-8")
+        self._write_bytes(b",")
 
     def _write_string_no_escape(self, data: str) -> None:
-        self._current_data_buffer += bytearray(data, encoding="utf-8")
+        self._write_bytes(data.encode("utf-8"))
 
-    def _write_document(self, entity: object, metadata: MetadataAsDictionary):
+    @staticmethod
+    def _write_put_command(
+        write: Callable[[bytes], None],
+        conventions: DocumentConventions,
+        key: str,
+        entity: object,
+        metadata: MetadataAsDictionary,
+    ) -> None:
+        # shared with the asyncio bulk insert, which writes into its own buffer
+        json_codec = conventions.json_codec
+        write(b'{"Id":')
+        write(json_codec.dumps_bytes(key))
+        write(b',"Type":"PUT","Document":')
         document_info = DocumentInfo(metadata_instance=metadata)
-        json_dict = EntityToJsonStatic.convert_entity_to_json(entity, self._conventions, document_info, True)
-        self._current_data_buffer += bytearray(json.dumps(json_dict), encoding="utf-8")
+        json_dict = EntityToJsonStatic.convert_entity_to_json(entity, conventions, document_info, True)
+        write(json_codec.dumps_bytes(json_dict, conventions.json_default_method))
+        write(b"}")
 
     def _ensure_ongoing_operation(self) -> None:
         if self._ongoing_bulk_insert_execute_task is None:
@@ -368,7 +446,11 @@ class BulkInsertOperation:
             bulk_command.use_compression = self.use_compression
 
             def __execute_bulk_insert_raven_command():
-                self._request_executor.execute_command(bulk_command)
+                try:
+                    self._request_executor.execute_command(bulk_command)
+                finally:
+                    # don't let writers wait for a request that won't read anything anymore
+                    self._buffer_exposer.close_consumer()
 
             self._ongoing_bulk_insert_execute_task = self._thread_pool_executor.submit(
                 __execute_bulk_insert_raven_command
@@ -380,7 +462,7 @@ class BulkInsertOperation:
                 if not isinstance(e, concurrent.futures._base.TimeoutError):
                     raise e
 
-            self._current_data_buffer += bytearray("[", encoding="utf-8")
+            self._write_bytes(b"[")
 
         except Exception as e:
             raise RavenException("Unable to open bulk insert stream", e)
@@ -649,7 +731,7 @@ class BulkInsertOperation:
 
                 self.operation._flush_if_needed()
 
-                self.operation._current_data_buffer += bytearray(attachment_bytes)
+                self.operation._write_bytes(attachment_bytes)
 
                 self.operation._flush_if_needed()
 
@@ -697,6 +779,191 @@ class BulkInsertOperation:
 
 
 class BulkInsertOptions:
-    def __init__(self, use_compression: bool = None, skip_overwrite_if_unchanged: bool = None):
+    def __init__(
+        self, use_compression: bool = None, skip_overwrite_if_unchanged: bool = None, max_buffers_in_flight: int = 4
+    ):
+        """
+        @param max_buffers_in_flight: How many filled buffers (1 MB each) may wait for the network
+        before store() blocks
+        """
+        if max_buffers_in_flight < 1:
+            raise ValueError("max_buffers_in_flight must be at least 1")
         self.use_compression = use_compression
         self.skip_overwrite_if_unchanged = skip_overwrite_if_unchanged
+        self.max_buffers_in_flight = max_buffers_in_flight
+
+
+class ParallelBulkInsert:
+    """
+    Spreads documents over several bulk insert operations, each with its own HTTP stream and operation id,
+    optionally pinning the streams to different cluster nodes.
+    """
+
+    # queued instead of a document - operations aren't thread safe, so each stream thread aborts its own
+    _ABORT = object()
+
+    class _Stream:
+        def __init__(self, operation: BulkInsertOperation, max_pending_documents: int):
+            self.operation = operation
+            self.pending: Queue = Queue(max_pending_documents)
+            self.error: Optional[Exception] = None
+            self.abort_error: Optional[Exception] = None
+            self.thread: Optional[Thread] = None
+
+    def __init__(
+        self,
+        store: DocumentStore,
+        database: Optional[str] = None,
+        number_of_streams: int = 4,
+        options: Optional[BulkInsertOptions] = None,
+        spread_across_nodes: bool = False,
+        max_pending_documents: int = 1024,
+    ):
+        if number_of_streams < 1:
+            raise ValueError("number_of_streams must be at least 1")
+
+        database = store.get_effective_database(database)
+        request_executor = store.get_request_executor(database)
+
+        node_tags: List[Optional[str]] = [None]
+        if spread_across_nodes and request_executor.topology_nodes:
+            node_tags = [node.cluster_tag for node in request_executor.topology_nodes]
+
+        self._aborted = False
+        self._closed = False
+        self._next_stream = 0
+        self._generate_entity_id_on_the_client = GenerateEntityIdOnTheClient(
+            request_executor.conventions,
+            lambda entity: request_executor.conventions.generate_document_id(database, entity),
+        )
+        # every stream keeps its request open for the whole insert - on the shared store pool streams could wait
+        # for a worker forever while the running ones starve, so they get a pool of their own
+        self._executor = ThreadPoolExecutor(max_workers=number_of_streams, thread_name_prefix="parallel-bulk-insert")
+        self._streams = [
+            ParallelBulkInsert._Stream(
+                BulkInsertOperation(database, store, options, node_tags[i % len(node_tags)], self._executor),
+                max_pending_documents,
+            )
+            for i in range(number_of_streams)
+        ]
+
+        for stream in self._streams:
+            stream.thread = Thread(target=self._run_stream, args=(stream,), daemon=True)
+            stream.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def number_of_streams(self) -> int:
+        return len(self._streams)
+
+    def _run_stream(self, stream: ParallelBulkInsert._Stream) -> None:
+        finished = False
+        try:
+            with stream.operation as operation:
+                while not finished:
+                    item = stream.pending.get()
+                    if item is None:
+                        finished = True
+                        continue
+
+                    if item is ParallelBulkInsert._ABORT:
+                        finished = True
+                        try:
+                            operation.abort()
+                        except Exception as e:
+                            stream.abort_error = e
+                        continue
+
+                    entity, key, metadata = item
+                    operation.store_as(entity, key, metadata)
+        except Exception as e:
+            stream.error = e
+            # keep draining, so producers don't block on a stream that won't write anymore
+            while not finished:
+                item = stream.pending.get()
+                finished = item is None or item is ParallelBulkInsert._ABORT
+
+    def store(self, entity: object, metadata: Optional[MetadataAsDictionary] = None) -> str:
+        key = (
+            self._get_id(entity)
+            if metadata is None or constants.Documents.Metadata.ID not in metadata
+            else metadata[constants.Documents.Metadata.ID]
+        )
+
+        self.store_as(entity, key, metadata)
+        return key
+
+    def store_as(self, entity: object, key: str, metadata: Optional[MetadataAsDictionary] = None) -> None:
+        if self._closed:
+            raise RuntimeError("Cannot store into a parallel bulk insert that was already closed or aborted")
+
+        self._throw_if_any_stream_failed()
+        BulkInsertOperation._verify_valid_key(key)
+
+        # round robin - documents don't depend on each other, so any stream will do
+        stream = self._streams[self._next_stream]
+        self._next_stream = (self._next_stream + 1) % len(self._streams)
+        stream.pending.put((entity, key, metadata if metadata is not None else MetadataAsDictionary()))
+
+    def _get_id(self, entity: object) -> str:
+        success, key = self._generate_entity_id_on_the_client.try_get_id_from_instance(entity)
+        if success:
+            return key
+
+        key = self._generate_entity_id_on_the_client.generate_document_key_for_storage(entity)
+
+        self._generate_entity_id_on_the_client.try_set_identity(entity, key)
+        return key
+
+    def _throw_if_any_stream_failed(self) -> None:
+        errors = [stream.error for stream in self._streams if stream.error is not None]
+        if errors:
+            raise ParallelBulkInsertAbortedException(
+                f"{len(errors)} of {len(self._streams)} bulk insert streams failed", errors
+            )
+
+    def _finish_streams(self) -> None:
+        for stream in self._streams:
+            stream.pending.put(None)
+
+        for stream in self._streams:
+            stream.thread.join()
+        self._executor.shutdown()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._finish_streams()
+
+        if not self._aborted:
+            self._throw_if_any_stream_failed()
+
+    def abort(self) -> None:
+        if self._closed:
+            return
+
+        self._aborted = True
+        self._closed = True
+        for stream in self._streams:
+            # documents that weren't sent yet are dropped, the stream thread aborts its operation right away
+            try:
+                while True:
+                    stream.pending.get_nowait()
+            except Empty:
+                pass
+            stream.pending.put(ParallelBulkInsert._ABORT)
+
+        for stream in self._streams:
+            stream.thread.join()
+        self._executor.shutdown()
+
+        errors = [stream.abort_error for stream in self._streams if stream.abort_error is not None]
+        if errors:
+            raise ParallelBulkInsertAbortedException("Unable to abort some of the bulk insert streams", errors)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 from abc import abstractmethod
 from enum import Enum
 from typing import Callable, Union, Optional, TYPE_CHECKING, List, Set, Dict
@@ -156,7 +155,7 @@ class SingleNodeBatchCommand(RavenCommand):
                 request.use_stream = True
 
         if len(files) > 1:
-            files["main"] = json.dumps(request.data, default=self.__conventions.json_default_method)
+            files["main"] = self.__conventions.json_codec.dumps(request.data, self.__conventions.json_default_method)
             request.files = files
             request.data = None
 
@@ -199,7 +198,7 @@ class SingleNodeBatchCommand(RavenCommand):
                 "Got None response from the server after doing a batch, something is very wrong."
                 " Probably a garbled response."
             )
-        self.result = Utils.initialize_object(json.loads(response), self._result_class, True)
+        self.result = Utils.initialize_object(self.json_codec.loads(response), self._result_class, True)
 
 
 class ClusterWideBatchCommand(SingleNodeBatchCommand):
@@ -1,4 +1,3 @@
-import json
 from typing import Optional
 
 import requests
@@ -8,9 +7,10 @@ from ravendb.http.raven_command import RavenCommand, VoidRavenCommand
 
 
 class GetNextOperationIdCommand(RavenCommand[int]):
-    def __init__(self):
+    def __init__(self, node_tag: Optional[str] = None):
         super(GetNextOperationIdCommand, self).__init__(int)
         self._node_tag = 0
+        self._selected_node_tag = node_tag
 
     @property
     def node_tag(self):
@@ -23,7 +23,7 @@ class GetNextOperationIdCommand(RavenCommand[int]):
         return requests.Request("GET", f"{node.url}/databases/{node.database}/operations/next-operation-id")
 
     def set_response(self, response: Optional[str], from_cache: bool) -> None:
-        json_node = json.loads(response)
+        json_node = self.json_codec.loads(response)
         self.result = json_node.get("Id", None)
         self._node_tag = json_node.get("NodeTag", None)
 
@@ -54,7 +54,7 @@ class PutDocumentCommand(RavenCommand[PutResult]):
         return request
 
     def set_response(self, response: str, from_cache: bool) -> None:
-        self.result = PutResult.from_json(json.loads(response))
+        self.result = PutResult.from_json(self.json_codec.loads(response))
 
     def is_read_request(self) -> bool:
         return False
@@ -322,7 +322,7 @@ class GetDocumentsCommand(RavenCommand[GetDocumentsResult]):
             return http_post
 
     def set_response(self, response: str, from_cache: bool) -> None:
-        self.result = GetDocumentsResult.from_json(json.loads(response)) if response is not None else None
+        self.result = GetDocumentsResult.from_json(self.json_codec.loads(response)) if response is not None else None
 
     @property
     def is_read_request(self) -> bool:
@@ -362,7 +362,7 @@ class NextHiLoCommand(RavenCommand[HiLoResult]):
         return requests.Request(method="GET", url=url)
 
     def set_response(self, response: str, from_cache: bool) -> None:
-        self.result = HiLoResult.from_json(json.loads(response))
+        self.result = HiLoResult.from_json(self.json_codec.loads(response))
 
 
 class HiLoReturnCommand(VoidRavenCommand):
@@ -465,7 +465,7 @@ class ConditionalGetDocumentsCommand(RavenCommand[ConditionalGetResult]):
             self.result = None
             return
 
-        self.result = ConditionalGetResult.from_json(json.loads(response))
+        self.result = ConditionalGetResult.from_json(self.json_codec.loads(response))
 
     def is_read_request(self) -> bool:
         return False
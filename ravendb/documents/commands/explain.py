@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Dict, Any, TYPE_CHECKING, Optional, List
 
 import requests
@@ -42,7 +41,7 @@ class ExplainQueryCommand(RavenCommand[List[ExplainQueryResult]]):
         if response is None:
             return
 
-        json_node = json.loads(response)
+        json_node = self.json_codec.loads(response)
         results = json_node.get("Results", None)
         if results is None:
             self._throw_invalid_response()
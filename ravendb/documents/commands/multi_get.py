@@ -1,6 +1,5 @@
 import datetime
 import http
-import json
 from abc import abstractmethod
 from typing import Union, List, Optional, Tuple
 
@@ -13,6 +12,7 @@ from ravendb.extensions.http_extensions import HttpExtensions
 from ravendb.http.http_cache import HttpCache, ReleaseCacheItem
 from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
 from ravendb.http.server_node import ServerNode
+from ravendb.json.codec import JsonCodec, DEFAULT_JSON_CODEC
 from ravendb.tools.utils import CaseInsensitiveDict
 
 
@@ -44,7 +44,7 @@ class GetResponse:
     def __init__(self):
         self.headers = CaseInsensitiveDict()
         self.elapsed: Union[None, datetime.timedelta] = None
-        self.result: Union[None, str] = None
+        self.result: Union[None, bytes] = None
         self.status_code: Union[None, int] = None
         self.force_retry: Union[None, bool] = None
 
@@ -64,7 +64,7 @@ class GetResponse:
 class Cached:
     def __init__(self, size: int):
         self.__size = size
-        self.values: Union[None, List[Tuple[ReleaseCacheItem, str]]] = None
+        self.values: Union[None, List[Tuple[ReleaseCacheItem, str]]] = [None] * size
 
     def __enter__(self):
         return self
@@ -114,6 +114,11 @@ class MultiGetCommand(RavenCommand):
 
     def create_request(self, node: ServerNode) -> Optional[requests.Request]:
         self.__base_url = f"{node.url}/databases/{node.database}"
+
+        if self.__maybe_read_all_from_cache(self.__request_executor.aggressive_caching):
+            self.aggressively_cached = True
+            return None  # aggressively cached
+
         url = self.__base_url + "/multi_get"
         request = requests.Request("POST", url)
 
@@ -139,7 +144,7 @@ class MultiGetCommand(RavenCommand):
         track_changes = read_all_from_cache and options.mode == AggressiveCacheMode.TRACK_CHANGES
         for command in self.__commands:
             cache_key = self.__get_cache_key(command)[0]
-            cached_item, change_vector, cached_ref = self.__http_cache.get(cache_key, "", "")
+            cached_item, change_vector, cached_ref = self.__http_cache.get(cache_key)
             cached_item: ReleaseCacheItem
             if cached_item.item is None:
                 try:
@@ -184,14 +189,14 @@ class MultiGetCommand(RavenCommand):
     def set_response_raw(self, response: requests.Response, stream: bytes) -> None:
         try:
             try:
-                response_temp = response.json()
+                response_temp = self.json_codec.loads(stream)
                 if "Results" not in response_temp:
                     self._throw_invalid_response()
 
                 i = 0
                 self.result = []
 
-                for get_response in self.read_responses(response_temp):
+                for get_response in self.read_responses(response_temp, self.json_codec):
                     command = self.__commands[i]
                     self.__maybe_set_cache(get_response, command, i)
 
@@ -231,16 +236,17 @@ class MultiGetCommand(RavenCommand):
         self.__http_cache.set(cache_key, change_vector, result)
 
     @staticmethod
-    def read_responses(response_json: dict) -> List[GetResponse]:
+    def read_responses(response_json: dict, json_codec: JsonCodec = DEFAULT_JSON_CODEC) -> List[GetResponse]:
         responses = []
         for response in response_json["Results"]:
-            responses.append(MultiGetCommand.read_response(response))
+            responses.append(MultiGetCommand.read_response(response, json_codec))
         return responses
 
     @staticmethod
-    def read_response(response_json: dict) -> GetResponse:
+    def read_response(response_json: dict, json_codec: JsonCodec = DEFAULT_JSON_CODEC) -> GetResponse:
         get_response = GetResponse()
-        get_response.result = json.dumps(response_json["Result"])  # todo: perf - redundant dump after response.json()
+        # todo: perf - redundant dump after parsing the whole response
+        get_response.result = json_codec.dumps_bytes(response_json["Result"])
         get_response.headers = CaseInsensitiveDict(response_json["Headers"])
         if response_json["StatusCode"] == -1:
             MultiGetCommand._throw_invalid_response()
@@ -1,4 +1,3 @@
-import json
 from typing import TYPE_CHECKING
 
 import requests
@@ -51,7 +50,7 @@ class QueryCommand(RavenCommand[QueryResult]):
             self.result = None
             return
 
-        self.result = QueryResult.from_json(json.loads(response))
+        self.result = QueryResult.from_json(self.json_codec.loads(response))
         if from_cache:
             self.result.duration_in_ms = -1
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 
@@ -111,7 +110,7 @@ class GetRevisionsCommand(RavenCommand[JsonArrayResult]):
             self.result = None
             return
 
-        self.result = JsonArrayResult.from_json(json.loads(response))
+        self.result = JsonArrayResult.from_json(self.json_codec.loads(response))
 
     def is_read_request(self) -> bool:
         return True
@@ -138,7 +137,7 @@ class GetRevisionsBinEntryCommand(RavenCommand[JsonArrayResult]):
         if response is None:
             self._throw_invalid_response()
 
-        self.result = JsonArrayResult.from_json(json.loads(response))
+        self.result = JsonArrayResult.from_json(self.json_codec.loads(response))
 
     def is_read_request(self) -> bool:
         return True
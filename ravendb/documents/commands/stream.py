@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Optional, Generic, TypeVar, TYPE_CHECKING
+
+import requests
+
+from ravendb.extensions.json_extensions import JsonExtensions
+from ravendb.http.http_cache import HttpCache
+from ravendb.http.misc import ResponseDisposeHandling
+from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
+from ravendb.http.server_node import ServerNode
+from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
+
+if TYPE_CHECKING:
+    from ravendb.documents.conventions import DocumentConventions
+    from ravendb.documents.queries.index_query import IndexQuery
+
+_T = TypeVar("_T")
+
+
+class StreamResultResponse:
+    def __init__(self, response: requests.Response, stream):
+        self.response = response
+        self.stream = stream
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.response.close()
+
+
+class StreamResult(Generic[_T]):
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        change_vector: Optional[str] = None,
+        metadata: Optional[MetadataAsDictionary] = None,
+        document: Optional[_T] = None,
+    ):
+        self.key = key
+        self.change_vector = change_vector
+        self.metadata = metadata
+        self.document = document
+
+
+class _StreamCommandBase(RavenCommand[StreamResultResponse]):
+    def __init__(self):
+        super().__init__(StreamResultResponse)
+        self._response_type = RavenCommandResponseType.RAW
+        self._can_cache = False
+
+    def is_read_request(self) -> bool:
+        return True
+
+    def send(self, session: requests.Session, request: requests.Request) -> requests.Response:
+        # Don't let requests buffer the whole body - the results are consumed incrementally
+        return session.request(
+            request.method,
+            url=request.url,
+            data=request.data,
+            files=request.files,
+            cert=session.cert,
+            headers=request.headers,
+            stream=True,
+        )
+
+    def process_response(self, cache: HttpCache, response: requests.Response, url) -> ResponseDisposeHandling:
+        response.raw.decode_content = True
+        self.result = StreamResultResponse(response, response.raw)
+        return ResponseDisposeHandling.MANUALLY
+
+    def set_response_raw(self, response: requests.Response, stream: bytes) -> None:
+        # 404 - nothing to stream
+        self.result = None
+
+
+class QueryStreamCommand(_StreamCommandBase):
+    def __init__(self, conventions: DocumentConventions, index_query: IndexQuery):
+        super().__init__()
+        if conventions is None:
+            raise ValueError("Conventions cannot be None")
+        if index_query is None:
+            raise ValueError("Query cannot be None")
+
+        self._conventions = conventions
+        self._index_query = index_query
+
+    def create_request(self, node: ServerNode) -> requests.Request:
+        request = requests.Request("POST", f"{node.url}/databases/{node.database}/streams/queries?format=json")
+        request.data = JsonExtensions.write_index_query(self._conventions, self._index_query)
+        return request
+
+
+class StreamCommand(_StreamCommandBase):
+    def __init__(self, url: str):
+        super().__init__()
+        if not url:
+            raise ValueError("Url cannot be None or empty")
+
+        self._url = url
+
+    def create_request(self, node: ServerNode) -> requests.Request:
+        return requests.Request("GET", f"{node.url}/databases/{node.database}/{self._url}")
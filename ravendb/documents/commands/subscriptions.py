@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from datetime import timedelta
 from typing import Dict, Optional, List
 
@@ -46,7 +45,7 @@ class CreateSubscriptionCommand(RavenCommand[CreateSubscriptionResult], RaftComm
         return request
 
     def set_response(self, response: Optional[str], from_cache: bool) -> None:
-        self.result = CreateSubscriptionResult.from_json(json.loads(response))
+        self.result = CreateSubscriptionResult.from_json(self.json_codec.loads(response))
 
     def is_read_request(self) -> bool:
         return False
@@ -119,7 +118,7 @@ class GetTcpInfoForRemoteTaskCommand(RavenCommand[TcpConnectionInfo]):
         if response is None:
             self._throw_invalid_response()
 
-        self.result = TcpConnectionInfo.from_json(json.loads(response))
+        self.result = TcpConnectionInfo.from_json(self.json_codec.loads(response))
 
     @property
     def requested_node(self) -> ServerNode:
@@ -154,7 +153,7 @@ class GetSubscriptionsCommand(RavenCommand[List[SubscriptionState]]):
             self.result = None
             return
 
-        self.result = GetSubscriptionsResult.from_json(json.loads(response)).results
+        self.result = GetSubscriptionsResult.from_json(self.json_codec.loads(response)).results
 
     def is_read_request(self) -> bool:
         return True
@@ -190,7 +189,7 @@ class GetSubscriptionStateCommand(RavenCommand[SubscriptionState]):
         return requests.Request("GET", url)
 
     def set_response(self, response: Optional[str], from_cache: bool) -> None:
-        self.result = SubscriptionState.from_json(json.loads(response))
+        self.result = SubscriptionState.from_json(self.json_codec.loads(response))
 
 
 class DropSubscriptionConnectionCommand(VoidRavenCommand):
@@ -238,7 +237,7 @@ class UpdateSubscriptionCommand(RavenCommand[UpdateSubscriptionResult], RaftComm
         if response is None:
             self._throw_invalid_response()
 
-        self.result = UpdateSubscriptionResult.from_json(json.loads(response))
+        self.result = UpdateSubscriptionResult.from_json(self.json_codec.loads(response))
 
     def is_read_request(self) -> bool:
         return False
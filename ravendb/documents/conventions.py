@@ -10,6 +10,7 @@ from typing import Dict, List, Tuple, Callable, Union, Optional, Generic, Type,
 import inflect
 
 from typing import TypeVar
+from ravendb.json.codec import JsonCodec, DEFAULT_JSON_CODEC
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 from ravendb.primitives import constants
 from ravendb.documents.operations.configuration.definitions import (
@@ -18,6 +19,7 @@ from ravendb.documents.operations.configuration.definitions import (
     ReadBalanceBehavior,
 )
 from ravendb.documents.indexes.definitions import SortOptions
+from ravendb.http.misc import AggressiveCacheMode
 from ravendb.tools.utils import Utils
 
 inflect.def_classical["names"] = False
@@ -52,6 +54,10 @@ class DocumentConventions(object):
         # Flags
         self.disable_topology_updates = False
         self.use_optimistic_concurrency = False
+        self.use_compression = False
+        # identical concurrent reads share a single request, one joining a request already in flight can miss
+        # the caller's own writes that completed after that request was sent
+        self.coalesce_read_requests = False
         self.throw_if_query_page_size_is_not_set = False
         self._send_application_identifier = True
         self._save_enums_as_integers: Optional[bool] = None
@@ -59,6 +65,7 @@ class DocumentConventions(object):
 
         # Configuration
         self.json_default_method = DocumentConventions.json_default
+        self._json_codec: JsonCodec = DEFAULT_JSON_CODEC
         self._original_configuration: Optional[ClientConfiguration] = None
         self._should_ignore_entity_changes: Optional[ShouldIgnoreEntityChanges] = None
 
@@ -88,6 +95,29 @@ class DocumentConventions(object):
         self.wait_for_replication_after_save_changes_timeout = timedelta(seconds=15)
         self.wait_for_non_stale_results_timeout = timedelta(seconds=15)
 
+        # Aggressive cache
+        self.aggressive_cache_duration = timedelta(days=1)
+        self.aggressive_cache_mode = AggressiveCacheMode.TRACK_CHANGES
+
+        # Connection pooling
+        self.http_max_connections_per_node = 10
+        self.http_pool_block_when_exhausted = False
+        self.http_max_idle_connections_per_node: Optional[int] = None
+        self.http_idle_connection_timeout: Optional[timedelta] = None
+        self.http_prewarm_connections_per_node = 0
+
+        # Hedged reads
+        # a read not answered within the chosen node's percentile latency is sent to the next node as well,
+        # the first response wins
+        self.hedge_read_requests = False
+        self.hedge_read_requests_percentile = 95
+        self.hedge_read_requests_min_delay = timedelta(milliseconds=5)
+
+        # Load batching
+        # plain loads by id issued within the window are sent as one request, None disables batching
+        self.load_batch_window: Optional[timedelta] = None
+        self.load_batch_max_size = 256
+
         # Balancing
         self._load_balancer_context_seed: Optional[int] = None
         self._load_balance_behavior: Optional[LoadBalanceBehavior] = LoadBalanceBehavior.NONE
@@ -115,6 +145,15 @@ class DocumentConventions(object):
         self._assert_not_frozen()
         self._find_collection_name = value
 
+    @property
+    def json_codec(self) -> JsonCodec:
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, value: JsonCodec) -> None:
+        self._assert_not_frozen()
+        self._json_codec = value
+
     @property
     def find_python_class(self) -> Callable[[str, Dict], Optional[str]]:
         def __default(key: str, doc: Dict) -> Optional[str]:
@@ -392,12 +431,27 @@ class DocumentConventions(object):
         cloned._find_python_class_name = self.find_python_class_name
 
         cloned.use_optimistic_concurrency = self.use_optimistic_concurrency
+        cloned.use_compression = self.use_compression
+        cloned.coalesce_read_requests = self.coalesce_read_requests
+        cloned._json_codec = self._json_codec
         cloned.throw_if_query_page_size_is_not_set = self.throw_if_query_page_size_is_not_set
         cloned.max_number_of_requests_per_session = self.max_number_of_requests_per_session
 
         cloned._read_balance_behavior = self._read_balance_behavior
         cloned._load_balance_behavior = self._load_balance_behavior
-        self._max_http_cache_size = self._max_http_cache_size
+        cloned._max_http_cache_size = self._max_http_cache_size
+        cloned.aggressive_cache_duration = self.aggressive_cache_duration
+        cloned.aggressive_cache_mode = self.aggressive_cache_mode
+        cloned.http_max_connections_per_node = self.http_max_connections_per_node
+        cloned.http_pool_block_when_exhausted = self.http_pool_block_when_exhausted
+        cloned.http_max_idle_connections_per_node = self.http_max_idle_connections_per_node
+        cloned.http_idle_connection_timeout = self.http_idle_connection_timeout
+        cloned.http_prewarm_connections_per_node = self.http_prewarm_connections_per_node
+        cloned.hedge_read_requests = self.hedge_read_requests
+        cloned.hedge_read_requests_percentile = self.hedge_read_requests_percentile
+        cloned.hedge_read_requests_min_delay = self.hedge_read_requests_min_delay
+        cloned.load_batch_window = self.load_batch_window
+        cloned.load_batch_max_size = self.load_batch_max_size
         return cloned
 
     def get_identity_property_name(self, object_type: Type[Any]) -> Optional[str]:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import http
-import json
 from typing import Optional, TYPE_CHECKING, List
 
 import requests
@@ -145,7 +144,7 @@ class PutAttachmentOperation(IOperation[AttachmentDetails]):
             return request
 
         def set_response(self, response: str, from_cache: bool) -> None:
-            self.result = AttachmentDetails.from_json(json.loads(response))
+            self.result = AttachmentDetails.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return False
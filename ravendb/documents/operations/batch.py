@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Union, List, Dict, TYPE_CHECKING, Optional
 
 from ravendb.primitives import constants
@@ -9,7 +8,7 @@ from ravendb.documents.session.misc import TransactionMode
 from ravendb.documents.session.document_info import DocumentInfo
 from ravendb.exceptions.raven_exceptions import ClientVersionMismatchException
 from ravendb.json.result import BatchCommandResult
-from ravendb.tools.utils import CaseInsensitiveDict
+from ravendb.tools.utils import CaseInsensitiveDict, Utils
 
 if TYPE_CHECKING:
     from ravendb.documents.session.document_session_operations.in_memory_document_session_operations import (
@@ -144,9 +143,13 @@ class BatchOperation:
 
     def _apply_metadata_modifications(self, key: str, document_info: DocumentInfo):
         document_info.metadata_instance = None
-        document_info.metadata = deepcopy(document_info.metadata)
+        document_info.metadata = Utils.copy_json(document_info.metadata)
         document_info.metadata[constants.Documents.Metadata.CHANGE_VECTOR] = document_info.change_vector
-        document_copy = deepcopy(document_info.document)
+        if document_info.is_document_frozen:
+            # a frozen document is parsed with whatever the metadata of the document info is
+            return
+
+        document_copy = Utils.copy_json(document_info.document)
         document_copy[constants.Documents.Metadata.KEY] = document_info.metadata
 
         document_info.document = document_copy
@@ -1,4 +1,3 @@
-import json
 from typing import Optional
 
 import requests
@@ -39,7 +38,7 @@ class CompactDatabaseOperation(ServerOperation[OperationIdResult]):
             return request
 
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
-            self.result = OperationIdResult.from_json(json.loads(response))
+            self.result = OperationIdResult.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return False
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import json
 from typing import Optional, Generic, TypeVar, Dict, TYPE_CHECKING, Type, Collection
 
 import requests
@@ -39,7 +38,7 @@ class CompareExchangeResult(Generic[_T]):
     def parse_from_string(
         cls, object_type: type, response_string: str, conventions: DocumentConventions
     ) -> CompareExchangeResult:
-        response: dict = json.loads(response_string)
+        response: dict = conventions.json_codec.loads(response_string)
 
         index = response.get("Index", None)
         if index is None:
@@ -35,7 +35,7 @@ class GetClientConfigurationOperation(MaintenanceOperation):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 return
-            self.result = GetClientConfigurationOperation.Result.from_json(json.loads(response))
+            self.result = GetClientConfigurationOperation.Result.from_json(self.json_codec.loads(response))
 
     class Result:
         def __init__(self, etag: int, configuration: ClientConfiguration):
@@ -120,4 +120,4 @@ class GetServerWideClientConfigurationOperation(ServerOperation[ClientConfigurat
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 return
-            self.result = ClientConfiguration.from_json(json.loads(response))
+            self.result = ClientConfiguration.from_json(self.json_codec.loads(response))
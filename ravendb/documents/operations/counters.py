@@ -1,6 +1,5 @@
 from __future__ import annotations
 import enum
-import json
 from typing import Optional, List, Dict, TYPE_CHECKING, Union, Tuple
 
 import requests
@@ -178,7 +177,7 @@ class CounterBatchOperation(IOperation[CountersDetail]):
             if response is None:
                 return
 
-            self.result = CountersDetail.from_json(json.loads(response))
+            self.result = CountersDetail.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return False
@@ -267,7 +266,7 @@ class GetCountersOperation(IOperation[CountersDetail]):
             if response is None:
                 return
 
-            self.result = CountersDetail.from_json(json.loads(response))
+            self.result = CountersDetail.from_json(self.json_codec.loads(response))
 
         def _get_ordered_unique_names(self) -> Tuple[List[str], int]:
             unique_names = set(self._counters)
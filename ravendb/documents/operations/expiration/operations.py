@@ -1,5 +1,4 @@
 from __future__ import annotations
-import json
 from typing import Optional, Dict, Any
 
 import requests
@@ -49,4 +48,4 @@ class ConfigureExpirationOperation(MaintenanceOperation[ConfigureExpirationOpera
             if response is None:
                 self._throw_invalid_response()
 
-            self.result = ConfigureExpirationOperationResult.from_json(json.loads(response))
+            self.result = ConfigureExpirationOperationResult.from_json(self.json_codec.loads(response))
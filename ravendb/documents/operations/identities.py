@@ -1,4 +1,3 @@
-import json
 from typing import Optional, Union, TypeVar, Dict
 
 import requests
@@ -43,7 +42,7 @@ class NextIdentityForCommand(RavenCommand, RaftCommand, Broadcast):
         if response is None:
             self._throw_invalid_response()
 
-        json_node = json.loads(response)
+        json_node = self.json_codec.loads(response)
         if "NewIdentityValue" not in json_node:
             self._throw_invalid_response()
 
@@ -93,7 +92,7 @@ class SeedIdentityForCommand(RavenCommand[int], RaftCommand):
         if response is None:
             self._throw_invalid_response()
 
-        json_node = json.loads(response)
+        json_node = self.json_codec.loads(response)
 
         if "NewSeedValue" not in json_node:
             self._throw_invalid_response()
@@ -134,4 +133,4 @@ class GetIdentitiesOperation(MaintenanceOperation[Dict[str, int]]):
             return requests.Request(method="GET", url=url)
 
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
-            self.result = json.loads(response)
+            self.result = self.json_codec.loads(response)
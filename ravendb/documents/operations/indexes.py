@@ -1,5 +1,4 @@
 from __future__ import annotations
-import json
 from typing import List, TYPE_CHECKING, Optional, Tuple
 
 import requests
@@ -67,7 +66,7 @@ class PutIndexesOperation(MaintenanceOperation):
             return request
 
         def set_response(self, response: str, from_cache: bool) -> None:
-            self.result = json.loads(response)  # todo: PutIndexResult instead of dict
+            self.result = self.json_codec.loads(response)  # todo: PutIndexResult instead of dict
             if "Error" in response:
                 raise ErrorResponseException(response["Error"])
 
@@ -99,7 +98,7 @@ class GetIndexNamesOperation(MaintenanceOperation):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 raise ValueError("Invalid response")
-            response = json.loads(response)
+            response = self.json_codec.loads(response)
             if "Error" in response:
                 raise exceptions.ErrorResponseException(response["Error"])
             if "Results" not in response:
@@ -316,7 +315,7 @@ class GetIndexingStatusOperation(MaintenanceOperation[IndexingStatus]):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 raise ValueError("Invalid response")
-            response = json.loads(response)
+            response = self.json_codec.loads(response)
             if "Error" in response:
                 raise exceptions.ErrorResponseException(response["Error"])
             self.result = IndexingStatus.from_json(response)
@@ -353,7 +352,7 @@ class GetIndexStatisticsOperation(MaintenanceOperation["IndexStats"]):
             if response is None:
                 self._throw_invalid_response()
 
-            response = json.loads(response)
+            response = self.json_codec.loads(response)
             results = response["Results"]
 
             if len(results) != 1:
@@ -382,7 +381,7 @@ class GetIndexesStatisticsOperation(
             if response is None:
                 raise ValueError("Invalid response")
 
-            response = json.loads(response)
+            response = self.json_codec.loads(response)
             if "Error" in response:
                 raise exceptions.ErrorResponseException(response["Error"])
             self.result = response["Results"]
@@ -412,7 +411,7 @@ class GetIndexErrorsOperation(MaintenanceOperation[List[IndexErrors]]):
         def set_response(self, response: str, from_cache: bool):
             if response is None:
                 raise ValueError("InvalidResponse")
-            results = json.loads(response)["Results"]
+            results = self.json_codec.loads(response)["Results"]
             self.result = []
             for result in results:
                 self.result.append(IndexErrors.from_json(result))
@@ -444,7 +443,7 @@ class GetIndexesOperation(MaintenanceOperation[List[IndexDefinition]]):
             )
 
         def set_response(self, response: str, from_cache: bool) -> None:
-            response = json.loads(response)["Results"]
+            response = self.json_codec.loads(response)["Results"]
             result = []
             for index in response:
                 result.append(IndexDefinition.from_json(index))
@@ -481,7 +480,7 @@ class GetIndexOperation(MaintenanceOperation[IndexDefinition]):
         def set_response(self, response: str, from_cache: bool) -> None:
             if not response:
                 return
-            self.result = IndexDefinition.from_json(json.loads(response)["Results"][0])
+            self.result = IndexDefinition.from_json(self.json_codec.loads(response)["Results"][0])
 
         def is_read_request(self) -> bool:
             return True
@@ -589,7 +588,7 @@ class GetTermsOperation(MaintenanceOperation[List[str]]):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 raise ValueError("Invalid response")
-            response = json.loads(response)
+            response = self.json_codec.loads(response)
             self.result = response["Terms"]
 
 
@@ -632,7 +631,7 @@ class IndexHasChangedOperation(MaintenanceOperation[bool]):
             if not response:
                 raise ValueError("Response is invalid")
 
-            self.result = json.loads(response)["Changed"]
+            self.result = self.json_codec.loads(response)["Changed"]
 
 
 class ResetIndexOperation(VoidMaintenanceOperation):
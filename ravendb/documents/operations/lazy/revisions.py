@@ -1,5 +1,4 @@
 import datetime
-import json
 from enum import Enum
 from typing import TYPE_CHECKING, Type, TypeVar, List, Optional, Dict
 
@@ -97,7 +96,7 @@ class LazyRevisionOperation(LazyOperation):
     def handle_response(self, response: GetResponse) -> None:
         if response.result is None:
             return
-        response_as_dict = json.loads(response.result)
+        response_as_dict = self._get_revision_operation._session.conventions.json_codec.loads(response.result)
 
         if response_as_dict is None:
             return
@@ -1,5 +1,4 @@
 import datetime
-import json
 from typing import TYPE_CHECKING, Union, Optional
 
 import requests
@@ -40,7 +39,7 @@ class GetOperationStateOperation(MaintenanceOperation):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 return
-            self.result = json.loads(response)
+            self.result = self.json_codec.loads(response)
 
 
 class QueryOperationOptions(object):
@@ -99,7 +98,7 @@ class DeleteByQueryOperation(IOperation[OperationIdResult]):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 self._throw_invalid_response()
-            response = json.loads(response)
+            response = self.json_codec.loads(response)
             self.result = OperationIdResult(response["OperationId"], response["OperationNodeTag"])
 
         def is_read_request(self) -> bool:
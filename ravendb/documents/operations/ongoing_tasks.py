@@ -1,4 +1,3 @@
-import json
 from enum import Enum
 from typing import Optional, TYPE_CHECKING, Union
 
@@ -76,7 +75,7 @@ class ToggleOngoingTaskStateOperation(MaintenanceOperation[ModifyOngoingTaskResu
 
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
             if response is not None:
-                self.result = ModifyOngoingTaskResult.from_json(json.loads(response))
+                self.result = ModifyOngoingTaskResult.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return False
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import datetime
-import json
 from enum import Enum
 from typing import Union, Optional, Dict, Generic, TYPE_CHECKING
 
@@ -200,7 +199,7 @@ class PatchOperation(IOperation[PatchResult]):
             if response is None:
                 return
 
-            self.result = PatchResult.from_json(json.loads(response))
+            self.result = PatchResult.from_json(self.json_codec.loads(response))
 
 
 class PatchByQueryOperation(IOperation[OperationIdResult]):
@@ -248,7 +247,7 @@ class PatchByQueryOperation(IOperation[OperationIdResult]):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 self._throw_invalid_response()
-            response = json.loads(response)
+            response = self.json_codec.loads(response)
             self.result = OperationIdResult(response["OperationId"], response["OperationNodeTag"])
 
         def is_read_request(self) -> bool:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Optional, TYPE_CHECKING, Dict
 import requests
 from ravendb.http.topology import RaftCommand
@@ -58,7 +57,7 @@ class ConfigureRefreshOperation(MaintenanceOperation[ConfigureRefreshOperationRe
             if response is None:
                 self._throw_invalid_response()
 
-            self.result = ConfigureRefreshOperationResult.from_json(json.loads(response))
+            self.result = ConfigureRefreshOperationResult.from_json(self.json_codec.loads(response))
 
         def get_raft_unique_request_id(self) -> str:
             return RaftIdGenerator.new_id()
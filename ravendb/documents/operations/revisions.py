@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 from datetime import timedelta
 from typing import Dict, Any, Generic, TypeVar, List, Optional, Type, TYPE_CHECKING
 
@@ -15,7 +14,6 @@ from ravendb.http.topology import RaftCommand
 from ravendb.documents.session.entity_to_json import EntityToJsonStatic
 from ravendb.documents.conventions import DocumentConventions
 
-
 if TYPE_CHECKING:
     from ravendb.http.http_cache import HttpCache
     from ravendb import DocumentStore, ServerNode
@@ -155,7 +153,7 @@ class GetRevisionsOperation(Generic[_T], IOperation[RevisionsResult[_T]]):
             if response is None:
                 return
 
-            response_dict = json.loads(response)
+            response_dict = self.json_codec.loads(response)
             if "Results" not in response_dict:
                 return
 
@@ -213,7 +211,7 @@ class ConfigureRevisionsOperation(MaintenanceOperation[ConfigureRevisionsOperati
             if response is None:
                 self._throw_invalid_response()
 
-            self.result = ConfigureRevisionsOperationResult.from_json(json.loads(response))
+            self.result = ConfigureRevisionsOperationResult.from_json(self.json_codec.loads(response))
 
         def get_raft_unique_request_id(self) -> str:
             return RaftIdGenerator().new_id()
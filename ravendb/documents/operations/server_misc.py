@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Dict, Any, List, Optional
 
 import requests
@@ -81,7 +80,7 @@ class ToggleDatabasesStateOperation(ServerOperation[DisableDatabaseToggleResult]
             if response is None:
                 self._throw_invalid_response()
 
-            json_node = json.loads(response)
+            json_node = self.json_codec.loads(response)
             status = json_node.get("Status")
 
             if not isinstance(status, list):
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 from typing import Optional, Dict, List, TYPE_CHECKING, Any
 
 import requests
@@ -118,7 +117,7 @@ class GetStatisticsOperation(MaintenanceOperation[DatabaseStatistics]):
             )
 
         def set_response(self, response: str, from_cache: bool) -> None:
-            self.result = DatabaseStatistics.from_json(json.loads(response))
+            self.result = DatabaseStatistics.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return True
@@ -157,7 +156,7 @@ class GetCollectionStatisticsOperation(MaintenanceOperation[CollectionStatistics
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 self._throw_invalid_response()
-            self.result = CollectionStatistics.from_json(json.loads(response))
+            self.result = CollectionStatistics.from_json(self.json_codec.loads(response))
 
 
 class IndexInformation:
@@ -285,7 +284,7 @@ class GetDetailedStatisticsOperation(MaintenanceOperation[DetailedDatabaseStatis
             return requests.Request("GET", url)
 
         def set_response(self, response: str, from_cache: bool) -> None:
-            self.result = DetailedDatabaseStatistics.from_json(json.loads(response))
+            self.result = DetailedDatabaseStatistics.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return True
@@ -360,4 +359,4 @@ class GetDetailedCollectionStatisticsOperation(MaintenanceOperation[DetailedColl
             if not response:
                 self._throw_invalid_response()
 
-            self.result = DetailedCollectionStatistics.from_json(json.loads(response))
+            self.result = DetailedCollectionStatistics.from_json(self.json_codec.loads(response))
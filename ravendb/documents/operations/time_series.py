@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 from typing import Dict, Optional, List, Any, TYPE_CHECKING, Callable, Set
 import requests
 
@@ -225,7 +224,7 @@ class ConfigureTimeSeriesPolicyOperation(MaintenanceOperation[ConfigureTimeSerie
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
             if response is None:
                 self._throw_invalid_response()
-            self.result = ConfigureTimeSeriesOperationResult.from_json(json.loads(response))
+            self.result = ConfigureTimeSeriesOperationResult.from_json(self.json_codec.loads(response))
 
         def get_raft_unique_request_id(self) -> str:
             return RaftIdGenerator.new_id()
@@ -302,7 +301,7 @@ class ConfigureTimeSeriesValueNamesOperation(MaintenanceOperation[ConfigureTimeS
             if not response:
                 self._throw_invalid_response()
 
-            self.result = ConfigureTimeSeriesOperationResult.from_json(json.loads(response))
+            self.result = ConfigureTimeSeriesOperationResult.from_json(self.json_codec.loads(response))
 
         def get_raft_unique_request_id(self) -> str:
             return RaftIdGenerator.new_id()
@@ -344,7 +343,7 @@ class RemoveTimeSeriesPolicyOperation(MaintenanceOperation[ConfigureTimeSeriesOp
             if response is None:
                 self._throw_invalid_response()
 
-            self.result = ConfigureTimeSeriesOperationResult.from_json(json.loads(response))
+            self.result = ConfigureTimeSeriesOperationResult.from_json(self.json_codec.loads(response))
 
         def get_raft_unique_request_id(self) -> str:
             return RaftIdGenerator.new_id()
@@ -544,7 +543,7 @@ class GetTimeSeriesOperation(IOperation[TimeSeriesRangeResult]):
             if response is None:
                 return
 
-            self.result = TimeSeriesRangeResult.from_json(json.loads(response))
+            self.result = TimeSeriesRangeResult.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return True
@@ -655,7 +654,7 @@ class GetMultipleTimeSeriesOperation(IOperation[TimeSeriesDetails]):
             if response is None:
                 return
 
-            self.result = TimeSeriesDetails.from_json(json.loads(response))
+            self.result = TimeSeriesDetails.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return True
@@ -750,7 +749,7 @@ class GetTimeSeriesStatisticsOperation(IOperation[TimeSeriesStatistics]):
             )
 
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
-            self.result = TimeSeriesStatistics.from_json(json.loads(response))
+            self.result = TimeSeriesStatistics.from_json(self.json_codec.loads(response))
 
 
 class ConfigureTimeSeriesOperation(MaintenanceOperation[ConfigureTimeSeriesOperationResult]):
@@ -780,7 +779,7 @@ class ConfigureTimeSeriesOperation(MaintenanceOperation[ConfigureTimeSeriesOpera
             if not response:
                 self._throw_invalid_response()
 
-            self.result = ConfigureTimeSeriesOperationResult.from_json(json.loads(response))
+            self.result = ConfigureTimeSeriesOperationResult.from_json(self.json_codec.loads(response))
 
         def get_raft_unique_request_id(self) -> str:
             return RaftIdGenerator.new_id()
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional, TYPE_CHECKING, Union, List, Dict, Type, TypeVar, Callable
+
+from ravendb.documents.operations.batch import BatchOperation
+from ravendb.documents.queries.misc import Query
+from ravendb.documents.session.loaders.include import IncludeBuilder
+from ravendb.documents.session.operations.load_operation import LoadOperation
+from ravendb.documents.session.query import AbstractDocumentQuery, DocumentQuery, RawDocumentQuery
+
+if TYPE_CHECKING:
+    from ravendb.documents.conventions import DocumentConventions
+    from ravendb.documents.session.document_session import DocumentSession
+    from ravendb.http.async_request_executor import AsyncRequestExecutor
+
+_T = TypeVar("_T")
+
+
+class AsyncDocumentSession:
+    """
+    Session for asyncio applications. Unit of work, identity map and change tracking are provided by the wrapped
+    DocumentSession, while every request goes through the AsyncRequestExecutor without blocking the event loop.
+    Queries are built with query, document_query or raw_query and executed with to_list, first, single or count.
+    """
+
+    def __init__(self, session: DocumentSession, request_executor: AsyncRequestExecutor):
+        self._session = session
+        self._request_executor = request_executor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
+
+    @property
+    def advanced(self) -> DocumentSession._Advanced:
+        # in-memory operations (metadata, change tracking, evict...), its remote calls are blocking
+        return self._session.advanced
+
+    @property
+    def conventions(self) -> DocumentConventions:
+        return self._session.conventions
+
+    @property
+    def request_executor(self) -> AsyncRequestExecutor:
+        return self._request_executor
+
+    async def load(
+        self,
+        key_or_keys: Union[List[str], str],
+        object_type: Optional[Type[_T]] = None,
+        includes: Callable[[IncludeBuilder], None] = None,
+    ) -> Union[Dict[str, _T], _T]:
+        if key_or_keys is None:
+            return None
+
+        load_operation = LoadOperation(self._session)
+        load_operation.by_keys([key_or_keys] if isinstance(key_or_keys, str) else key_or_keys)
+
+        if includes is not None:
+            include_builder = IncludeBuilder(self.conventions)
+            includes(include_builder)
+
+            load_operation.with_includes(include_builder.documents_to_include or None)
+            if include_builder.is_all_counters:
+                load_operation.with_all_counters()
+            else:
+                load_operation.with_counters(include_builder.counters_to_include or None)
+            load_operation.with_time_series(include_builder.time_series_to_include)
+            load_operation.with_compare_exchange(include_builder.compare_exchange_values_to_include)
+
+        command = load_operation.create_request()
+        if command is not None:
+            await self._request_executor.execute_command(command, self._session.session_info)
+            load_operation.set_result(command.result)
+
+        result = load_operation.get_documents(object_type)
+        if includes is not None:
+            return result.popitem()[1] if len(result) == 1 else result
+        return result.popitem()[1] if len(result) == 1 else result if result else None
+
+    async def store(self, entity: object, key: Optional[str] = None, change_vector: Optional[str] = None) -> None:
+        if key is None and not self._session._generate_entity_id_on_client.try_get_id_from_instance(entity)[0]:
+            # generating the id may need a new HiLo range from the server
+            await asyncio.get_running_loop().run_in_executor(None, self._session.store, entity, key, change_vector)
+            return
+
+        self._session.store(entity, key, change_vector)
+
+    def delete(self, key_or_entity: Union[str, object], expected_change_vector: Optional[str] = None) -> None:
+        self._session.delete(key_or_entity, expected_change_vector)
+
+    def has_changes(self) -> bool:
+        return self._session.has_changes()
+
+    async def save_changes(self) -> None:
+        save_changes_operation = BatchOperation(self._session)
+        command = save_changes_operation.create_request()
+        if command is None:
+            return
+
+        with command:
+            if self._session.no_tracking:
+                raise RuntimeError("Cannot execute save_changes when entity tracking is disabled.")
+
+            await self._request_executor.execute_command(command, self._session.session_info)
+            self._session.update_session_after_save_changes(command.result)
+            save_changes_operation.set_result(command.result)
+
+    def query(self, source: Optional[Query] = None, object_type: Optional[Type[_T]] = None) -> DocumentQuery[_T]:
+        return self._session.query(source, object_type)
+
+    def query_collection(self, collection_name: str, object_type: Optional[Type[_T]] = None) -> DocumentQuery[_T]:
+        return self._session.query_collection(collection_name, object_type)
+
+    def query_index(self, index_name: str, object_type: Optional[Type[_T]] = None) -> DocumentQuery[_T]:
+        return self._session.query_index(index_name, object_type)
+
+    def document_query(
+        self,
+        index_name: Optional[str] = None,
+        collection_name: Optional[str] = None,
+        object_type: Optional[Type[_T]] = None,
+        is_map_reduce: bool = False,
+    ) -> DocumentQuery[_T]:
+        return self._session.document_query(index_name, collection_name, object_type, is_map_reduce)
+
+    def raw_query(self, query: str, object_type: Optional[Type[_T]] = None) -> RawDocumentQuery[_T]:
+        return self._session.advanced.raw_query(query, object_type)
+
+    async def to_list(self, query: AbstractDocumentQuery[_T]) -> List[_T]:
+        await self.__execute_query(query)
+        return query.query_operation.complete(query.query_class)
+
+    async def first(self, query: AbstractDocumentQuery[_T]) -> Optional[_T]:
+        query._take(1)
+        result = await self.to_list(query)
+        return result[0] if result else None
+
+    async def single(self, query: AbstractDocumentQuery[_T]) -> _T:
+        query._take(2)
+        result = await self.to_list(query)
+        if len(result) != 1:
+            raise ValueError(f"Expected single result, got: {len(result)} ")
+        return result[0]
+
+    async def count(self, query: AbstractDocumentQuery[_T]) -> int:
+        query._take(0)
+        await self.__execute_query(query)
+        return query.query_operation.current_query_results.total_results
+
+    async def __execute_query(self, query: AbstractDocumentQuery[_T]) -> None:
+        if query.query_operation is not None:
+            return  # already executed
+
+        query_operation = query.initialize_query_operation()
+        query_operation.enter_query_context()
+        command = query_operation.create_request()
+        await self._request_executor.execute_command(command, self._session.session_info)
+        query_operation.set_result(command.result)
+
+        query._query_operation = query_operation
+        query.invoke_after_query_executed(query_operation.current_query_results)
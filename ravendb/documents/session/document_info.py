@@ -1,12 +1,31 @@
 from __future__ import annotations
-from typing import Any, Dict
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from ravendb.primitives import constants
 from ravendb.documents.session.concurrency_check_mode import ConcurrencyCheckMode
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 
+if TYPE_CHECKING:
+    from ravendb.json.codec import JsonCodec
+
 
 class DocumentInfo:
+    # sessions keep one per tracked document
+    __slots__ = (
+        "key",
+        "change_vector",
+        "concurrency_check_mode",
+        "ignore_changes",
+        "metadata",
+        "_document",
+        "_document_snapshot",
+        "_json_codec",
+        "metadata_instance",
+        "entity",
+        "new_document",
+        "collection",
+    )
+
     def __init__(
         self,
         key: str = None,
@@ -25,12 +44,62 @@ class DocumentInfo:
         self.concurrency_check_mode = concurrency_check_mode
         self.ignore_changes = ignore_changes
         self.metadata = metadata
-        self.document = document
+        self._document = document
+        self._document_snapshot: Optional[bytes] = None
+        self._json_codec: Optional[JsonCodec] = None
         self.metadata_instance = metadata_instance
         self.entity = entity
         self.new_document = new_document
         self.collection = collection
 
+    @property
+    def document(self) -> Optional[dict]:
+        """
+        The document as it was loaded. A frozen document is parsed again on every access,
+        its @metadata is the (live) metadata of this document info.
+        """
+        if self._document_snapshot is not None:
+            document = self._json_codec.loads(self._document_snapshot)
+            document[constants.Documents.Metadata.KEY] = self.metadata
+            return document
+        return self._document
+
+    @document.setter
+    def document(self, value: Optional[dict]) -> None:
+        self._document = value
+        self._document_snapshot = None
+        self._json_codec = None
+
+    @property
+    def has_document(self) -> bool:
+        return self._document is not None or self._document_snapshot is not None
+
+    @property
+    def is_document_frozen(self) -> bool:
+        return self._document_snapshot is not None
+
+    def freeze_document(self, json_codec: JsonCodec) -> bool:
+        """
+        Keeps the document serialized (without @metadata, which stays shared with the metadata field), so the parsed
+        document can be handed over to the entity. Returns False for documents that can't be frozen.
+        """
+        document = self._document
+        if (
+            document is None
+            or self.metadata is None
+            or document.get(constants.Documents.Metadata.KEY) is not self.metadata
+        ):
+            return False
+
+        body = {key: value for key, value in document.items() if key != constants.Documents.Metadata.KEY}
+        try:
+            self._document_snapshot = json_codec.dumps_bytes(body)
+        except (TypeError, ValueError):
+            return False
+        self._json_codec = json_codec
+        self._document = None
+        return True
+
     @classmethod
     def get_new_document_info(cls, document: Dict) -> DocumentInfo:
         metadata = document.get(constants.Documents.Metadata.KEY)
@@ -6,9 +6,25 @@ from datetime import datetime
 import http
 import json
 import os
+import shutil
 import time
 import uuid
-from typing import Union, Callable, TYPE_CHECKING, Optional, Dict, List, Type, TypeVar, Tuple, Generic, Set
+from typing import (
+    Union,
+    Callable,
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    List,
+    Type,
+    TypeVar,
+    Tuple,
+    Generic,
+    Set,
+    Iterator,
+    Any,
+    BinaryIO,
+)
 
 from ravendb.documents.session.document_session_revisions import DocumentSessionRevisions
 from ravendb.primitives import constants
@@ -57,7 +73,13 @@ from ravendb.documents.session.document_session_operations.in_memory_document_se
 from ravendb.documents.session.loaders.include import IncludeBuilder
 from ravendb.documents.session.loaders.loaders import LoaderWithInclude, MultiLoaderWithInclude
 from ravendb.documents.session.operations.lazy import LazyLoadOperation, LazySessionOperations
-from ravendb.documents.session.operations.operations import MultiGetOperation, LoadStartingWithOperation
+from ravendb.documents.session.operations.operations import (
+    MultiGetOperation,
+    LoadStartingWithOperation,
+    StreamOperation,
+)
+from ravendb.documents.session.operations.query import QueryOperation
+from ravendb.documents.session.tokens.query_tokens.definitions import FieldsToFetchToken
 from ravendb.documents.session.misc import (
     SessionOptions,
     ResponseTimeInformation,
@@ -67,7 +89,12 @@ from ravendb.documents.session.misc import (
     SessionInfo,
     TransactionMode,
 )
-from ravendb.documents.session.query import DocumentQuery, RawDocumentQuery
+from ravendb.documents.session.query import (
+    AbstractDocumentQuery,
+    DocumentQuery,
+    RawDocumentQuery,
+    StreamQueryStatistics,
+)
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 from ravendb.documents.session.operations.load_operation import LoadOperation
 from ravendb.tools.time_series import TSRangeHelper
@@ -93,6 +120,7 @@ from ravendb.documents.commands.crud import (
     ConditionalGetDocumentsCommand,
 )
 from ravendb.documents.commands.multi_get import GetRequest
+from ravendb.documents.commands.stream import StreamResult
 
 from ravendb.documents.store.lazy import Lazy
 from ravendb.documents.store.misc import IdTypeAndName
@@ -226,7 +254,8 @@ class DocumentSession(InMemoryDocumentSessionOperations):
 
                 if response.request_has_errors:
                     raise RuntimeError(
-                        f"Got an error from server, status code: {response.status_code}{os.linesep}{response.result}"
+                        f"Got an error from server, status code: {response.status_code}{os.linesep}"
+                        f"{response.result.decode('utf-8') if response.result else response.result}"
                     )
 
                 self._pending_lazy_operations[i].handle_response(response)
@@ -353,12 +382,12 @@ class DocumentSession(InMemoryDocumentSessionOperations):
         command = operation.create_request()
 
         if command:
-            self._request_executor.execute_command(command, self.session_info)
+            self._document_store.load_batcher.execute(self._request_executor, command, self.session_info)
 
             if stream:
                 try:
                     result = command.result
-                    stream_to_dict = json.loads(stream.decode("utf-8"))
+                    stream_to_dict = self.conventions.json_codec.loads(stream)
                     result.__dict__.update(stream_to_dict)
                 except IOError as e:
                     raise RuntimeError(f"Unable to serialize returned value into stream {e.args[0]}", e)
@@ -743,6 +772,9 @@ class DocumentSession(InMemoryDocumentSessionOperations):
         def ignore_changes_for(self, entity: object) -> None:
             self._session.ignore_changes_for(entity)
 
+        def mark_as_changed(self, entity: object) -> None:
+            self._session.mark_as_changed(entity)
+
         def has_changes(self) -> bool:
             return self._session.has_changes()
 
@@ -1032,24 +1064,76 @@ class DocumentSession(InMemoryDocumentSessionOperations):
 
         def stream(
             self,
-            query_or_raw_query,  # : Union[RawDocumentQuery, DocumentQuery],
-            stream_query_stats,  # : Optional[StreamQueryStatistics] = None,
-        ) -> iter:
-            pass
+            query_or_raw_query: Union[RawDocumentQuery[_T], DocumentQuery[_T]],
+            stream_query_stats: Optional[Callable[[StreamQueryStatistics], None]] = None,
+        ) -> Iterator[StreamResult[_T]]:
+            stats = StreamQueryStatistics()
+            stream_operation = StreamOperation(self._session, stats)
+            command = stream_operation.create_request(query_or_raw_query.index_query)
+
+            self.request_executor.execute_command(command, self._session.session_info)
+            results = stream_operation.set_result(command.result)
+
+            if stream_query_stats is not None:
+                stream_query_stats(stats)
+
+            return self.__yield_results(query_or_raw_query, results)
+
+        def __yield_results(
+            self, query: AbstractDocumentQuery[_T], results: Iterator[Dict[str, Any]]
+        ) -> Iterator[StreamResult[_T]]:
+            for json_dict in results:
+                query.invoke_after_stream_executed(json_dict)
+                yield self.__create_stream_result(
+                    query.query_class, json_dict, query._fields_to_fetch_token, query.is_project_into
+                )
 
         def stream_starting_with(
             self,
-            object_type: type,
+            object_type: Type[_T],
             starts_with: str,
-            matches: str = None,
+            matches: Optional[str] = None,
             start: int = 0,
-            page_size: int = 25,
-            starting_after: str = None,
-        ) -> iter:
-            pass
+            page_size: int = 0x7FFFFFFF,
+            starting_after: Optional[str] = None,
+        ) -> Iterator[StreamResult[_T]]:
+            stream_operation = StreamOperation(self._session)
+            command = stream_operation.create_request_starting_with(
+                starts_with, matches, start, page_size, None, starting_after
+            )
+
+            self.request_executor.execute_command(command, self._session.session_info)
+            results = stream_operation.set_result(command.result)
+
+            return (self.__create_stream_result(object_type, json_dict, None, False) for json_dict in results)
 
-        def stream_into(self):  # query: Union[DocumentQuery, RawDocumentQuery], output: iter):
-            pass
+        def stream_into(self, query: Union[DocumentQuery, RawDocumentQuery], output: BinaryIO) -> None:
+            stream_operation = StreamOperation(self._session)
+            command = stream_operation.create_request(query.index_query)
+
+            self.request_executor.execute_command(command, self._session.session_info)
+            if command.result is None:
+                return
+
+            with command.result:
+                shutil.copyfileobj(command.result.stream, output)
+
+        def __create_stream_result(
+            self,
+            object_type: Type[_T],
+            json_dict: Dict[str, Any],
+            fields_to_fetch: Optional[FieldsToFetchToken],
+            is_project_into: bool,
+        ) -> StreamResult[_T]:
+            metadata = json_dict.get(constants.Documents.Metadata.KEY)
+            change_vector = metadata.get(constants.Documents.Metadata.CHANGE_VECTOR)
+            # MapReduce indexes return reduce results that don't have @id property
+            key = metadata.get(constants.Documents.Metadata.ID)
+
+            entity = QueryOperation.deserialize(
+                object_type, key, json_dict, metadata, fields_to_fetch, True, self._session, is_project_into
+            )
+            return StreamResult(key, change_vector, MetadataAsDictionary(metadata), entity)
 
         def conditional_load(
             self, key: str, change_vector: str, object_type: Type[_T] = None
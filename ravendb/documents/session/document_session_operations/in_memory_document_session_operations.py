@@ -4,6 +4,7 @@ import datetime
 import itertools
 import json
 from abc import abstractmethod
+from contextlib import contextmanager
 
 from ravendb.documents.operations.executor import OperationExecutor
 from ravendb.documents.session.document_session_operations.misc import _update_metadata_modifications
@@ -24,7 +25,7 @@ except Exception:
 
 import uuid as uuid
 from copy import deepcopy, Error
-from typing import Union, Callable, List, Dict, Set, Type, TypeVar, Tuple, Any
+from typing import Union, Callable, List, Dict, Set, Type, TypeVar, Tuple, Any, Optional
 
 from ravendb.primitives import constants
 from ravendb.documents.commands.crud import GetDocumentsResult
@@ -53,7 +54,8 @@ from ravendb.http.raven_command import RavenCommand
 from ravendb.json.json_operation import JsonOperation
 from ravendb.json.result import BatchCommandResult
 from ravendb.documents.session.entity_to_json import EntityToJson
-from ravendb.tools.utils import Utils, CaseInsensitiveDict, CaseInsensitiveSet
+from ravendb.documents.session.entity_write_tracker import EntityWriteTracker
+from ravendb.tools.utils import Utils, CaseInsensitiveDict, CaseInsensitiveMap, CaseInsensitiveKeySet
 from ravendb.documents.store.misc import IdTypeAndName
 
 if TYPE_CHECKING:
@@ -71,7 +73,7 @@ class RefEq:
             return
         self.ref = ref
 
-    # As we split the hashable and unhashable items into separate collections, we only compare _RefEq to other _RefEq
+    # only compared to other RefEq, wrapped objects are never compared by their own __eq__
     def __eq__(self, other):
         if isinstance(other, RefEq):
             return id(self.ref) == id(other.ref)
@@ -81,231 +83,103 @@ class RefEq:
         return id(self.ref)
 
 
-class RefEqEntityHolder(object):
-    def __init__(self):
-        self.__unhashable_items = dict()
-
-    def __len__(self):
-        return len(self.__unhashable_items)
-
-    def __contains__(self, item):
-        return RefEq(item) in self.__unhashable_items
-
-    def __delitem__(self, key):
-        del self.__unhashable_items[RefEq(key)]
-
-    def __setitem__(self, key, value):
-        self.__unhashable_items[RefEq(key)] = value
-
-    def __getitem__(self, key):
-        return self.__unhashable_items[RefEq(key)].ref
-
-    def __getattribute__(self, item):
-        if item == "_RefEqEntityHolder__unhashable_items":
-            return super().__getattribute__(item)
-        return self.__unhashable_items.__getattribute__(item)
-
-
-class DocumentsByIdHolder(object):
-    def __init__(self):
-        self.__inner = CaseInsensitiveDict()
-
-    def __len__(self):
-        return len(self.__inner)
-
-    def __iter__(self):
-        return self.__inner.__iter__()
-
-    def __delitem__(self, key):
-        del self.__inner[key]
-
-    def __setitem__(self, key, value):
-        self.__inner[key] = value
-
-    def __getattribute__(self, item):
-        if item in ["_DocumentsByIdHolder__inner", "get_value", "add", "remove", "clear"]:
-            return super().__getattribute__(item)
-        return self.__inner.__getattribute__(item)
+class DocumentsByIdHolder(CaseInsensitiveMap[str, DocumentInfo]):
+    __slots__ = ()
 
     def get_value(self, key: str) -> DocumentInfo:
-        return self.__inner.get(key)
+        return self.get(key)
 
     def add(self, info: DocumentInfo) -> None:
-        if info.key in self.__inner:
-            return
-
-        self.__inner[info.key] = info
+        self.setdefault(info.key, info)
 
     def remove(self, key: str) -> bool:
-        return self.__inner.pop(key, None) is not None
-
-    def clear(self) -> None:
-        self.__inner.clear()
+        return self.pop(key, None) is not None
 
 
 class DocumentsByEntityHolder(object):
-    def __init__(self):
-        self.__documents_by_entity_hashable: Dict[object, DocumentInfo] = dict()
-        self.__documents_by_entity_unhashable: RefEqEntityHolder[RefEq, DocumentInfo] = RefEqEntityHolder()
-        self.__on_before_store_documents_by_entity_hashable: Dict[object, DocumentInfo] = dict()
-        self.__on_before_store_documents_by_entity_unhashable: RefEqEntityHolder[RefEq, DocumentInfo] = (
-            RefEqEntityHolder()
-        )
+    """
+    Identity map of the session. Entities are keyed by id() - never by their own __eq__ or __hash__,
+    so equal (or unhashable) entities are still tracked separately. Every entry keeps a reference to its entity,
+    which means the id can't be taken over by another object while the entity is tracked.
+    """
+
+    def __init__(self, write_tracker: Optional[EntityWriteTracker] = None):
+        self.__write_tracker = write_tracker
+        self.__documents_by_entity: Dict[int, Tuple[object, DocumentInfo]] = {}
+        self.__on_before_store_documents_by_entity: Dict[int, Tuple[object, DocumentInfo]] = {}
         self.__prepare_entities_puts: bool = False
 
     def __repr__(self):
         return f"{self.__class__.__name__}: {[item for item in self]}"
 
     def __len__(self):
-        return (
-            len(self.__documents_by_entity_hashable)
-            + len(self.__documents_by_entity_unhashable)
-            + (
-                len(self.__on_before_store_documents_by_entity_hashable)
-                if self.__on_before_store_documents_by_entity_hashable
-                else 0
-            )
-            + (
-                len(self.__on_before_store_documents_by_entity_unhashable)
-                if self.__on_before_store_documents_by_entity_unhashable
-                else 0
-            )
-        )
+        return len(self.__documents_by_entity) + len(self.__on_before_store_documents_by_entity)
 
     def __contains__(self, item):
-        if not self.__prepare_entities_puts:
-            try:
-                return item in self.__documents_by_entity_hashable
-            except TypeError as e:
-                if str(e.args[0]).startswith("unhashable type"):
-                    return item in self.__documents_by_entity_unhashable
-                raise e
-        self.__create_on_before_store_documents_by_entity_if_needed()
-        try:
-            return item in self.__on_before_store_documents_by_entity_hashable
-        except TypeError as e:
-            if str(e.args[0]).startswith("unhashable type"):
-                return item in self.__documents_by_entity_unhashable
-            raise e
+        return id(item) in self.__documents_by_entity or id(item) in self.__on_before_store_documents_by_entity
 
     def __setitem__(self, key, value):
-        if not self.__prepare_entities_puts:
-            try:
-                self.__documents_by_entity_hashable[key] = value
-            except TypeError as e:
-                if str(e.args[0]).startswith("unhashable type"):
-                    self.__documents_by_entity_unhashable[key] = value
-                    return
-                raise e
+        if self.__write_tracker is not None:
+            self.__write_tracker.watch(key)
+        if self.__prepare_entities_puts and id(key) not in self.__documents_by_entity:
+            # on_before_store can store new entities while the tracked ones are being iterated
+            self.__on_before_store_documents_by_entity[id(key)] = (key, value)
             return
-        self.__create_on_before_store_documents_by_entity_if_needed()
-        try:
-            self.__on_before_store_documents_by_entity_hashable[key] = value
-        except TypeError as e:
-            if str(e.args[0]).startswith("unhashable type"):
-                self.__on_before_store_documents_by_entity_unhashable[key] = value
-                return
-            raise e
-
-    def __create_on_before_store_documents_by_entity_if_needed(self) -> None:
-        if not self.__on_before_store_documents_by_entity_unhashable:
-            self.__on_before_store_documents_by_entity_unhashable = RefEqEntityHolder()
-        if not self.__on_before_store_documents_by_entity_hashable:
-            self.__on_before_store_documents_by_entity_hashable = dict()
-        return
+        self.__documents_by_entity[id(key)] = (key, value)
 
     def __getitem__(self, key):
-        try:
-            document_info = self.__documents_by_entity_hashable[key]
-        except (TypeError, KeyError):
-            document_info = self.__documents_by_entity_unhashable.get(RefEq(key), None)
-        if document_info:
-            return document_info
-        if self.__on_before_store_documents_by_entity_hashable:
-            document_info = self.__on_before_store_documents_by_entity_hashable.get(key, None)
-        if not document_info and self.__documents_by_entity_unhashable:
-            return self.__on_before_store_documents_by_entity_unhashable.get(RefEq(key), None)
-        return None
+        return self.get(key)
 
     def __iter__(self):
-        first_hashable = (
-            (
-                self.DocumentsByEntityEnumeratorResult(key, value, True)
-                for key, value in self.__documents_by_entity_hashable.items()
-            )
-            if len(self.__documents_by_entity_hashable) > 0
-            else None
-        )
+        for entity, document_info in self.__documents_by_entity.values():
+            yield self.DocumentsByEntityEnumeratorResult(entity, document_info, True)
 
-        first_unhashable = (
-            (
-                self.DocumentsByEntityEnumeratorResult(key, value, True)
-                for key, value in self.__documents_by_entity_unhashable.items()
-            )
-            if len(self.__documents_by_entity_unhashable) > 0
-            else None
-        )
-
-        second_hashable = (
-            (
-                self.DocumentsByEntityEnumeratorResult(key, value, False)
-                for key, value in self.__on_before_store_documents_by_entity_hashable.items()
-            )
-            if len(self.__on_before_store_documents_by_entity_hashable) > 0
-            else None
-        )
-        second_unhashable = (
-            (
-                self.DocumentsByEntityEnumeratorResult(key, value, False)
-                for key, value in self.__on_before_store_documents_by_entity_unhashable.items()
-            )
-            if len(self.__on_before_store_documents_by_entity_unhashable) > 0
-            else None
-        )
-
-        return itertools.chain(
-            *[x for x in [first_hashable, first_unhashable, second_hashable, second_unhashable] if x]
-        )
+        # entities stored by on_before_store are taken once the tracked ones are done
+        for entity, document_info in list(self.__on_before_store_documents_by_entity.values()):
+            yield self.DocumentsByEntityEnumeratorResult(entity, document_info, False)
 
     def get(self, key, default=None):
-        return self[key] if key in self else default
+        entry = self.__documents_by_entity.get(id(key))
+        if entry is None:
+            entry = self.__on_before_store_documents_by_entity.get(id(key))
+        return entry[1] if entry is not None else default
 
     def pop(self, key, default_value=None):
-        result = self.__documents_by_entity_hashable.pop(key, None)
-        if not result:
-            result = self.__documents_by_entity_unhashable.pop(RefEq(key), default_value)
+        entry = self.__documents_by_entity.pop(id(key), None)
+        on_before_store_entry = self.__on_before_store_documents_by_entity.pop(id(key), None)
+        if entry is None:
+            entry = on_before_store_entry
+        if entry is None:
+            return default_value
 
-        if self.__on_before_store_documents_by_entity_unhashable:
-            if not result:
-                result = self.__on_before_store_documents_by_entity_unhashable.pop(RefEq(key), None)
-            else:
-                del self.__on_before_store_documents_by_entity_unhashable[RefEq(key)]
-        if self.__on_before_store_documents_by_entity_hashable:
-            if not result:
-                result = self.__on_before_store_documents_by_entity_hashable.pop(key, None)
-            else:
-                del self.__on_before_store_documents_by_entity_hashable
-
-        return result
+        if self.__write_tracker is not None:
+            self.__write_tracker.unwatch(key)
+        return entry[1]
 
     def evict(self, entity: object) -> None:
         if self.__prepare_entities_puts:
             raise RuntimeError("Cannot evict entity during on_before_store")
-        result = self.__documents_by_entity_unhashable.pop(RefEq(entity), None)
-        if result is None:
-            self.__documents_by_entity_hashable.pop(entity, None)
+        self.__documents_by_entity.pop(id(entity), None)
+        if self.__write_tracker is not None:
+            self.__write_tracker.unwatch(entity)
 
     def clear(self):
-        self.__documents_by_entity_hashable.clear()
-        self.__documents_by_entity_unhashable.clear()
-        if self.__on_before_store_documents_by_entity_hashable:
-            self.__on_before_store_documents_by_entity_hashable.clear()
-        if self.__on_before_store_documents_by_entity_unhashable:
-            self.__on_before_store_documents_by_entity_unhashable.clear()
+        self.__documents_by_entity.clear()
+        self.__on_before_store_documents_by_entity.clear()
+        if self.__write_tracker is not None:
+            self.__write_tracker.clear()
+
+    @contextmanager
+    def prepare_entities_puts(self):
+        self.__prepare_entities_puts = True
+        try:
+            yield
+        finally:
+            self.__prepare_entities_puts = False
 
     class DocumentsByEntityEnumeratorResult:
         def __init__(self, key: object, value: DocumentInfo, execute_on_before_store: bool):
-            self.__key = key.ref if isinstance(key, RefEq) else key
+            self.__key = key
             self.__value = value
             self.__execute_on_before_store = execute_on_before_store
 
@@ -454,17 +328,20 @@ class InMemoryDocumentSessionOperations:
             options.disable_atomic_document_writes_in_cluster_wide_transaction
         )
 
-        self._known_missing_ids = CaseInsensitiveSet()
+        self._known_missing_ids = CaseInsensitiveKeySet()
         self._documents_by_id = DocumentsByIdHolder()
-        self._included_documents_by_id = CaseInsensitiveDict()
+        self._included_documents_by_id = CaseInsensitiveMap()
         self.include_revisions_by_change_vector = CaseInsensitiveDict()
         self.include_revisions_by_date_time_before: Optional[Dict[str, Dict[datetime.datetime, DocumentInfo]]] = (
             CaseInsensitiveDict()
         )
-        self._documents_by_entity: DocumentsByEntityHolder = DocumentsByEntityHolder()
+        self._write_tracker: Optional[EntityWriteTracker] = (
+            EntityWriteTracker() if options.incremental_change_tracking else None
+        )
+        self._documents_by_entity: DocumentsByEntityHolder = DocumentsByEntityHolder(self._write_tracker)
 
-        self._counters_by_doc_id: Dict[str, List[Dict[str, int]]] = CaseInsensitiveDict()
-        self._time_series_by_doc_id: Dict[str, Dict[str, List[TimeSeriesRangeResult]]] = CaseInsensitiveDict()
+        self._counters_by_doc_id: Dict[str, List[Dict[str, int]]] = CaseInsensitiveMap()
+        self._time_series_by_doc_id: Dict[str, Dict[str, List[TimeSeriesRangeResult]]] = CaseInsensitiveMap()
 
         self._deleted_entities: Union[
             Set[DeletedEntitiesHolder.DeletedEntitiesEnumeratorResult], DeletedEntitiesHolder
@@ -634,7 +511,7 @@ class InMemoryDocumentSessionOperations:
     @property
     def counters_by_doc_id(self):
         if self._counters_by_doc_id is None:
-            self._counters_by_doc_id = CaseInsensitiveDict()
+            self._counters_by_doc_id = CaseInsensitiveMap()
         return self._counters_by_doc_id
 
     @property
@@ -701,7 +578,7 @@ class InMemoryDocumentSessionOperations:
         document_info = self._documents_by_id.get(key)
         return (
             document_info is not None
-            and (document_info.document is not None or document_info.entity is not None)
+            and (document_info.has_document or document_info.entity is not None)
             or self.is_deleted(key)
             or key in self._included_documents_by_id
         )
@@ -779,7 +656,7 @@ class InMemoryDocumentSessionOperations:
         doc_info = self._documents_by_id.get(key)
         if doc_info is not None:
             if doc_info.entity is None:
-                doc_info.entity = self.entity_to_json.convert_to_entity(entity_type, key, document, not no_tracking)
+                doc_info.entity = self.__convert_to_tracked_entity(entity_type, doc_info, document, no_tracking)
 
             if not no_tracking:
                 self._included_documents_by_id.pop(key, None)
@@ -790,7 +667,7 @@ class InMemoryDocumentSessionOperations:
         doc_info = self._included_documents_by_id.get(key)
         if doc_info:
             if doc_info.entity is None:
-                doc_info.entity = self.entity_to_json.convert_to_entity(entity_type, key, document, not no_tracking)
+                doc_info.entity = self.__convert_to_tracked_entity(entity_type, doc_info, document, no_tracking)
 
             if not no_tracking:
                 self._included_documents_by_id.pop(key, None)
@@ -799,20 +676,29 @@ class InMemoryDocumentSessionOperations:
 
             return doc_info.entity
 
-        entity = self.entity_to_json.convert_to_entity(entity_type, key, document, not no_tracking)
-
         change_vector = metadata.get(constants.Documents.Metadata.CHANGE_VECTOR)
         if change_vector is None:
             raise ValueError(f"Document {key} must have a Change Vector")
 
-        if not no_tracking:
-            new_document_info = DocumentInfo(
-                key=key, document=document, metadata=metadata, entity=entity, change_vector=change_vector
-            )
-            self._documents_by_id[new_document_info.key] = new_document_info
-            self._documents_by_entity[new_document_info.entity] = new_document_info
+        if no_tracking:
+            return self.entity_to_json.convert_to_entity(entity_type, key, document, False)
 
-        return entity
+        new_document_info = DocumentInfo(key=key, document=document, metadata=metadata, change_vector=change_vector)
+        new_document_info.entity = self.__convert_to_tracked_entity(entity_type, new_document_info, document, False)
+        self._documents_by_id[new_document_info.key] = new_document_info
+        self._documents_by_entity[new_document_info.entity] = new_document_info
+
+        return new_document_info.entity
+
+    def __convert_to_tracked_entity(
+        self, entity_type: Type[_T], document_info: DocumentInfo, document: dict, no_tracking: bool
+    ) -> _T:
+        # the session diffs against a serialized copy of the loaded document,
+        # so the entity can take over the parsed one instead of a deep copy of it
+        if not no_tracking and not document_info.is_document_frozen and document is document_info.document:
+            if document_info.freeze_document(self.conventions.json_codec):
+                return self.entity_to_json.convert_to_entity(entity_type, document_info.key, document, True, False)
+        return self.entity_to_json.convert_to_entity(entity_type, document_info.key, document, not no_tracking)
 
     def delete(self, key_or_entity: Union[str, object], expected_change_vector: Optional[str] = None) -> None:
         if isinstance(key_or_entity, str):
@@ -1072,6 +958,10 @@ class InMemoryDocumentSessionOperations:
                 result.on_success.clear_deleted_entities()
 
     def __prepare_for_entities_puts(self, result: SaveChangesData) -> None:
+        with self._documents_by_entity.prepare_entities_puts():
+            self.__prepare_for_entities_puts_internal(result)
+
+    def __prepare_for_entities_puts_internal(self, result: SaveChangesData) -> None:
         should_ignore_entity_changes = self.conventions.should_ignore_entity_changes
         for entity in self._documents_by_entity:
             entity: DocumentsByEntityHolder.DocumentsByEntityEnumeratorResult
@@ -1086,9 +976,13 @@ class InMemoryDocumentSessionOperations:
 
             dirty_metadata = _update_metadata_modifications(entity.value.metadata_instance, entity.value.metadata)
 
+            if not dirty_metadata and not self.__might_have_changed(entity.key, entity.value):
+                continue
+
             document = self.entity_to_json.convert_entity_to_json(entity.key, entity.value)
 
             if not self._entity_changed(document, entity.value, None) and not dirty_metadata:
+                self.__mark_clean(entity.key)
                 continue
 
             command = result.deferred_commands_map.get(
@@ -1163,12 +1057,24 @@ class InMemoryDocumentSessionOperations:
     ) -> bool:
         return JsonOperation.entity_changed(new_obj, document_info, changes)
 
+    def __might_have_changed(self, entity: object, document_info: DocumentInfo) -> bool:
+        if self._write_tracker is None or document_info.new_document:
+            return True
+        return self._write_tracker.is_dirty(entity)
+
+    def __mark_clean(self, entity: object) -> None:
+        if self._write_tracker is not None:
+            self._write_tracker.mark_clean(entity)
+
     def has_changes(self) -> bool:
         for entity in self._documents_by_entity:
             entity: DocumentsByEntityHolder.DocumentsByEntityEnumeratorResult
+            if not self.__might_have_changed(entity.key, entity.value):
+                continue
             document = self.entity_to_json.convert_entity_to_json(entity.key, entity.value)
             if self._entity_changed(document, entity.value, None):
                 return True
+            self.__mark_clean(entity.key)
 
         return not len(self._deleted_entities) == 0 or not len(self._deferred_commands) == 0
 
@@ -1189,6 +1095,11 @@ class InMemoryDocumentSessionOperations:
     def ignore_changes_for(self, entity: object) -> None:
         self._get_document_info(entity).ignore_changes = True
 
+    def mark_as_changed(self, entity: object) -> None:
+        self._get_document_info(entity)
+        if self._write_tracker is not None:
+            self._write_tracker.mark_dirty(entity)
+
     def defer(self, *commands: CommandData) -> None:
         self._deferred_commands.extend(commands)
         for command in commands:
@@ -1226,6 +1137,8 @@ class InMemoryDocumentSessionOperations:
             return
 
         self.session_closing_invoke(SessionClosingEventArgs(self))
+        if self._write_tracker is not None:
+            self._write_tracker.clear()
         self._is_disposed = True
 
     def close(self) -> None:
@@ -1754,7 +1667,7 @@ class InMemoryDocumentSessionOperations:
                 if document_info is None:
                     return False
 
-            if document_info.entity is None and document_info.document is None:
+            if document_info.entity is None and not document_info.has_document:
                 return False
 
             if includes is None:
@@ -1932,6 +1845,8 @@ class InMemoryDocumentSessionOperations:
                     document: dict = document_info_dict_tuple[1]
                     info.new_document = False
                     info.document = document
+                    if self.__session._write_tracker is not None and info.entity is not None:
+                        self.__session._write_tracker.mark_clean(info.entity)
 
                 if self.__clear_deleted_entities:
                     self.__session._deleted_entities.clear()
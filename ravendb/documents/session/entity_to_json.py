@@ -64,9 +64,13 @@ class EntityToJson:
 
     # Converting JSON Dicts to objects
     # ================================
-    def convert_to_entity(self, entity_type: Type[_T], key: str, document: dict, track_entity: bool) -> _T:
+    def convert_to_entity(
+        self, entity_type: Type[_T], key: str, document: dict, track_entity: bool, copy_document: bool = True
+    ) -> _T:
         conventions = self._session.conventions
-        return EntityToJsonStatic.convert_to_entity(document, entity_type, conventions, self._session, key)
+        return EntityToJsonStatic.convert_to_entity(
+            document, entity_type, conventions, self._session, key, copy_document
+        )
 
     # Miscellaneous
     # =============
@@ -78,10 +82,8 @@ class EntityToJson:
         self._session.generate_entity_id_on_the_client.try_set_identity(entity, key)
 
     def remove_from_missing(self, entity):
-        try:
-            del self.missing_dictionary[entity]
-        except KeyError:
-            pass
+        # keyed by identity, same as the session's entity map
+        self.missing_dictionary.pop(id(entity), None)
 
     def clear(self):
         self.missing_dictionary.clear()
@@ -141,21 +143,31 @@ class EntityToJsonStatic:
         conventions: "DocumentConventions",
         session: Optional["InMemoryDocumentSessionOperations"] = None,
         key: str = None,
+        copy_document: bool = True,
     ) -> _T:
+        """
+        @param copy_document: False when nothing else keeps the document - the entity takes over its values,
+        only the metadata is copied, as it stays shared with the session
+        """
         metadata = document.get("@metadata")
-        document_deepcopy = deepcopy(document)
+        if copy_document:
+            document_copy = Utils.copy_json(document)
+        else:
+            document_copy = dict(document)
+            if metadata is not None:
+                document_copy["@metadata"] = Utils.copy_json(metadata)
 
         object_type, is_projection, should_update_metadata_python_type = EntityToJsonUtils.determine_object_type(
             document, conventions, object_type, metadata
         )
 
         if object_type is dict:
-            EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_deepcopy)
-            return document_deepcopy
+            EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_copy)
+            return document_copy
 
         if object_type is DynamicStructure:
-            dyn = DynamicStructure(**document_deepcopy)
-            EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_deepcopy)
+            dyn = DynamicStructure(**document_copy)
+            EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_copy)
             return dyn
 
         if should_update_metadata_python_type:
@@ -164,25 +176,25 @@ class EntityToJsonStatic:
         # Fire before conversion to entity events
         if session:
             session.before_conversion_to_entity_invoke(
-                BeforeConversionToEntityEventArgs(session, key, object_type, document_deepcopy)
+                BeforeConversionToEntityEventArgs(session, key, object_type, document_copy)
             )
 
         # Conversion to entity
 
         if "from_json" in object_type.__dict__ and inspect.ismethod(object_type.from_json):
             # By custom defined 'from_json' serializer class method
-            entity = object_type.from_json(document_deepcopy)
+            entity = object_type.from_json(document_copy)
         elif is_projection:
-            entity = DynamicStructure(**document_deepcopy)
+            entity = DynamicStructure(**document_copy)
             entity.__class__ = object_type
             try:
-                entity = Utils.initialize_object(document_deepcopy, object_type)
+                entity = Utils.initialize_object(document_copy, object_type)
             except TypeError as e:
                 raise InvalidOperationException("Probably projection error", e)
         else:
-            entity = Utils.convert_json_dict_to_object(document_deepcopy, object_type)
+            entity = Utils.convert_json_dict_to_object(document_copy, object_type)
 
-        EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_deepcopy)
+        EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_copy)
 
         # Try to set identity property
         identity_property_name = conventions.get_identity_property_name(object_type)
@@ -198,11 +210,11 @@ class EntityToJsonUtils:
         session: Optional["InMemoryDocumentSessionOperations"],
         key: str,
         object_type: Optional[_T],
-        document_deepcopy: dict,
+        document_copy: dict,
     ):
         if session:
             session.after_conversion_to_entity_invoke(
-                AfterConversionToEntityEventArgs(session, key, object_type, document_deepcopy)
+                AfterConversionToEntityEventArgs(session, key, object_type, document_copy)
             )
 
     @staticmethod
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Dict, Set
+
+_lock = threading.Lock()
+_instrumented_classes: Set[type] = set()
+# id of a watched entity -> trackers (by their id) interested in writes to it
+_trackers_by_entity_id: Dict[int, Dict[int, weakref.ReferenceType]] = {}
+
+
+def _notify_write(entity: object) -> None:
+    trackers = _trackers_by_entity_id.get(id(entity))
+    if not trackers:
+        return
+    for tracker_reference in list(trackers.values()):
+        tracker = tracker_reference()
+        if tracker is not None:
+            tracker.mark_dirty(entity)
+
+
+def _instrument(object_type: type) -> bool:
+    if object_type in _instrumented_classes:
+        return True
+    with _lock:
+        if object_type in _instrumented_classes:
+            return True
+
+        original_setattr = object_type.__setattr__
+        if getattr(original_setattr, "_notifies_writes", False):
+            # inherited from an instrumented base class, wrapping it again would report every write twice
+            _instrumented_classes.add(object_type)
+            return True
+
+        def __setattr__(self, name, value):
+            original_setattr(self, name, value)
+            _notify_write(self)
+
+        __setattr__._notifies_writes = True
+
+        try:
+            object_type.__setattr__ = __setattr__
+        except TypeError:
+            # built-in types (e.g. dict) can't be instrumented
+            return False
+
+        _instrumented_classes.add(object_type)
+        return True
+
+
+def _forget(tracker_id: int, entity_ids: Set[int]) -> None:
+    with _lock:
+        for entity_id in entity_ids:
+            trackers = _trackers_by_entity_id.get(entity_id)
+            if trackers is None:
+                continue
+            trackers.pop(tracker_id, None)
+            if not trackers:
+                del _trackers_by_entity_id[entity_id]
+
+
+class EntityWriteTracker:
+    """
+    Tracks attribute assignments on the entities of a session, so unmodified entities can be skipped
+    when looking for changes. The class of a watched entity gets its __setattr__ instrumented (once per class),
+    which costs a single dictionary lookup per assignment for instances that aren't watched.
+
+    In-place modifications of nested values (e.g. appending to a list attribute) are not assignments,
+    such entities have to be marked with mark_dirty explicitly.
+    """
+
+    def __init__(self):
+        self.__watched: Dict[int, object] = {}
+        self.__watched_ids: Set[int] = set()
+        self.__dirty: Set[int] = set()
+        self.__finalizer = weakref.finalize(self, _forget, id(self), self.__watched_ids)
+
+    def __len__(self):
+        return len(self.__watched)
+
+    def watch(self, entity: object) -> None:
+        entity_id = id(entity)
+        if entity_id in self.__watched:
+            return
+
+        if not _instrument(type(entity)):
+            # unknown writes, entity will be always compared
+            self.__watched[entity_id] = entity
+            self.__dirty.add(entity_id)
+            return
+
+        with _lock:
+            _trackers_by_entity_id.setdefault(entity_id, {})[id(self)] = weakref.ref(self)
+        self.__watched[entity_id] = entity
+        self.__watched_ids.add(entity_id)
+
+    def unwatch(self, entity: object) -> None:
+        entity_id = id(entity)
+        if self.__watched.pop(entity_id, None) is None:
+            return
+        self.__dirty.discard(entity_id)
+        if entity_id in self.__watched_ids:
+            self.__watched_ids.discard(entity_id)
+            _forget(id(self), {entity_id})
+
+    def is_dirty(self, entity: object) -> bool:
+        entity_id = id(entity)
+        return entity_id not in self.__watched or entity_id in self.__dirty
+
+    def mark_dirty(self, entity: object) -> None:
+        if id(entity) in self.__watched:
+            self.__dirty.add(id(entity))
+
+    def mark_clean(self, entity: object) -> None:
+        entity_id = id(entity)
+        if entity_id in self.__watched_ids:
+            self.__dirty.discard(entity_id)
+
+    def clear(self) -> None:
+        self.__finalizer()
+        self.__watched.clear()
+        self.__watched_ids.clear()
+        self.__dirty.clear()
+        self.__finalizer = weakref.finalize(self, _forget, id(self), self.__watched_ids)
@@ -297,6 +297,54 @@ class FailedRequestEventArgs(EventArgs):
         return self.__response
 
 
+class RequestCompletedEventArgs(EventArgs):
+    def __init__(
+        self,
+        database: str,
+        url: str,
+        command_name: str,
+        status_code: int,
+        duration: float,
+        bytes_sent: int,
+        bytes_received: int,
+    ):
+        self.__database = database
+        self.__url = url
+        self.__command_name = command_name
+        self.__status_code = status_code
+        self.__duration = duration
+        self.__bytes_sent = bytes_sent
+        self.__bytes_received = bytes_received
+
+    @property
+    def database(self) -> str:
+        return self.__database
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def command_name(self) -> str:
+        return self.__command_name
+
+    @property
+    def status_code(self) -> int:
+        return self.__status_code
+
+    @property
+    def duration(self) -> float:
+        return self.__duration
+
+    @property
+    def bytes_sent(self) -> int:
+        return self.__bytes_sent
+
+    @property
+    def bytes_received(self) -> int:
+        return self.__bytes_received
+
+
 class TopologyUpdatedEventArgs(EventArgs):
     def __init__(self, topology: Topology):
         self.__topology = topology
@@ -141,6 +141,7 @@ class SessionOptions:
         request_executor: Optional[RequestExecutor] = None,
         transaction_mode: Optional[TransactionMode] = None,
         disable_atomic_document_writes_in_cluster_wide_transaction: Optional[bool] = None,
+        incremental_change_tracking: Optional[bool] = None,
     ):
         self.database = database
         self.no_tracking = no_tracking
@@ -150,6 +151,9 @@ class SessionOptions:
         self.disable_atomic_document_writes_in_cluster_wide_transaction = (
             disable_atomic_document_writes_in_cluster_wide_transaction
         )
+        # look for changes only in entities which had an attribute assigned since they were loaded or saved,
+        # in-place changes of nested values need session.advanced.mark_as_changed(entity)
+        self.incremental_change_tracking = incremental_change_tracking
 
 
 class DocumentQueryCustomization:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 from http import HTTPStatus
 from typing import Union, List, Generic, TypeVar, Type, Callable, Dict, TYPE_CHECKING, Optional
 
@@ -90,7 +89,9 @@ class LazyStartsWithOperation(LazyOperation):
         return request
 
     def handle_response(self, response: GetResponse) -> None:
-        get_documents_result = GetDocumentsResult.from_json(json.loads(response.result))
+        get_documents_result = GetDocumentsResult.from_json(
+            self.__session_operations.conventions.json_codec.loads(response.result)
+        )
         final_results = CaseInsensitiveDict()
 
         for document in get_documents_result.results:
@@ -168,7 +169,7 @@ class LazyConditionalLoadOperation(LazyOperation):
             if response.result is not None:
                 etag = response.headers.get(constants.Headers.ETAG)
 
-                res = ConditionalGetResult.from_json(json.loads(response.result))
+                res = ConditionalGetResult.from_json(self.__session.conventions.json_codec.loads(response.result))
                 document_info = DocumentInfo.get_new_document_info(res.results[0])
                 r = self.__session.track_entity_document_info(self.__object_type, document_info)
 
@@ -334,7 +335,7 @@ class LazyLoadOperation(LazyOperation):
             self.result = None
             self.requires_retry = True
             return
-        json_result = json.loads(response.result)
+        json_result = self.__session.conventions.json_codec.loads(response.result)
         multi_load_result = None if json_result is None else GetDocumentsResult.from_json(json_result)
         self.__handle_response(multi_load_result)
 
@@ -406,7 +407,7 @@ class LazyQueryOperation(Generic[_T], LazyOperation[_T]):
         query_result = None
 
         if response.result is not None:
-            json_response = json.loads(response.result)
+            json_response = self.__session.conventions.json_codec.loads(response.result)
             query_result = None if json_response is None else QueryResult.from_json(json_response)
 
         self.__handle_response(query_result, response.elapsed)
@@ -452,7 +453,7 @@ class LazyAggregationQueryOperation(LazyOperation):
             self.__requires_retry = True
             return
 
-        query_result = QueryResult.from_json(json.loads(response.result))
+        query_result = QueryResult.from_json(self.__session.conventions.json_codec.loads(response.result))
         self.__handle_response(query_result)
 
     def __handle_response(self, query_result: QueryResult) -> None:
@@ -498,7 +499,7 @@ class LazySuggestionQueryOperation(LazyOperation):
             self.__requires_retry = True
             return
 
-        query_result = QueryResult.from_json(json.loads(response.result))
+        query_result = QueryResult.from_json(self.__session.conventions.json_codec.loads(response.result))
         self.__handle_response(query_result)
 
     def __handle_response(self, query_result: QueryResult) -> None:
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
-from typing import Union, List, Type, TypeVar, Optional, Dict, Any, TYPE_CHECKING
+from typing import Union, List, Type, TypeVar, Optional, Dict, Any, TYPE_CHECKING, Iterator
 
+import ijson
 import requests
 
 from ravendb.http.server_node import ServerNode
 from ravendb.documents.commands.multi_get import GetRequest, MultiGetCommand
 from ravendb.documents.commands.revisions import GetRevisionsCommand
+from ravendb.documents.commands.stream import QueryStreamCommand, StreamCommand, StreamResultResponse
+from ravendb.documents.session.query import StreamQueryStatistics
 from ravendb.documents.session.document_info import DocumentInfo
 
 from ravendb.primitives import constants
@@ -17,6 +19,7 @@ from ravendb.tools.utils import Utils, CaseInsensitiveDict
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 from ravendb.http.raven_command import RavenCommand
 from ravendb.documents.commands.crud import GetDocumentsCommand
+from ravendb.exceptions.exceptions import IndexDoesNotExistException, NotSupportedException
 
 if TYPE_CHECKING:
     from ravendb.json.result import JsonArrayResult
@@ -24,6 +27,7 @@ if TYPE_CHECKING:
         InMemoryDocumentSessionOperations,
     )
     from ravendb.documents.commands.crud import GetDocumentsResult
+    from ravendb.documents.queries.index_query import IndexQuery
 
 _T = TypeVar("_T")
 
@@ -125,6 +129,108 @@ class LoadStartingWithOperation:
         return None
 
 
+class StreamOperation:
+    def __init__(self, session: InMemoryDocumentSessionOperations, statistics: Optional[StreamQueryStatistics] = None):
+        self.__session = session
+        self.__statistics = statistics
+        self.__is_query_stream = False
+
+    def create_request(self, index_query: IndexQuery) -> QueryStreamCommand:
+        self.__is_query_stream = True
+
+        if index_query.wait_for_non_stale_results:
+            raise NotSupportedException(
+                "Since stream() does not wait for indexing (by design), "
+                "streaming query with wait_for_non_stale_results is not supported"
+            )
+
+        self.__session.increment_requests_count()
+        return QueryStreamCommand(self.__session.conventions, index_query)
+
+    def create_request_starting_with(
+        self,
+        starts_with: str,
+        matches: Optional[str] = None,
+        start: int = 0,
+        page_size: int = 0x7FFFFFFF,
+        exclude: Optional[str] = None,
+        start_after: Optional[str] = None,
+    ) -> StreamCommand:
+        url = ["streams/docs?format=json&"]
+        if starts_with is not None:
+            url.append(f"startsWith={Utils.quote_key(starts_with)}&")
+
+        if matches is not None:
+            url.append(f"matches={Utils.quote_key(matches)}&")
+
+        if exclude is not None:
+            url.append(f"exclude={Utils.quote_key(exclude)}&")
+
+        if start_after is not None:
+            url.append(f"startAfter={Utils.quote_key(start_after)}&")
+
+        if start != 0:
+            url.append(f"start={start}&")
+
+        if page_size != 0x7FFFFFFF:
+            url.append(f"pageSize={page_size}&")
+
+        self.__session.increment_requests_count()
+        return StreamCommand("".join(url))
+
+    def set_result(self, response: Optional[StreamResultResponse]) -> Iterator[Dict[str, Any]]:
+        if response is None or response.stream is None:
+            raise IndexDoesNotExistException("The index does not exists, failed to stream results")
+
+        events = ijson.parse(response.stream, use_float=True)
+        try:
+            # Read everything up to the results array right away, so statistics are filled before first yield
+            for prefix, event, value in events:
+                if prefix == "Results" and event == "start_array":
+                    break
+                if self.__is_query_stream and event not in ("start_map", "map_key", "end_map"):
+                    self.__handle_stream_query_stats(prefix, value)
+            else:
+                raise RuntimeError("Expected 'Results' property in the stream response")
+        except BaseException:
+            response.close()
+            raise
+
+        return self.__yield_results(response, events)
+
+    def __handle_stream_query_stats(self, name: str, value: Any) -> None:
+        if self.__statistics is None:
+            return
+
+        if name == "ResultEtag":
+            self.__statistics.result_etag = value
+        elif name == "IsStale":
+            self.__statistics.is_stale = value
+        elif name == "IndexName":
+            self.__statistics.index_name = value
+        elif name == "TotalResults":
+            self.__statistics.total_results = value
+        elif name == "IndexTimestamp":
+            self.__statistics.index_timestamp = Utils.string_to_datetime(value) if value else None
+
+    @staticmethod
+    def __yield_results(response: StreamResultResponse, events: Iterator) -> Iterator[Dict[str, Any]]:
+        try:
+            builder: Optional[ijson.ObjectBuilder] = None
+            for prefix, event, value in events:
+                if builder is None:
+                    if event == "end_array":  # end of 'Results'
+                        return
+                    builder = ijson.ObjectBuilder()
+
+                builder.event(event, value)
+                if prefix == "Results.item" and event in ("end_map", "end_array"):
+                    yield builder.value
+                    builder = None
+        finally:
+            response.close()
+
+
 class GetRevisionOperation:
     def __init__(self, session: InMemoryDocumentSessionOperations = None):
         if session is None:
@@ -344,7 +450,7 @@ class GetRevisionsCountOperation:
                 self.result = 0
                 return
 
-            self.result = DocumentRevisionsCount.from_json(json.loads(response)).revisions_count
+            self.result = DocumentRevisionsCount.from_json(self.json_codec.loads(response)).revisions_count
 
         def is_read_request(self) -> bool:
             return True
@@ -2441,3 +2441,19 @@ class QueryStatistics:
         self.last_query_time = qr.last_query_time
         self.result_etag = qr.result_etag
         self.node_tag = qr.node_tag
+
+
+class StreamQueryStatistics:
+    def __init__(
+        self,
+        index_name: str = None,
+        is_stale: bool = None,
+        index_timestamp: datetime.datetime = None,
+        total_results: int = None,
+        result_etag: int = None,
+    ):
+        self.index_name = index_name
+        self.is_stale = is_stale
+        self.index_timestamp = index_timestamp
+        self.total_results = total_results
+        self.result_etag = result_etag
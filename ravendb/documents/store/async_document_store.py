@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional, Union, List, Dict
+
+from ravendb.documents.async_bulk_insert_operation import AsyncBulkInsertOperation
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions
+from ravendb.documents.conventions import DocumentConventions
+from ravendb.documents.session.async_document_session import AsyncDocumentSession
+from ravendb.documents.session.misc import SessionOptions
+from ravendb.documents.store.definition import DocumentStore
+from ravendb.http.async_request_executor import AsyncRequestExecutor
+from ravendb.tools.utils import CaseInsensitiveDict
+
+
+class AsyncDocumentStore:
+    """
+    Entry point for asyncio applications. Configuration, topology, conventions and events are handled by the wrapped
+    DocumentStore (available as document_store), sessions and bulk inserts opened here send their requests
+    through AsyncRequestExecutor, so many of them can run concurrently on a single event loop.
+    """
+
+    def __init__(self, urls: Union[str, List[str]] = None, database: Optional[str] = None):
+        self.__document_store = DocumentStore(urls, database)
+        self.__request_executors: Dict[str, AsyncRequestExecutor] = CaseInsensitiveDict()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def document_store(self) -> DocumentStore:
+        return self.__document_store
+
+    @property
+    def conventions(self) -> DocumentConventions:
+        return self.__document_store.conventions
+
+    @conventions.setter
+    def conventions(self, value: DocumentConventions):
+        self.__document_store.conventions = value
+
+    @property
+    def urls(self) -> List[str]:
+        return self.__document_store.urls
+
+    @property
+    def database(self) -> str:
+        return self.__document_store.database
+
+    @property
+    def certificate_pem_path(self) -> str:
+        return self.__document_store.certificate_pem_path
+
+    @certificate_pem_path.setter
+    def certificate_pem_path(self, value: str):
+        self.__document_store.certificate_pem_path = value
+
+    @property
+    def trust_store_path(self) -> str:
+        return self.__document_store.trust_store_path
+
+    @trust_store_path.setter
+    def trust_store_path(self, value: str):
+        self.__document_store.trust_store_path = value
+
+    def initialize(self) -> AsyncDocumentStore:
+        self.__document_store.initialize()
+        return self
+
+    async def close(self) -> None:
+        while len(self.__request_executors) > 0:
+            await self.__request_executors.popitem()[1].close()
+
+        # closing returns unused HiLo ranges to the server
+        await asyncio.get_running_loop().run_in_executor(None, self.__document_store.close)
+
+    def get_request_executor(self, database: Optional[str] = None) -> AsyncRequestExecutor:
+        database = self.__document_store.get_effective_database(database)
+
+        executor = self.__request_executors.get(database)
+        if executor is None:
+            executor = AsyncRequestExecutor(self.__document_store.get_request_executor(database))
+            self.__request_executors[database] = executor
+        return executor
+
+    def open_session(
+        self, database: Optional[str] = None, session_options: Optional[SessionOptions] = None
+    ) -> AsyncDocumentSession:
+        session = self.__document_store.open_session(database, session_options)
+        return AsyncDocumentSession(session, self.get_request_executor(session.database_name))
+
+    def bulk_insert(self, database_name: str = None, options: BulkInsertOptions = None) -> AsyncBulkInsertOperation:
+        self.__document_store.assert_initialized()
+        return AsyncBulkInsertOperation(self.__document_store.get_effective_database(database_name), self, options)
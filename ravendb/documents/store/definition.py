@@ -7,7 +7,7 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Union, Optional, TypeVar, List, Dict, TYPE_CHECKING
 
 from ravendb.changes.database_changes import DatabaseChanges
-from ravendb.documents.bulk_insert_operation import BulkInsertOperation, BulkInsertOptions
+from ravendb.documents.bulk_insert_operation import BulkInsertOperation, BulkInsertOptions, ParallelBulkInsert
 from ravendb.documents.indexes.index_creation import IndexCreation
 from ravendb.documents.operations.executor import MaintenanceOperationExecutor, OperationExecutor
 from ravendb.documents.operations.indexes import PutIndexesOperation
@@ -25,8 +25,11 @@ from ravendb.documents.session.event_args import (
     BeforeRequestEventArgs,
     SucceedRequestEventArgs,
     FailedRequestEventArgs,
+    RequestCompletedEventArgs,
 )
 from ravendb.documents.store.lazy import Lazy
+from ravendb.documents.store.load_batcher import DocumentLoadBatcher
+from ravendb.documents.store.misc import AggressiveCacheScope, EvictItemsFromCacheBasedOnChanges
 from ravendb.documents.session.document_session import DocumentSession
 from ravendb.documents.session.document_session_operations.in_memory_document_session_operations import (
     InMemoryDocumentSessionOperations,
@@ -34,6 +37,7 @@ from ravendb.documents.session.document_session_operations.in_memory_document_se
 from ravendb.documents.session.misc import SessionOptions
 from ravendb.documents.subscriptions.document_subscriptions import DocumentSubscriptions
 from ravendb.documents.time_series import TimeSeriesOperations
+from ravendb.http.misc import AggressiveCacheMode, AggressiveCacheOptions
 from ravendb.http.request_executor import RequestExecutor
 from ravendb.documents.identity.hilo import MultiDatabaseHiLoGenerator
 from ravendb.http.topology import Topology
@@ -75,6 +79,7 @@ class DocumentStoreBase:
 
         self.__on_failed_request: List[Callable[[FailedRequestEventArgs], None]] = []
         self.__on_topology_updated: List[Callable[[Topology], None]] = []
+        self.__on_request_completed: List[Callable[[RequestCompletedEventArgs], None]] = []
 
     def __enter__(self):
         return self
@@ -167,7 +172,23 @@ class DocumentStoreBase:
     def operations(self) -> OperationExecutor:
         pass
 
-    # todo: aggressive_caching
+    def aggressively_cache(self, database: Optional[str] = None) -> AggressiveCacheScope:
+        return self.aggressively_cache_for(
+            self.conventions.aggressive_cache_duration, self.conventions.aggressive_cache_mode, database
+        )
+
+    @abstractmethod
+    def aggressively_cache_for(
+        self,
+        cache_duration: datetime.timedelta,
+        mode: Optional[AggressiveCacheMode] = None,
+        database: Optional[str] = None,
+    ) -> AggressiveCacheScope:
+        pass
+
+    def disable_aggressive_caching(self, database: Optional[str] = None) -> AggressiveCacheScope:
+        request_executor = self.get_request_executor(self.get_effective_database(database))
+        return AggressiveCacheScope(request_executor, None)
 
     # todo: time_series
 
@@ -229,6 +250,12 @@ class DocumentStoreBase:
     def remove_on_failed_request(self, event: Callable[[FailedRequestEventArgs], None]):
         self.__on_failed_request.remove(event)
 
+    def add_on_request_completed(self, event: Callable[[RequestCompletedEventArgs], None]):
+        self.__on_request_completed.append(event)
+
+    def remove_on_request_completed(self, event: Callable[[RequestCompletedEventArgs], None]):
+        self.__on_request_completed.remove(event)
+
     def register_events_for_session(self, session: InMemoryDocumentSessionOperations):
         for event in self.__before_store:
             session.add_before_store(event)
@@ -266,6 +293,8 @@ class DocumentStoreBase:
             request_executor.add_on_succeed_request(event)
         for event in self.__on_topology_updated:
             request_executor.add_on_topology_updated(event)
+        for event in self.__on_request_completed:
+            request_executor.add_on_request_completed(event)
 
     def after_session_created(self, session: InMemoryDocumentSessionOperations):
         for event in self.__on_session_creation:
@@ -313,7 +342,8 @@ class DocumentStore(DocumentStoreBase):
         self.urls = [urls] if isinstance(urls, str) else urls
         self.database = database
         self.__request_executors: Dict[str, Lazy[RequestExecutor]] = CaseInsensitiveDict()
-        # todo: aggressive cache
+        self.__aggressive_cache_changes: Dict[str, Lazy[EvictItemsFromCacheBasedOnChanges]] = CaseInsensitiveDict()
+        self.__aggressive_cache_changes_lock = threading.Lock()
         self.__maintenance_operation_executor: Optional[MaintenanceOperationExecutor] = None
         self.__operation_executor: Optional[OperationExecutor] = None
         # todo: database smuggler
@@ -324,6 +354,7 @@ class DocumentStore(DocumentStoreBase):
         self.__after_close: List[Callable[[], None]] = []
         self.__before_close: List[Callable[[], None]] = []
         self.__time_series_operation: Optional[TimeSeriesOperations] = None
+        self.__load_batcher = DocumentLoadBatcher()
 
     def __enter__(self):
         return self
@@ -339,6 +370,10 @@ class DocumentStore(DocumentStoreBase):
     def thread_pool_executor(self) -> ThreadPoolExecutor:
         return self.__thread_pool_executor
 
+    @property
+    def load_batcher(self) -> DocumentLoadBatcher:
+        return self.__load_batcher
+
     @property
     def subscriptions(self) -> DocumentSubscriptions:
         return self.__subscriptions
@@ -378,7 +413,11 @@ class DocumentStore(DocumentStoreBase):
         for event in self.__before_close:
             event()
 
-        # todo: evict items from cache based on changes
+        for lazy in self.__aggressive_cache_changes.values():
+            if not lazy.is_value_created:
+                continue
+
+            lazy.value.close()
 
         while len(self.__database_changes) > 0:
             self.__database_changes.popitem()[1].close()
@@ -442,7 +481,7 @@ class DocumentStore(DocumentStoreBase):
                 self.trust_store_path,
                 self.thread_pool_executor,
             )
-            # todo: register events
+            self.register_events_for_request_executor(request_executor)
             return request_executor
 
         def __create_request_executor_for_single_node() -> RequestExecutor:
@@ -454,7 +493,7 @@ class DocumentStore(DocumentStoreBase):
                 self.trust_store_path,
                 self.thread_pool_executor,
             )
-            # todo: register events
+            self.register_events_for_request_executor(for_single_node)
 
             return for_single_node
 
@@ -528,12 +567,57 @@ class DocumentStore(DocumentStoreBase):
         self._initialized = True
         return self
 
-    # todo: aggressively cache
+    def aggressively_cache_for(
+        self,
+        cache_duration: datetime.timedelta,
+        mode: Optional[AggressiveCacheMode] = None,
+        database: Optional[str] = None,
+    ) -> AggressiveCacheScope:
+        """
+        Serves cached responses younger than cache_duration without contacting the server, until the returned
+        scope is closed. In TRACK_CHANGES mode the cache is invalidated by document and index changes.
+        """
+        self.assert_initialized()
+
+        database = database or self.database
+        if database is None:
+            raise RuntimeError(
+                "Cannot use aggressively_cache and aggressively_cache_for without a default database defined "
+                "unless 'database' parameter is provided. Did you forget to pass 'database' parameter?"
+            )
+
+        if mode is None:
+            mode = self.conventions.aggressive_cache_mode
+
+        if mode != AggressiveCacheMode.DO_NOT_TRACK_CHANGES:
+            self.__listen_to_changes_and_update_the_cache(database)
+
+        return AggressiveCacheScope(self.get_request_executor(database), AggressiveCacheOptions(cache_duration, mode))
+
+    def __listen_to_changes_and_update_the_cache(self, database: str) -> None:
+        with self.__aggressive_cache_changes_lock:
+            lazy = self.__aggressive_cache_changes.get(database)
+            if lazy is None:
+                lazy = Lazy(lambda: EvictItemsFromCacheBasedOnChanges(self, database))
+                self.__aggressive_cache_changes[database] = lazy
+
+        # changes made before the server confirms the watch commands would be served stale from the cache
+        lazy.value.ensure_connected()
 
     def bulk_insert(self, database_name: str = None, options: BulkInsertOptions = None) -> BulkInsertOperation:
         self.assert_initialized()
         return BulkInsertOperation(self.get_effective_database(database_name), self, options)
 
+    def parallel_bulk_insert(
+        self,
+        database_name: str = None,
+        number_of_streams: int = 4,
+        options: BulkInsertOptions = None,
+        spread_across_nodes: bool = False,
+    ) -> ParallelBulkInsert:
+        self.assert_initialized()
+        return ParallelBulkInsert(self, database_name, number_of_streams, options, spread_across_nodes)
+
     def _assert_valid_configuration(self) -> None:
         if not self.urls:
             raise ValueError("Document URLs cannot be empty.")
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from ravendb.documents.commands.crud import GetDocumentsCommand
+from ravendb.documents.commands.results import GetDocumentsResult
+from ravendb.primitives import constants
+
+if TYPE_CHECKING:
+    from ravendb.documents.session.misc import SessionInfo
+    from ravendb.http.request_executor import RequestExecutor
+
+
+class DocumentLoadBatcher:
+    """
+    Merges plain loads by id issued concurrently (from any session or thread) into a single multi-id request.
+    The first load opens a batch and waits for the window to pass (or for the batch to fill up),
+    then sends the request for all collected ids and hands every caller the documents it asked for.
+    """
+
+    def __init__(self):
+        self.number_of_batched_loads = 0
+        self.number_of_batches = 0
+        self.__pending: Dict[Tuple[RequestExecutor, bool], _LoadBatch] = {}
+        self.__lock = threading.Lock()
+
+    def execute(
+        self, request_executor: RequestExecutor, command: GetDocumentsCommand, session_info: Optional[SessionInfo]
+    ) -> None:
+        window = request_executor.conventions.load_batch_window
+        max_batch_size = request_executor.conventions.load_batch_max_size
+        # aggressive caching is set per thread, a batch sent from the leader's thread would ignore the others'
+        if (
+            window is None
+            or request_executor.aggressive_caching is not None
+            or not self.__can_batch(command, session_info, max_batch_size)
+        ):
+            request_executor.execute_command(command, session_info)
+            return
+
+        batch_key = (request_executor, session_info.no_caching if session_info else False)
+        with self.__lock:
+            batch = self.__pending.get(batch_key)
+            is_leader = batch is None
+            if is_leader:
+                batch = self.__pending[batch_key] = _LoadBatch()
+            batch.add_keys(command._keys)
+            self.number_of_batched_loads += 1
+
+            if batch.size >= max_batch_size:
+                # later loads go to a new batch, this one is sent right away
+                del self.__pending[batch_key]
+                batch.full.set()
+
+        if is_leader:
+            batch.full.wait(window.total_seconds())
+            with self.__lock:
+                if self.__pending.get(batch_key) is batch:
+                    del self.__pending[batch_key]
+                self.number_of_batches += 1
+
+            batch.send(request_executor, session_info)
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+
+        command.result = batch.get_result(command._keys)
+
+    @staticmethod
+    def __can_batch(command: GetDocumentsCommand, session_info: Optional[SessionInfo], max_batch_size: int) -> bool:
+        if not command._keys or len(command._keys) >= max_batch_size:
+            return False
+
+        # includes and paging change the response shape, those loads can't be split between callers
+        if (
+            command._includes
+            or command._counters
+            or command._include_all_counters
+            or command._time_series_includes
+            or command._compare_exchange_value_includes
+            or command._metadata_only
+            or command._start_with is not None
+            or command._start is not None
+            or command._page_size is not None
+        ):
+            return False
+
+        # the session waits for its cluster transaction index, other sessions don't have to
+        return session_info is None or session_info.last_cluster_transaction_index is None
+
+
+class _LoadBatch:
+    def __init__(self):
+        self.keys: Dict[str, str] = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.result: Optional[GetDocumentsResult] = None
+        self.error: Optional[Exception] = None
+        self.__documents: Dict[str, dict] = {}
+        self.__handed_out: Set[str] = set()
+        self.__lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self.keys)
+
+    def add_keys(self, keys: List[str]) -> None:
+        for key in keys:
+            self.keys.setdefault(key.lower(), key)
+
+    def send(self, request_executor: RequestExecutor, session_info: Optional[SessionInfo]) -> None:
+        try:
+            command = GetDocumentsCommand.from_multiple_ids(list(self.keys.values()))
+            request_executor.execute_command(command, session_info)
+            self.result = command.result
+            if self.result is not None:
+                # ids in the url are deduplicated through a set, so results are matched by id and not by position
+                for document in self.result.results:
+                    if document is not None:
+                        key = document.get(constants.Documents.Metadata.KEY).get(constants.Documents.Metadata.ID)
+                        self.__documents[key.lower()] = document
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done.set()
+
+    def get_result(self, keys: List[str]) -> Optional[GetDocumentsResult]:
+        if self.result is None:
+            return None
+
+        results = []
+        with self.__lock:
+            for key in keys:
+                document = self.__documents.get(key.lower())
+                if document is not None and key.lower() in self.__handed_out:
+                    # sessions keep and modify what they get, the same document can't be shared between them
+                    document = copy.deepcopy(document)
+                self.__handed_out.add(key.lower())
+                results.append(document)
+
+        if all(document is None for document in results):
+            # the server answers with 404 when none of the documents exist
+            return None
+
+        return GetDocumentsResult(
+            self.result.includes,
+            results,
+            self.result.counter_includes,
+            self.result.time_series_includes,
+            self.result.compare_exchange_includes,
+            self.result.next_page_start,
+        )
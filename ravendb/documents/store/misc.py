@@ -1,9 +1,16 @@
 from __future__ import annotations
 import threading
-from typing import Generic, Callable, Any, Union, TypeVar
+from typing import Generic, Callable, Any, Union, TypeVar, TYPE_CHECKING
 
+from ravendb.changes.observers import ActionObserver
+from ravendb.changes.types import DocumentChange, DocumentChangeType, IndexChange, IndexChangeTypes
 from ravendb.documents.commands.batches import CommandType
 
+if TYPE_CHECKING:
+    from ravendb.documents.store.definition import DocumentStore
+    from ravendb.http.misc import AggressiveCacheOptions
+    from ravendb.http.request_executor import RequestExecutor
+
 _T = TypeVar("_T")
 
 
@@ -29,3 +36,61 @@ class IdTypeAndName:
     @classmethod
     def create(cls, key: str, command_type: CommandType, name: Union[None, str]) -> IdTypeAndName:
         return cls(key, command_type, name)
+
+
+class EvictItemsFromCacheBasedOnChanges:
+    def __init__(self, store: DocumentStore, database_name: str):
+        self.__database_name = database_name
+        self.__changes = store.changes(database_name)
+        self.__request_executor = store.get_request_executor(database_name)
+
+        self.__documents_observable = self.__changes.for_all_documents()
+        self.__documents_subscription = self.__documents_observable.subscribe_with_observer(
+            ActionObserver(self.__on_document_change)
+        )
+        self.__indexes_observable = self.__changes.for_all_indexes()
+        self.__indexes_subscription = self.__indexes_observable.subscribe_with_observer(
+            ActionObserver(self.__on_index_change)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def ensure_connected(self) -> None:
+        self.__documents_observable.ensure_subscribe_now()
+        self.__indexes_observable.ensure_subscribe_now()
+
+    def __on_document_change(self, change: DocumentChange) -> None:
+        if change.type_of_change in (DocumentChangeType.PUT, DocumentChangeType.DELETE):
+            self.__request_executor.cache.increment_generation()
+
+    def __on_index_change(self, change: IndexChange) -> None:
+        if change.type_of_change in (IndexChangeTypes.BATCH_COMPLETED, IndexChangeTypes.INDEX_REMOVED):
+            self.__request_executor.cache.increment_generation()
+
+    def close(self) -> None:
+        self.__documents_subscription()
+        self.__indexes_subscription()
+
+
+class AggressiveCacheScope:
+    def __init__(self, request_executor: RequestExecutor, options: Union[None, AggressiveCacheOptions]):
+        """
+        Applies aggressive cache options to the request executor (for the current thread) until closed,
+        then restores the options that were active before.
+        """
+        self.__request_executor = request_executor
+        self.__old_options = request_executor.aggressive_caching
+        request_executor.aggressive_caching = options
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.__request_executor.aggressive_caching = self.__old_options
@@ -49,6 +49,7 @@ class SubscriptionWorkerOptions:
         send_buffer_size: int = 32 * 1024,
         ignore_subscriber_errors: Optional[bool] = None,
         close_when_no_docs_left: Optional[bool] = None,
+        skip_entity_conversion: bool = False,
     ):
         if not subscription_name or subscription_name.isspace():
             raise ValueError("Subscription name cannot be None or empty")
@@ -61,6 +62,8 @@ class SubscriptionWorkerOptions:
         self.send_buffer_size = send_buffer_size
         self.ignore_subscriber_errors = ignore_subscriber_errors
         self.close_when_no_docs_left = close_when_no_docs_left
+        # client side only - items expose raw_result, result isn't converted to an entity
+        self.skip_entity_conversion = skip_entity_conversion
 
     def to_json(self) -> Dict:
         return {
@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import concurrent.futures
 import datetime
+import functools
 import json
 import logging
 import os
+import threading
 import time
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from json import JSONDecoder, JSONDecodeError
 from socket import socket
-from typing import TypeVar, Generic, Type, Optional, Callable, Dict, List, TYPE_CHECKING, Any
+from typing import TypeVar, Generic, Type, Optional, Callable, Dict, List, TYPE_CHECKING, Any, Hashable, Tuple
 
 from ravendb.primitives import constants
 from ravendb.documents.session.entity_to_json import EntityToJsonStatic
@@ -31,6 +32,7 @@ from ravendb.exceptions.exceptions import (
     SubscriptionDoesNotBelongToNodeException,
     SubscriptionChangeVectorUpdateConcurrencyException,
     SubscriberErrorException,
+    SubscriptionBatchItemsException,
     SubscriptionDoesNotExistException,
     AllTopologyNodesDownException,
     InvalidNetworkTopologyException,
@@ -54,7 +56,7 @@ from ravendb.serverwide.tcp import (
 )
 from ravendb.tools.generate_id import GenerateEntityIdOnTheClient
 from ravendb.http.server_node import ServerNode
-from ravendb.util.tcp_utils import TcpUtils
+from ravendb.util.tcp_utils import TcpUtils, TcpJsonMessageReader
 
 _T = TypeVar("_T")
 _T_Item = TypeVar("_T_Item")
@@ -181,6 +183,7 @@ class SubscriptionWorker(Generic[_T]):
         self._tcp_client: Optional[socket] = None
         self._disposed: Optional[bool] = None
         self._subscription_task: Optional[Future[None]] = None
+        self._items_executor: Optional[ThreadPoolExecutor] = None
         self._forced_topology_update_attempts: int = 0
 
         self._after_acknowledgment: List[Callable[[SubscriptionBatch[_T]], None]] = []
@@ -194,8 +197,7 @@ class SubscriptionWorker(Generic[_T]):
         self._last_connection_failure: Optional[datetime.datetime] = None
         self._supported_features: Optional[TcpConnectionHeaderMessage.SupportedFeatures] = None
 
-        self._json_decoder = JSONDecoder()
-        self._buffer = ""
+        self._reader = TcpJsonMessageReader(options.receive_buffer_size, self._store.conventions.json_codec)
 
     def __enter__(self):
         return self
@@ -252,6 +254,9 @@ class SubscriptionWorker(Generic[_T]):
             if self._subscription_local_request_executor is not None:
                 self._subscription_local_request_executor.close()
 
+            if self._items_executor is not None:
+                self._items_executor.shutdown(False)
+
         except Exception as ex:
             self._logger.debug(f"Error during close of subscription: {ex.args[0]}", ex)
 
@@ -266,6 +271,61 @@ class SubscriptionWorker(Generic[_T]):
         self._subscriber = process_documents
         return self._run()
 
+    def run_items(
+        self,
+        process_item: Callable[[SubscriptionBatch.Item[_T]], Any],
+        max_parallelism: Optional[int] = None,
+        partition_by: Optional[Callable[[SubscriptionBatch.Item[_T]], Hashable]] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Future[None]:
+        """
+        Runs the subscription processing items of every batch in parallel. Items are split into partitions
+        by partition_by (document id by default) and items of one partition are processed in order.
+        The batch is acknowledged once all partitions are done. An item which fails doesn't stop the others,
+        the failures are raised afterwards as SubscriptionBatchItemsException - like any other subscriber error.
+        @param max_parallelism: Number of partitions processed at once, number of CPUs by default
+        @param partition_by: Returns the key of the item, items with equal keys are processed one after another
+        @param executor: Runs the partitions - by default a thread pool owned by the worker. ProcessPoolExecutor
+        can be passed for CPU bound work, process_item and the items have to be picklable then.
+        """
+        if process_item is None:
+            raise ValueError("process_item cannot be None")
+        if self._subscription_task is not None:
+            raise RuntimeError("The subscription is already running")
+
+        max_parallelism = max_parallelism or os.cpu_count() or 1
+        if partition_by is None:
+            partition_by = SubscriptionWorker._default_partition_key
+        if executor is None:
+            executor = self._items_executor = ThreadPoolExecutor(max_parallelism)
+
+        def __process_batch(batch: SubscriptionBatch[_T]) -> None:
+            partitions: Dict[int, List[SubscriptionBatch.Item[_T]]] = {}
+            for item in batch.items:
+                partitions.setdefault(hash(partition_by(item)) % max_parallelism, []).append(item)
+
+            futures = [
+                executor.submit(_process_subscription_items, process_item, items) for items in partitions.values()
+            ]
+            failed_items = []
+            for future in futures:
+                failed_items.extend(future.result())
+
+            if failed_items:
+                raise SubscriptionBatchItemsException(
+                    f"Processing of {len(failed_items)} out of {batch.number_of_items_in_batch} items failed "
+                    f"in subscription {self._options.subscription_name}",
+                    failed_items=failed_items,
+                )
+
+        self._subscriber = __process_batch
+        return self._run()
+
+    @staticmethod
+    def _default_partition_key(item: SubscriptionBatch.Item[_T]) -> Hashable:
+        # document ids are case insensitive
+        return item.key.lower()
+
     def _run(self) -> Future[None]:
         if self._subscription_task is not None:
             raise RuntimeError("The subscription is already running")
@@ -323,6 +383,8 @@ class SubscriptionWorker(Generic[_T]):
             except ClientVersionMismatchException:
                 tcp_info = self._legacy_try_get_tcp_info(request_executor)
 
+        # whatever was left unread belongs to the previous connection
+        self._reader.reset()
         result = TcpUtils.connect_secured_tcp_socket(
             tcp_info,
             command.result.certificate,
@@ -396,8 +458,7 @@ class SubscriptionWorker(Generic[_T]):
     def _read_server_response_and_get_version(self, url: str, sock: socket) -> int:
         # reading reply from server
         self._ensure_parser()
-        response = sock.recv(self._options.receive_buffer_size)
-        reply = TcpConnectionHeaderResponse.from_json(json.loads(response.decode("utf-8")))
+        reply = TcpConnectionHeaderResponse.from_json(self._reader.read(sock))
 
         if reply.status == TcpConnectionStatus.OK:
             return reply.version
@@ -546,6 +607,7 @@ class SubscriptionWorker(Generic[_T]):
                     self._db_name,
                     self._logger,
                     self._object_type,
+                    self._options.skip_entity_conversion,
                 )
 
                 def __run_async():
@@ -663,19 +725,7 @@ class SubscriptionWorker(Generic[_T]):
         if self._disposed:  # if we are disposed, nothing to do...
             return None
 
-        def _receive_more_data():
-            return sock.recv(self._options.receive_buffer_size).decode("utf-8").strip("\r\n")
-
-        while True:
-            if self._buffer and not self._buffer.isspace():
-                try:
-                    decoded_json, index = self._json_decoder.raw_decode(self._buffer)
-                    self._buffer = self._buffer[index:]
-                    return SubscriptionConnectionServerMessage.from_json(decoded_json)
-                except JSONDecodeError:
-                    self._buffer += _receive_more_data()
-            else:
-                self._buffer += _receive_more_data()
+        return SubscriptionConnectionServerMessage.from_json(self._reader.read(sock))
 
     def _send_ack(self, last_received_change_vector: str, network_stream: socket) -> None:
         msg = SubscriptionConnectionClientMessage()
@@ -839,6 +889,19 @@ class BatchFromServer:
             return self._counter_includes
 
 
+def _process_subscription_items(
+    process_item: Callable[[SubscriptionBatch.Item[_T]], Any], items: List[SubscriptionBatch.Item[_T]]
+) -> List[Tuple[str, Exception]]:
+    # module level, so that it can be sent to a process pool
+    failed_items = []
+    for item in items:
+        try:
+            process_item(item)
+        except Exception as e:
+            failed_items.append((item.key, e))
+    return failed_items
+
+
 class SubscriptionBatch(Generic[_T]):
     class Item(Generic[_T_Item]):
         """
@@ -847,8 +910,11 @@ class SubscriptionBatch(Generic[_T]):
         using it outside this scope might cause unexpected behavior.
         """
 
+        _materialize_lock = threading.Lock()
+
         def __init__(self):
             self._result: Optional[_T_Item] = None
+            self._result_factory: Optional[Callable[[], _T_Item]] = None
             self._exception_message: Optional[str] = None
             self._key: Optional[str] = None
             self._change_vector: Optional[str] = None
@@ -885,11 +951,29 @@ class SubscriptionBatch(Generic[_T]):
         def result(self) -> _T_Item:
             if self._exception_message is not None:
                 self._throw_item_process_exception()
+            # read once - another thread may clear the factory between the check and the call
+            factory = self._result_factory
+            if factory is not None:
+                # converted on first access, many subscribers look only at the key or raw_result
+                result = factory()
+                with SubscriptionBatch.Item._materialize_lock:
+                    if self._result_factory is factory:
+                        self._result = result
+                        self._result_factory = None
             return self._result
 
         @result.setter
         def result(self, result: _T_Item):
             self._result = result
+            self._result_factory = None
+
+        def __getstate__(self):
+            # the factory refers to the batch, the entity is sent (e.g. to a process pool) instead
+            if self._result_factory is not None and self._exception_message is None:
+                _ = self.result
+            state = self.__dict__.copy()
+            state["_result_factory"] = None
+            return state
 
         @property
         def metadata(self) -> MetadataAsDictionary:
@@ -905,8 +989,10 @@ class SubscriptionBatch(Generic[_T]):
         db_name: str,
         logger: logging.Logger,
         object_type: Type[_T],
+        skip_entity_conversion: bool = False,
     ):
         self._object_type: Optional[Type[_T]] = object_type
+        self._skip_entity_conversion = skip_entity_conversion
         self._revisions = revisions
         self._request_executor = request_executor
         self._store = store
@@ -985,6 +1071,13 @@ class SubscriptionBatch(Generic[_T]):
             if item.is_projection or item.is_revision:
                 continue
 
+            if self._skip_entity_conversion:
+                # without the entity the session converts the document when it's loaded
+                s.documents_by_id.add(
+                    DocumentInfo(item.key, item.change_vector, document=item.raw_result, metadata=item.raw_metadata)
+                )
+                continue
+
             document_info = DocumentInfo(
                 item.key,
                 item.change_vector,
@@ -1025,40 +1118,16 @@ class SubscriptionBatch(Generic[_T]):
             projection = metadata.get(constants.Documents.Metadata.PROJECTION) or False
             self._logger.debug(f"Got {key} (change vector: [{last_received_change_vector}], size: {len(cur_doc)})")
 
-            instance: Optional[_T] = None
-
-            if item.exception is None:
-                if self._object_type == dict:
-                    instance = cur_doc
-                else:
-                    if self._revisions:
-                        # parse outer object manually as Previous/Current has PascalCase
-                        previous = cur_doc.get("Previous")
-                        current = cur_doc.get("Current")
-                        revision = Revision()
-                        if current:
-                            revision.current = EntityToJsonStatic.convert_to_entity_by_key(
-                                self._object_type, key, current, self._request_executor.conventions
-                            )
-                        if previous:
-                            revision.previous = EntityToJsonStatic.convert_to_entity(
-                                self._object_type, key, previous, self._request_executor.conventions
-                            )
-                        instance = revision
-                    else:
-                        instance = EntityToJsonStatic.convert_to_entity_by_key(
-                            self._object_type, key, cur_doc, self._request_executor.conventions
-                        )
-
-                if key:
-                    self._generate_entity_id_on_the_client.try_set_id_on_entity(instance, key)
-
             item_to_add = SubscriptionBatch.Item()
             item_to_add._change_vector = change_vector
             item_to_add._key = key
             item_to_add.raw_result = cur_doc
             item_to_add.raw_metadata = metadata
-            item_to_add._result = instance
+            if item.exception is None:
+                if self._skip_entity_conversion or self._object_type == dict:
+                    item_to_add._result = cur_doc
+                else:
+                    item_to_add._result_factory = functools.partial(self.__create_result, key, cur_doc)
             item_to_add._exception_message = item.exception
             item_to_add._projection = projection
             item_to_add._revision = self._revisions
@@ -1067,5 +1136,28 @@ class SubscriptionBatch(Generic[_T]):
 
         return last_received_change_vector
 
+    def __create_result(self, key: str, document: Dict) -> _T:
+        if self._revisions:
+            # parse outer object manually as Previous/Current has PascalCase
+            previous = document.get("Previous")
+            current = document.get("Current")
+            instance = Revision()
+            if current:
+                instance.current = EntityToJsonStatic.convert_to_entity_by_key(
+                    self._object_type, key, current, self._request_executor.conventions
+                )
+            if previous:
+                instance.previous = EntityToJsonStatic.convert_to_entity(
+                    self._object_type, key, previous, self._request_executor.conventions
+                )
+        else:
+            instance = EntityToJsonStatic.convert_to_entity_by_key(
+                self._object_type, key, document, self._request_executor.conventions
+            )
+
+        if key:
+            self._generate_entity_id_on_the_client.try_set_id_on_entity(instance, key)
+        return instance
+
     def __throw_required(self, name: str):
         raise RuntimeError(f"Document must have a {name}")
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List
 
 from ravendb.exceptions.raven_exceptions import RavenException
 
@@ -11,3 +11,9 @@ class BulkInsertAbortedException(RavenException):
 class BulkInsertProtocolViolationException(RavenException):
     def __init__(self, message: str, cause: Optional[Exception] = None):
         super(BulkInsertProtocolViolationException, self).__init__(message, cause)
+
+
+class ParallelBulkInsertAbortedException(BulkInsertAbortedException):
+    def __init__(self, message: str, errors: List[Exception]):
+        super(ParallelBulkInsertAbortedException, self).__init__(message, errors[0] if errors else None)
+        self.errors = errors
@@ -1,4 +1,4 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
 
 class InvalidOperationException(Exception):
@@ -128,6 +128,12 @@ class SubscriberErrorException(Exception):
     pass
 
 
+class SubscriptionBatchItemsException(Exception):
+    def __init__(self, *args, failed_items: List[Tuple[str, Exception]] = None):
+        super(SubscriptionBatchItemsException, self).__init__(*args)
+        self.failed_items = failed_items or []
+
+
 class InvalidNetworkTopologyException(Exception):
     pass
 
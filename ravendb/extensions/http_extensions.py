@@ -1,4 +1,5 @@
-from typing import Union, Dict
+import zlib
+from typing import Union, Dict, Iterable, Iterator, AsyncIterable, AsyncIterator
 
 import requests
 
@@ -32,6 +33,31 @@ class HttpExtensions:
             return response_header[1:-1]
         return response_header
 
+    @staticmethod
+    def gzip_compress(data: Union[str, bytes]) -> bytes:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    @staticmethod
+    def gzip_compress_stream(chunks: Iterable[Union[str, bytes]]) -> Iterator[bytes]:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    @staticmethod
+    async def gzip_compress_async_stream(chunks: AsyncIterable[Union[str, bytes]]) -> AsyncIterator[bytes]:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        async for chunk in chunks:
+            compressed = compressor.compress(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
     @staticmethod
     def get_boolean_header(response: requests.Response, header: str) -> Union[None, bool]:
         if header in response.headers:
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import inspect
+import ssl
+import time
+from http import HTTPStatus
+from typing import AsyncIterator, Iterator, Optional, TYPE_CHECKING, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from ravendb.documents.session.event_args import BeforeRequestEventArgs
+from ravendb.exceptions.exceptions import DatabaseDoesNotExistException, UnsuccessfulRequestException
+from ravendb.exceptions.raven_exceptions import ClientVersionMismatchException
+from ravendb.http.misc import ResponseDisposeHandling
+from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
+from ravendb.http.server_node import ServerNode
+from ravendb.primitives import constants
+
+if TYPE_CHECKING:
+    from ravendb.documents.conventions import DocumentConventions
+    from ravendb.documents.session.misc import SessionInfo
+    from ravendb.http.http_cache import HttpCache
+    from ravendb.http.request_executor import RequestExecutor
+
+
+class AsyncRequestExecutor:
+    """
+    Executes commands on the asyncio event loop using aiohttp. Topology, node selection, client configuration and
+    the http cache are shared with the wrapped RequestExecutor, so every RavenCommand works with both executors -
+    commands are created with create_request and fed with set_response exactly like in the synchronous flow.
+    """
+
+    _STREAM_CHUNK_SIZE = 64 * 1024
+    # the node can't serve the request right now but another one may, as in the synchronous executor
+    _FAILOVER_STATUS_CODES = (
+        HTTPStatus.GONE,
+        425,  # too early
+        HTTPStatus.REQUEST_TIMEOUT,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    )
+
+    def __init__(self, request_executor: RequestExecutor):
+        if aiohttp is None:
+            raise ImportError("asyncio support requires aiohttp package, install it with 'pip install ravendb[async]'")
+
+        self._request_executor = request_executor
+        self.__http_session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        if self.__http_session is not None:
+            await self.__http_session.close()
+            self.__http_session = None
+
+    @property
+    def request_executor(self) -> RequestExecutor:
+        return self._request_executor
+
+    @property
+    def conventions(self) -> DocumentConventions:
+        return self._request_executor.conventions
+
+    @property
+    def cache(self) -> HttpCache:
+        return self._request_executor.cache
+
+    @property
+    def http_session(self) -> aiohttp.ClientSession:
+        # created lazily - aiohttp session has to be bound to the running event loop
+        if self.__http_session is None or self.__http_session.closed:
+            self.__http_session = self.__create_http_session()
+        return self.__http_session
+
+    def __create_http_session(self) -> aiohttp.ClientSession:
+        certificate_path = self._request_executor.certificate_path
+        trust_store_path = self._request_executor.trust_store_path
+
+        conventions = self._request_executor.conventions
+        idle_timeout = conventions.http_idle_connection_timeout
+        connector_kwargs = {"limit_per_host": conventions.http_max_connections_per_node}
+        if idle_timeout is not None:
+            connector_kwargs["keepalive_timeout"] = idle_timeout.total_seconds()
+
+        if certificate_path or trust_store_path:
+            ssl_context = ssl.create_default_context(cafile=trust_store_path)
+            if certificate_path:
+                if isinstance(certificate_path, tuple):
+                    ssl_context.load_cert_chain(*certificate_path)
+                else:
+                    ssl_context.load_cert_chain(certificate_path)
+            connector_kwargs["ssl"] = ssl_context
+
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(**connector_kwargs))
+
+    async def execute_command(self, command: RavenCommand, session_info: Optional[SessionInfo] = None) -> None:
+        executor = self._request_executor
+        start = time.perf_counter()
+        try:
+            topology_update = executor._first_topology_update_task
+            if not executor._disable_topology_updates and (
+                topology_update is None or not topology_update.done() or topology_update.exception() is not None
+            ):
+                # topology updates run on the executor threads, don't block the event loop while waiting for them
+                await asyncio.get_running_loop().run_in_executor(
+                    None, executor._wait_for_topology_update, topology_update
+                )
+
+            current_index_and_node = executor.choose_node_for_request(command, session_info)
+            await self.execute(
+                current_index_and_node.current_node, current_index_and_node.current_index, command, True, session_info
+            )
+        finally:
+            executor._statistics.record_command(command.__class__.__name__, time.perf_counter() - start)
+
+    async def execute(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        should_retry: bool,
+        session_info: Optional[SessionInfo] = None,
+    ) -> None:
+        executor = self._request_executor
+
+        request = executor._create_request(chosen_node, command)
+        if not request:
+            return
+
+        url = request.url
+        no_caching = session_info.no_caching if session_info else False
+
+        cached_item, change_vector, cached_value = executor._get_from_cache(command, not no_caching, url)
+        with cached_item:
+            if change_vector is not None and executor._try_get_from_cache(command, cached_item, cached_value):
+                return
+
+            executor._set_request_headers(session_info, change_vector, request)
+
+            command.number_of_attempts = command.number_of_attempts + 1
+            attempt_num = command.number_of_attempts
+            if attempt_num > 1:
+                executor._statistics.record_retry()
+            for func in executor._on_before_request:
+                func(BeforeRequestEventArgs(executor._database_name, url, request, attempt_num))
+
+            try:
+                response = await self.__send(chosen_node, command, session_info, request)
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                if not await self.__try_failover(chosen_node, node_index, command, should_retry, session_info, e):
+                    raise
+                return
+
+            refresh_tasks = executor._refresh_if_needed(chosen_node, response)
+
+            command.status_code = response.status_code
+            response_dispose = ResponseDisposeHandling.AUTOMATIC
+
+            try:
+                if response.status_code == HTTPStatus.NOT_MODIFIED:
+                    executor._on_succeed_request_invoke(executor._database_name, url, response, request, attempt_num)
+                    cached_item.not_modified()
+                    executor._statistics.record_not_modified()
+                    if command.response_type == RavenCommandResponseType.OBJECT:
+                        start = time.perf_counter()
+                        command.set_response(cached_value, True)
+                        executor._statistics.record_deserialization(time.perf_counter() - start)
+                    return
+
+                if response.status_code >= 400:
+                    if response.status_code in AsyncRequestExecutor._FAILOVER_STATUS_CODES:
+                        error = UnsuccessfulRequestException(
+                            f"Request to '{url}' ({request.method}) failed with status code {response.status_code}"
+                        )
+                        if await self.__try_failover(
+                            chosen_node, node_index, command, should_retry, session_info, error
+                        ):
+                            return
+
+                    # retries were handled above, so the shared handling won't hit the network
+                    if not executor._handle_unsuccessful_response(
+                        chosen_node, node_index, command, request, response, url, session_info, False
+                    ):
+                        db_missing_header = response.headers.get("Database-Missing", None)
+                        if db_missing_header is not None:
+                            raise DatabaseDoesNotExistException(db_missing_header)
+                        executor._throw_failed_to_contact_all_nodes(command, request)
+                    return
+
+                executor._on_succeed_request_invoke(executor._database_name, url, response, request, attempt_num)
+                start = time.perf_counter()
+                response_dispose = command.process_response(executor.cache, response, url)
+                executor._statistics.record_deserialization(time.perf_counter() - start)
+                executor._last_returned_response = datetime.datetime.utcnow()
+            finally:
+                if response_dispose == ResponseDisposeHandling.AUTOMATIC:
+                    response.close()
+                for refresh_task in refresh_tasks:
+                    await asyncio.wrap_future(refresh_task)
+
+    async def __try_failover(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        should_retry: bool,
+        session_info: Optional[SessionInfo],
+        e: Optional[Exception],
+    ) -> bool:
+        executor = self._request_executor
+        if not should_retry or node_index is None or executor._node_selector is None:
+            return False
+
+        if command.failed_nodes is None:
+            command.failed_nodes = {}
+        command.failed_nodes[chosen_node] = e
+
+        # as the server is down, we discard the server version to ensure we update when it goes up
+        chosen_node.discard_server_version()
+        executor._node_selector.on_failed_request(node_index)
+
+        next_node = executor.choose_node_for_request(command, session_info)
+        if next_node.current_node in command.failed_nodes:
+            return False
+
+        executor._statistics.record_failover()
+        await self.execute(next_node.current_node, next_node.current_index, command, True, session_info)
+        return True
+
+    async def __send(
+        self,
+        chosen_node: ServerNode,
+        command: RavenCommand,
+        session_info: Optional[SessionInfo],
+        request: requests.Request,
+    ) -> requests.Response:
+        executor = self._request_executor
+        executor.number_of_server_requests += 1
+
+        timeout = command.timeout or executor.default_timeout
+        start = time.perf_counter()
+        async with self.http_session.request(
+            request.method,
+            request.url,
+            data=self.__get_body(request.data),
+            headers=request.headers,
+            timeout=aiohttp.ClientTimeout(total=timeout.total_seconds()) if timeout else None,
+        ) as http_response:
+            response = await self.__to_response(http_response, request.url)
+        executor._record_request(chosen_node, command, request, response, time.perf_counter() - start)
+
+        if chosen_node.should_update_server_version():
+            server_version = response.headers.get(constants.Headers.SERVER_VERSION)
+            if server_version is not None:
+                chosen_node.update_server_version(server_version)
+
+        executor._last_server_version = chosen_node.last_server_version
+
+        if session_info and session_info.last_cluster_transaction_index:
+            if not executor._last_server_version or executor._last_server_version.lower() < "4.1":
+                raise ClientVersionMismatchException(
+                    f"The server on {chosen_node.url} has an old version and"
+                    f" can't perform the command since this command dependent on"
+                    f" a cluster transaction which this node doesn't support"
+                )
+
+        return response
+
+    @staticmethod
+    def __get_body(data: Union[None, str, bytes, object]) -> Union[None, bytes, object]:
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        if inspect.isgenerator(data):
+            return AsyncRequestExecutor.__stream_in_executor(data)
+        return data
+
+    @staticmethod
+    async def __stream_in_executor(data: Iterator[Union[str, bytes]]) -> AsyncIterator[bytes]:
+        # serialization and compression happen while the generator is advanced, so it runs on the executor threads
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, AsyncRequestExecutor.__read_chunk, data)
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def __read_chunk(data: Iterator[Union[str, bytes]]) -> bytes:
+        # generators yield small pieces, hopping to the executor once per piece would cost more than producing it
+        chunk = bytearray()
+        for piece in data:
+            chunk += piece.encode("utf-8") if isinstance(piece, str) else piece
+            if len(chunk) >= AsyncRequestExecutor._STREAM_CHUNK_SIZE:
+                break
+        return bytes(chunk)
+
+    @staticmethod
+    async def __to_response(http_response: aiohttp.ClientResponse, url: str) -> requests.Response:
+        # commands process requests.Response objects, so the already read body is exposed the same way
+        response = requests.Response()
+        response.status_code = http_response.status
+        response.reason = http_response.reason
+        response.headers = CaseInsensitiveDict(http_response.headers)
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = await http_response.read()
+        response._content_consumed = True
+        return response
@@ -0,0 +1,175 @@
+import functools
+import logging
+import time
+from typing import Optional, Dict, List
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionPoolStatistics:
+    def __init__(
+        self,
+        url: str,
+        max_connections: int,
+        connections_opened: int,
+        connections_closed: int,
+        idle_connections: int,
+        number_of_requests: int,
+    ):
+        self.url = url
+        self.max_connections = max_connections
+        self.connections_opened = connections_opened
+        self.connections_closed = connections_closed
+        self.idle_connections = idle_connections
+        self.number_of_requests = number_of_requests
+
+    @property
+    def reused_connections(self) -> int:
+        return max(0, self.number_of_requests - self.connections_opened)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(url={self.url}, opened={self.connections_opened}, "
+            f"closed={self.connections_closed}, idle={self.idle_connections}, requests={self.number_of_requests})"
+        )
+
+
+class _IdleConnectionsPoolMixin:
+    def __init__(
+        self,
+        *args,
+        max_idle_connections: Optional[int] = None,
+        idle_connection_timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.max_idle_connections = max_idle_connections
+        self.idle_connection_timeout = idle_connection_timeout
+        self.num_reconnects = 0
+        self.num_closed_connections = 0
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+
+        idle_since = getattr(conn, "_idle_since", None)
+        if idle_since is not None:
+            if (
+                self.idle_connection_timeout is not None
+                and conn.sock is not None
+                and time.monotonic() - idle_since > self.idle_connection_timeout
+            ):
+                # server might have dropped it already, don't risk a reset on the next request
+                conn.close()
+                self.num_closed_connections += 1
+
+            if conn.sock is None:
+                self.num_reconnects += 1
+
+        conn._idle_since = None
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        if conn is not None:
+            if self.max_idle_connections is not None and self.idle_connections >= self.max_idle_connections:
+                conn.close()
+                self.num_closed_connections += 1
+            conn._idle_since = time.monotonic()
+
+        super()._put_conn(conn)
+
+    @property
+    def idle_connections(self) -> int:
+        if self.pool is None:
+            return 0
+        with self.pool.mutex:
+            return sum(1 for conn in self.pool.queue if conn is not None and conn.sock is not None)
+
+
+class _HttpConnectionPool(_IdleConnectionsPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _HttpsConnectionPool(_IdleConnectionsPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHttpAdapter(HTTPAdapter):
+    logger = logging.getLogger("pooled_http_adapter")
+
+    def __init__(
+        self,
+        max_connections_per_node: int = 10,
+        block_when_exhausted: bool = False,
+        max_idle_connections_per_node: Optional[int] = None,
+        idle_connection_timeout: Optional[float] = None,
+    ):
+        """
+        Transport adapter keeping a pool of keep-alive connections per node.
+        @param max_connections_per_node: Number of connections kept in the pool of every node
+        @param block_when_exhausted: Wait for a free connection instead of opening one which is discarded afterwards
+        @param max_idle_connections_per_node: Connections released above this number are closed, None keeps all
+        @param idle_connection_timeout: Seconds after which an unused connection is closed before it's reused
+        """
+        self.__max_idle_connections_per_node = max_idle_connections_per_node
+        self.__idle_connection_timeout = idle_connection_timeout
+        super().__init__(pool_maxsize=max_connections_per_node, pool_block=block_when_exhausted)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        pool_options = {
+            "max_idle_connections": self.__max_idle_connections_per_node,
+            "idle_connection_timeout": self.__idle_connection_timeout,
+        }
+        # options can't go through pool kwargs, those become part of the pool key
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": functools.partial(_HttpConnectionPool, **pool_options),
+            "https": functools.partial(_HttpsConnectionPool, **pool_options),
+        }
+
+    def get_statistics(self) -> Dict[str, ConnectionPoolStatistics]:
+        statistics = {}
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if not isinstance(pool, _IdleConnectionsPoolMixin):
+                continue
+
+            url = f"{pool.scheme}://{pool.host}:{pool.port}"
+            node_statistics = statistics.get(url)
+            if node_statistics is None:
+                # pools are keyed by tls settings too, requests to one node can still be spread over a few of them
+                node_statistics = statistics[url] = ConnectionPoolStatistics(url, self._pool_maxsize, 0, 0, 0, 0)
+
+            node_statistics.connections_opened += pool.num_connections + pool.num_reconnects
+            node_statistics.connections_closed += pool.num_closed_connections
+            node_statistics.idle_connections += pool.idle_connections
+            node_statistics.number_of_requests += pool.num_requests
+        return statistics
+
+    def prewarm(self, url: str, connections: int, verify=True, cert=None, proxies=None) -> None:
+        """
+        Opens connections (including TLS handshake) to the node and returns them to its pool.
+        verify, cert and proxies have to match the ones used by requests, otherwise they end up in another pool.
+        """
+        request = requests.Request("GET", url).prepare()
+        try:
+            if hasattr(self, "get_connection_with_tls_context"):
+                pool = self.get_connection_with_tls_context(request, verify, proxies, cert)
+            else:
+                pool = self.get_connection(url, proxies)
+                self.cert_verify(pool, url, verify, cert)
+
+            taken: List = []
+            try:
+                for _ in range(min(connections, self._pool_maxsize)):
+                    taken.append(pool._get_conn())
+                for conn in taken:
+                    if conn.sock is None:
+                        conn.connect()
+            finally:
+                for conn in taken:
+                    pool._put_conn(conn)
+        except Exception as e:
+            self.logger.info(f"Unable to prewarm connections to {url}: {e}")
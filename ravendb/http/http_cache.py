@@ -1,6 +1,8 @@
 import datetime
+from collections import OrderedDict
 from enum import Enum
-from typing import Union, Optional, Dict, Set
+from threading import Lock
+from typing import Union, Optional, Set, Dict
 
 
 class ItemFlags(Enum):
@@ -15,10 +17,12 @@ class ItemFlags(Enum):
 class HttpCacheItem:
     def __init__(self):
         self.change_vector: Union[None, str] = None
-        self.payload: Union[None, str] = None
+        # utf-8 bytes as received from the server, about half the size of the decoded str for most documents
+        self.payload: Union[None, bytes] = None
         self.last_server_update: datetime.datetime = datetime.datetime.now()
         self.flags: Set[ItemFlags] = {ItemFlags.NONE}
         self.generation: Union[None, int] = None
+        self.size: int = 0
 
         self.cache: Union[None, HttpCache] = None
 
@@ -56,10 +60,21 @@ class ReleaseCacheItem:
 class HttpCache:
     NOT_FOUND_RESPONSE = "404 Response"
 
-    def __init__(self):
-        self.__items: Dict[str, HttpCacheItem] = {}
+    def __init__(self, max_size: int = 128 * 1024 * 1024):
+        """
+        Least recently used cache of server responses, bounded by the total size of cached payloads.
+        @param max_size: Upper bound (in bytes) of urls and payloads kept in the cache, 0 disables caching
+        """
+        self.__items: Dict[str, HttpCacheItem] = OrderedDict()
+        self.__lock = Lock()
+        self.__max_size = max_size
+        self.__size = 0
         self.generation = 0
 
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
     def __enter__(self):
         return self
 
@@ -70,28 +85,63 @@ class HttpCache:
         return len(self.__items)
 
     def __setitem__(self, key, value):
-        self.__items.__setitem__(key, value)
+        self.__put(key, value)
 
     def __getitem__(self, item):
-        self.__items.__getitem__(item)
+        return self.__items.__getitem__(item)
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self.__size
+
+    @property
+    def number_of_hits(self) -> int:
+        return self.__hits
+
+    @property
+    def number_of_misses(self) -> int:
+        return self.__misses
+
+    @property
+    def number_of_evictions(self) -> int:
+        return self.__evictions
 
     def close(self):
-        self.__items.clear()
-        self.__items = None
+        with self.__lock:
+            self.__items.clear()
+            self.__items = None
+            self.__size = 0
 
     def clear(self) -> None:
-        self.__items.clear()
+        with self.__lock:
+            self.__items.clear()
+            self.__size = 0
+
+    def increment_generation(self) -> None:
+        with self.__lock:
+            self.generation += 1
 
-    def set(self, url: str, change_vector: str, result: str) -> None:
+    def set(self, url: str, change_vector: str, result: bytes) -> None:
         http_cache_item = HttpCacheItem()
         http_cache_item.change_vector = change_vector
         http_cache_item.payload = result
         http_cache_item.cache = self
         http_cache_item.generation = self.generation
-        self.__items[url] = http_cache_item
+        self.__put(url, http_cache_item)
+
+    def get(self, url: str) -> (ReleaseCacheItem, str, bytes):
+        with self.__lock:
+            item = self.__items.get(url, None) if self.__items else None
+            if item is not None:
+                self.__items.move_to_end(url)
+                self.__hits += 1
+            else:
+                self.__misses += 1
 
-    def get(self, url: str) -> (ReleaseCacheItem, str, str):
-        item = self.__items.get(url, None) if self.__items else None
         if item is not None:
             change_vector = item.change_vector
             response = item.payload
@@ -107,7 +157,29 @@ class HttpCache:
         http_cache_item.flags = (
             {ItemFlags.AGGRESSIVELY_CACHED, ItemFlags.NOT_FOUND} if aggressively_cached else {ItemFlags.NOT_FOUND}
         )
-        self.__items[url] = http_cache_item
+        self.__put(url, http_cache_item)
+
+    def __put(self, url: str, item: HttpCacheItem) -> None:
+        item.size = len(url) + (len(item.payload) if item.payload else 0)
+        with self.__lock:
+            if self.__items is None:
+                return
+
+            previous = self.__items.pop(url, None)
+            if previous is not None:
+                self.__size -= previous.size
+
+            if item.size > self.__max_size:
+                # never let a single oversized response flush the whole cache
+                return
+
+            self.__items[url] = item
+            self.__size += item.size
+
+            while self.__size > self.__max_size:
+                _, evicted = self.__items.popitem(last=False)
+                self.__size -= evicted.size
+                self.__evictions += 1
 
     class ReleaseCacheItem:
         def __init__(self, item: HttpCacheItem = None):
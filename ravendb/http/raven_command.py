@@ -12,6 +12,7 @@ from ravendb.extensions.http_extensions import HttpExtensions
 from ravendb.http.http_cache import HttpCache
 from ravendb.http.misc import ResponseDisposeHandling
 from ravendb.http.server_node import ServerNode
+from ravendb.json.codec import JsonCodec, DEFAULT_JSON_CODEC
 
 
 class RavenCommandResponseType(Enum):
@@ -36,6 +37,7 @@ class RavenCommand(Generic[_T_Result]):
         command._can_cache = copy.can_cache
         command._can_cache_aggressively = copy.can_cache_aggressively
         command._selected_node_tag = copy.selected_node_tag
+        command.json_codec = copy.json_codec
         return command
 
     def __init__(self, result_class: Type[_T_Result] = None):
@@ -52,6 +54,8 @@ class RavenCommand(Generic[_T_Result]):
         self._number_of_attempts: Optional[int] = None
         self.failed_nodes: Dict[ServerNode, Exception] = {}
         self.on_response_failure: Callable[[requests.Response], None] = lambda resp: None
+        # replaced with the conventions' codec by the request executor
+        self.json_codec: JsonCodec = DEFAULT_JSON_CODEC
 
     @abstractmethod
     def is_read_request(self) -> bool:
@@ -88,7 +92,7 @@ class RavenCommand(Generic[_T_Result]):
         self._number_of_attempts = value
 
     @abstractmethod
-    def set_response(self, response: Optional[str], from_cache: bool) -> None:
+    def set_response(self, response: Union[None, str, bytes], from_cache: bool) -> None:
         if self._response_type == RavenCommandResponseType.EMPTY or RavenCommandResponseType.RAW:
             self._throw_invalid_response()
         raise RuntimeError(
@@ -134,7 +138,8 @@ class RavenCommand(Generic[_T_Result]):
                     response.close()
                     return ResponseDisposeHandling.AUTOMATIC
 
-                json_content = response.content.decode("utf-8")
+                # parsers take the utf-8 bytes as they are, no need to decode them first
+                json_content = response.content
                 if cache is not None:
                     self._cache_response(cache, url, response, json_content)
                 self.set_response(json_content, False)
@@ -147,13 +152,14 @@ class RavenCommand(Generic[_T_Result]):
             response.close()
         return ResponseDisposeHandling.AUTOMATIC
 
-    def _cache_response(self, cache: HttpCache, url: str, response: requests.Response, response_json: str) -> None:
+    def _cache_response(self, cache: HttpCache, url: str, response: requests.Response, response_json: bytes) -> None:
         if not self.can_cache:
             return
 
         change_vector = HttpExtensions.get_etag_header(response)
         if change_vector is None:
             return
+        # response content is immutable, so the cache shares it instead of keeping a copy
         cache.set(url, change_vector, response_json)
 
     @staticmethod
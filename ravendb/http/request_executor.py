@@ -2,18 +2,25 @@ from __future__ import annotations
 
 import datetime
 import inspect
-import json
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait, ALL_COMPLETED
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import time
 import uuid
-from threading import Timer, Semaphore, Lock
+import threading
+from threading import Timer, Semaphore, Lock, local
 
 import requests
 from copy import copy
 
 from ravendb.primitives import constants
-from ravendb.documents.session.event_args import BeforeRequestEventArgs, FailedRequestEventArgs, SucceedRequestEventArgs
+from ravendb.documents.session.event_args import (
+    BeforeRequestEventArgs,
+    FailedRequestEventArgs,
+    SucceedRequestEventArgs,
+    RequestCompletedEventArgs,
+)
 from ravendb.exceptions.exceptions import (
     AllTopologyNodesDownException,
     UnsuccessfulRequestException,
@@ -26,11 +33,27 @@ from ravendb.exceptions.exception_dispatcher import ExceptionDispatcher
 from ravendb.exceptions.raven_exceptions import ClientVersionMismatchException
 
 
-from ravendb.http.http_cache import HttpCache
-from ravendb.http.misc import ReadBalanceBehavior, ResponseDisposeHandling, LoadBalanceBehavior, Broadcast
+from ravendb.extensions.http_extensions import HttpExtensions
+from ravendb.http.connection_pool import PooledHttpAdapter, ConnectionPoolStatistics
+from ravendb.http.http_cache import HttpCache, ItemFlags
+from ravendb.http.misc import (
+    ReadBalanceBehavior,
+    ResponseDisposeHandling,
+    LoadBalanceBehavior,
+    Broadcast,
+    AggressiveCacheOptions,
+)
 from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
+from ravendb.http.request_statistics import RequestStatisticsCollector, RequestExecutorStatistics
 from ravendb.http.server_node import ServerNode
-from ravendb.http.topology import Topology, NodeStatus, NodeSelector, CurrentIndexAndNode, UpdateTopologyParameters
+from ravendb.http.topology import (
+    Topology,
+    NodeStatus,
+    NodeSelector,
+    CurrentIndexAndNode,
+    UpdateTopologyParameters,
+    NodeLatencies,
+)
 from ravendb.serverwide.commands import GetDatabaseTopologyCommand, GetClusterTopologyCommand
 
 from http import HTTPStatus
@@ -48,6 +71,8 @@ class RequestExecutor:
     __INITIAL_TOPOLOGY_ETAG = -2
     __GLOBAL_APPLICATION_IDENTIFIER = uuid.uuid4()
     CLIENT_VERSION = "5.2.6"
+    __MIN_BODY_SIZE_TO_COMPRESS = 1024
+    __MAX_HEDGED_REQUESTS = 16
     logger = logging.getLogger("request_executor")
 
     # todo: initializer should take also cryptography certificates
@@ -64,7 +89,8 @@ class RequestExecutor:
         self.conventions = copy(conventions)
         self._node_selector: NodeSelector = None
         self.__default_timeout: datetime.timedelta = conventions.request_timeout
-        self._cache: HttpCache = HttpCache()
+        self._cache: HttpCache = HttpCache(conventions.max_http_cache_size)
+        self.__aggressive_caching = local()
 
         self.__certificate_path = certificate_path
         self.__trust_store_path = trust_store_path
@@ -84,6 +110,17 @@ class RequestExecutor:
         )
 
         self.number_of_server_requests = 0
+        self.number_of_coalesced_requests = 0
+        self.__in_flight_reads: Dict[tuple, RequestExecutor.InFlightRead] = {}
+        self.__in_flight_reads_lock = Lock()
+        self.number_of_hedged_requests = 0
+        self.__node_latencies = NodeLatencies()
+        # hedged sends get a pool of their own, so they never wait behind (or for) work on the shared one
+        self.__hedge_executor = ThreadPoolExecutor(
+            max_workers=RequestExecutor.__MAX_HEDGED_REQUESTS, thread_name_prefix="hedged-request"
+        )
+        self.__hedge_slots = Semaphore(RequestExecutor.__MAX_HEDGED_REQUESTS)
+        self._statistics = RequestStatisticsCollector()
 
         self._topology_etag: Union[None, int] = None
         self._client_configuration_etag: Union[None, int] = None
@@ -111,6 +148,7 @@ class RequestExecutor:
         self.__on_failed_request: List[Callable[[FailedRequestEventArgs], None]] = []
         self.__on_succeed_request: List[Callable[[SucceedRequestEventArgs], None]] = []
         self._on_topology_updated: List[Callable[[Topology], None]] = []
+        self._on_request_completed: List[Callable[[RequestCompletedEventArgs], None]] = []
 
     def __enter__(self):
         return self
@@ -129,9 +167,19 @@ class RequestExecutor:
             self.__update_topology_timer.cancel()
 
         self._dispose_all_failed_nodes_timers()
+        self.__hedge_executor.shutdown(wait=False)
         if self.__http_session is not None:
             self.__http_session.close()
 
+    @property
+    def aggressive_caching(self) -> Optional[AggressiveCacheOptions]:
+        return getattr(self.__aggressive_caching, "options", None)
+
+    @aggressive_caching.setter
+    def aggressive_caching(self, value: Optional[AggressiveCacheOptions]):
+        # options are per thread, so aggressive caching scope doesn't leak into other threads using this executor
+        self.__aggressive_caching.options = value
+
     @property
     def certificate_path(self) -> str:
         return self.__certificate_path
@@ -173,8 +221,45 @@ class RequestExecutor:
         session = requests.session()
         session.cert = self.__certificate_path
         session.verify = self.__trust_store_path if self.__trust_store_path else True
+
+        idle_timeout = self.conventions.http_idle_connection_timeout
+        adapter = PooledHttpAdapter(
+            self.conventions.http_max_connections_per_node,
+            self.conventions.http_pool_block_when_exhausted,
+            self.conventions.http_max_idle_connections_per_node,
+            idle_timeout.total_seconds() if idle_timeout is not None else None,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         return session
 
+    @property
+    def statistics(self) -> RequestExecutorStatistics:
+        return self._statistics.get_statistics()
+
+    def reset_statistics(self) -> None:
+        self._statistics.reset()
+
+    @property
+    def connection_pool_statistics(self) -> Dict[str, ConnectionPoolStatistics]:
+        if self.__http_session is None:
+            return {}
+        return self.__http_session.get_adapter("http://").get_statistics()
+
+    def __prewarm_connection_pools(self, topology: Topology) -> None:
+        connections = self.conventions.http_prewarm_connections_per_node
+        if not connections or self._disposed:
+            return
+
+        session = self.http_session
+        adapter: PooledHttpAdapter = session.get_adapter("http://")
+        for node in topology.nodes:
+            # the same settings session.request resolves (e.g. REQUESTS_CA_BUNDLE), so requests find the connections
+            settings = session.merge_environment_settings(node.url, {}, None, session.verify, session.cert)
+            self._thread_pool_executor.submit(
+                adapter.prewarm, node.url, connections, settings["verify"], settings["cert"], settings["proxies"]
+            )
+
     @property
     def cache(self) -> HttpCache:
         return self._cache
@@ -239,7 +324,38 @@ class RequestExecutor:
         for event in self.__on_succeed_request:
             event(SucceedRequestEventArgs(database, url, response, request, attempt_number))
 
+    def _record_request(
+        self,
+        chosen_node: ServerNode,
+        command: RavenCommand,
+        request: requests.Request,
+        response: requests.Response,
+        seconds: float,
+    ) -> None:
+        bytes_sent = len(request.data) if isinstance(request.data, (str, bytes)) else 0
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None:
+            bytes_received = int(content_length)
+        else:
+            # chunked responses - the size is known only once the body has been read, streams aren't read here
+            bytes_received = len(response._content) if isinstance(response._content, bytes) else 0
+
+        self._statistics.record_request(chosen_node.url, seconds, bytes_sent, bytes_received)
+        for event in self._on_request_completed:
+            event(
+                RequestCompletedEventArgs(
+                    self._database_name,
+                    request.url,
+                    command.__class__.__name__,
+                    response.status_code,
+                    seconds,
+                    bytes_sent,
+                    bytes_received,
+                )
+            )
+
     def _on_topology_updated_invoke(self, topology: Topology) -> None:
+        self.__prewarm_connection_pools(topology)
         for event in self._on_topology_updated:
             event(topology)
 
@@ -267,6 +383,12 @@ class RequestExecutor:
     def remove_on_topology_updated(self, event: Callable[[Topology], None]):
         self._on_topology_updated.remove(event)
 
+    def add_on_request_completed(self, event: Callable[[RequestCompletedEventArgs], None]):
+        self._on_request_completed.append(event)
+
+    def remove_on_request_completed(self, event: Callable[[RequestCompletedEventArgs], None]):
+        self._on_request_completed.remove(event)
+
     @classmethod
     def create(
         cls,
@@ -477,18 +599,26 @@ class RequestExecutor:
         self.__failed_nodes_timers.clear()
 
     def execute_command(self, command: RavenCommand, session_info: Optional[SessionInfo] = None) -> None:
-        topology_update = self._first_topology_update_task
-        if (
-            topology_update is not None
-            and (topology_update.done() and (not topology_update.exception()) and (not topology_update.cancelled()))
-            or self._disable_topology_updates
-        ):
-            current_index_and_node = self.choose_node_for_request(command, session_info)
-            self.execute(
-                current_index_and_node.current_node, current_index_and_node.current_index, command, True, session_info
-            )
-        else:
-            self.__unlikely_execute(command, topology_update, session_info)
+        start = time.perf_counter()
+        try:
+            topology_update = self._first_topology_update_task
+            if (
+                topology_update is not None
+                and (topology_update.done() and (not topology_update.exception()) and (not topology_update.cancelled()))
+                or self._disable_topology_updates
+            ):
+                current_index_and_node = self.choose_node_for_request(command, session_info)
+                self.execute(
+                    current_index_and_node.current_node,
+                    current_index_and_node.current_index,
+                    command,
+                    True,
+                    session_info,
+                )
+            else:
+                self.__unlikely_execute(command, topology_update, session_info)
+        finally:
+            self._statistics.record_command(command.__class__.__name__, time.perf_counter() - start)
 
     def execute(
         self,
@@ -506,77 +636,131 @@ class RequestExecutor:
                 if topology.etag:
                     command.failover_topology_etag = topology.etag
 
-        request = self.__create_request(chosen_node, command)
-        url = request.url
+        request = self._create_request(chosen_node, command)
 
         if not request:
             return
 
+        url = request.url
+
         if ret_request:
             request_ref = request
 
-        if not request:
-            return
-
         no_caching = session_info.no_caching if session_info else False
 
         cached_item, change_vector, cached_value = self._get_from_cache(command, not no_caching, url)
-        # todo: if change_vector exists try get from cache - aggressive caching
+        in_flight_read: Optional[RequestExecutor.InFlightRead] = None
         with cached_item:
-            # todo: try get from cache
-            self._set_request_headers(session_info, change_vector, request)
-
-            command.number_of_attempts = command.number_of_attempts + 1
-            attempt_num = command.number_of_attempts
-            for func in self._on_before_request:
-                func(BeforeRequestEventArgs(self._database_name, url, request, attempt_num))
-            response = self._send_request_to_server(
-                chosen_node, node_index, command, should_retry, session_info, request, url
-            )
-
-            if response is None:
+            if change_vector is not None and self._try_get_from_cache(command, cached_item, cached_value):
                 return
 
-            refresh_tasks = self._refresh_if_needed(chosen_node, response)
-
-            command.status_code = response.status_code
-            response_dispose = ResponseDisposeHandling.AUTOMATIC
+            if self.conventions.coalesce_read_requests and self.__can_coalesce(command, request):
+                in_flight_read, is_leader = self.__join_in_flight_read(chosen_node, request)
+                if not is_leader:
+                    if in_flight_read.apply_to(command):
+                        with self.__in_flight_reads_lock:
+                            self.number_of_coalesced_requests += 1
+                        return
+                    in_flight_read = None  # request failed for the leader, let's try on our own
 
             try:
-                if response.status_code == HTTPStatus.NOT_MODIFIED:
-                    self._on_succeed_request_invoke(self._database_name, url, response, request, attempt_num)
-                    cached_item.not_modified()
-                    if command.response_type == RavenCommandResponseType.OBJECT:
-                        command.set_response(cached_value, True)
-                    return
+                self.__execute_request(
+                    chosen_node,
+                    node_index,
+                    command,
+                    should_retry,
+                    session_info,
+                    request,
+                    cached_item,
+                    change_vector,
+                    cached_value,
+                    in_flight_read,
+                )
+            finally:
+                if in_flight_read is not None:
+                    self.__leave_in_flight_read(in_flight_read)
 
-                if response.status_code >= 400:
-                    if not self._handle_unsuccessful_response(
-                        chosen_node,
-                        node_index,
-                        command,
-                        request,
-                        response,
-                        url,
-                        session_info,
-                        should_retry,
-                    ):
-                        db_missing_header = response.headers.get("Database-Missing", None)
-                        if db_missing_header is not None:
-                            raise DatabaseDoesNotExistException(db_missing_header)
-                        self._throw_failed_to_contact_all_nodes(command, request)
-                    return  # we either handled this already in the unsuccessful response or we are throwing
+    def __execute_request(
+        self,
+        chosen_node: ServerNode,
+        node_index: int,
+        command: RavenCommand,
+        should_retry: bool,
+        session_info: SessionInfo,
+        request: requests.Request,
+        cached_item: HttpCache.ReleaseCacheItem,
+        change_vector: Optional[str],
+        cached_value: Optional[bytes],
+        in_flight_read: Optional[RequestExecutor.InFlightRead],
+    ) -> None:
+        url = request.url
+        self._set_request_headers(session_info, change_vector, request)
+
+        command.number_of_attempts = command.number_of_attempts + 1
+        attempt_num = command.number_of_attempts
+        if attempt_num > 1:
+            self._statistics.record_retry()
+        for func in self._on_before_request:
+            func(BeforeRequestEventArgs(self._database_name, url, request, attempt_num))
+        responding_node, response = self._send_request_to_server(
+            chosen_node, node_index, command, should_retry, session_info, request, url
+        )
+
+        if response is None:
+            return
+
+        # a hedged read may have been answered by another node
+        chosen_node, node_index = responding_node.current_node, responding_node.current_index
+
+        refresh_tasks = self._refresh_if_needed(chosen_node, response)
+
+        command.status_code = response.status_code
+        response_dispose = ResponseDisposeHandling.AUTOMATIC
+
+        try:
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
                 self._on_succeed_request_invoke(self._database_name, url, response, request, attempt_num)
-                response_dispose = command.process_response(self._cache, response, url)
-                self._last_returned_response = datetime.datetime.utcnow()
-            finally:
-                if response_dispose == ResponseDisposeHandling.AUTOMATIC:
-                    response.close()
-                if len(refresh_tasks) > 0:
-                    try:
-                        wait(refresh_tasks, return_when=ALL_COMPLETED)
-                    except:
-                        raise
+                cached_item.not_modified()
+                self._statistics.record_not_modified()
+                if command.response_type == RavenCommandResponseType.OBJECT:
+                    start = time.perf_counter()
+                    command.set_response(cached_value, True)
+                    self._statistics.record_deserialization(time.perf_counter() - start)
+                if in_flight_read is not None:
+                    in_flight_read.set_result(response.status_code, cached_value)
+                return
+
+            if response.status_code >= 400:
+                if not self._handle_unsuccessful_response(
+                    chosen_node,
+                    node_index,
+                    command,
+                    request,
+                    response,
+                    url,
+                    session_info,
+                    should_retry,
+                ):
+                    db_missing_header = response.headers.get("Database-Missing", None)
+                    if db_missing_header is not None:
+                        raise DatabaseDoesNotExistException(db_missing_header)
+                    self._throw_failed_to_contact_all_nodes(command, request)
+                return  # we either handled this already in the unsuccessful response or we are throwing
+            self._on_succeed_request_invoke(self._database_name, url, response, request, attempt_num)
+            start = time.perf_counter()
+            response_dispose = command.process_response(self._cache, response, url)
+            self._statistics.record_deserialization(time.perf_counter() - start)
+            self._last_returned_response = datetime.datetime.utcnow()
+            if in_flight_read is not None and response.status_code != HTTPStatus.NO_CONTENT and response.content:
+                in_flight_read.set_result(response.status_code, response.content)
+        finally:
+            if response_dispose == ResponseDisposeHandling.AUTOMATIC:
+                response.close()
+            if len(refresh_tasks) > 0:
+                try:
+                    wait(refresh_tasks, return_when=ALL_COMPLETED)
+                except:
+                    raise
 
     def _refresh_if_needed(self, chosen_node: ServerNode, response: requests.Response) -> List[Future]:
         refresh_topology = response.headers.get(constants.Headers.REFRESH_TOPOLOGY, False)
@@ -608,17 +792,17 @@ class RequestExecutor:
         session_info: SessionInfo,
         request: requests.Request,
         url: str,
-    ) -> Optional[requests.Response]:
+    ) -> Tuple[CurrentIndexAndNode, Optional[requests.Response]]:
         try:
             self.number_of_server_requests += 1
             timeout = command.timeout if command.timeout else self.__default_timeout
 
             if not timeout:
-                return self.__send(chosen_node, command, session_info, request)
+                return self.__send(chosen_node, node_index, command, session_info, request)
 
             else:
                 try:
-                    return self.__send(chosen_node, command, session_info, request)
+                    return self.__send(chosen_node, node_index, command, session_info, request)
                 except requests.Timeout as t:
                     if not should_retry:
                         if command.failed_nodes is None:
@@ -631,7 +815,7 @@ class RequestExecutor:
                     ):
                         self._throw_failed_to_contact_all_nodes(command, request)
 
-                    return None
+                    return CurrentIndexAndNode(node_index, chosen_node), None
         except IOError as e:
             if not should_retry:
                 raise
@@ -641,29 +825,40 @@ class RequestExecutor:
             ):
                 self._throw_failed_to_contact_all_nodes(command, request)
 
-            return None
+            return CurrentIndexAndNode(node_index, chosen_node), None
 
     def __send(
-        self, chosen_node: ServerNode, command: RavenCommand, session_info: SessionInfo, request: requests.Request
-    ) -> requests.Response:
+        self,
+        chosen_node: ServerNode,
+        node_index: int,
+        command: RavenCommand,
+        session_info: SessionInfo,
+        request: requests.Request,
+    ) -> Tuple[CurrentIndexAndNode, requests.Response]:
         response: Optional[requests.Response] = None
+        responding_node = CurrentIndexAndNode(node_index, chosen_node)
 
+        start = time.perf_counter()
         if self.should_execute_on_all(chosen_node, command):
             response = self.__execute_on_all_to_figure_out_the_fastest(chosen_node, command)
+        elif self.conventions.hedge_read_requests and self.__can_hedge(command, request):
+            responding_node, response = self.__send_hedged(responding_node, command, request)
         else:
             response = command.send(self.http_session, request)
+        node = responding_node.current_node
+        self._record_request(node, command, request, response, time.perf_counter() - start)
 
         # PERF: The reason to avoid rechecking every time is that servers wont change so rapidly
         #       and therefore we dismish its cost by orders of magnitude just doing it
         #       once in a while. We dont care also about the potential race conditions that may happen
         #       here mainly because the idea is to have a lax mechanism to recheck that is at least
         #       orders of magnitude faster than currently.
-        if chosen_node.should_update_server_version():
+        if node.should_update_server_version():
             server_version = self.__try_get_server_version(response)
             if server_version is not None:
-                chosen_node.update_server_version(server_version)
+                node.update_server_version(server_version)
 
-        self._last_server_version = chosen_node.last_server_version
+        self._last_server_version = node.last_server_version
 
         if session_info and session_info.last_cluster_transaction_index:
             # if we reach here it means that sometime a cluster transaction has occurred against this database.
@@ -672,12 +867,12 @@ class RequestExecutor:
 
             if not self._last_server_version or self._last_server_version.lower() < "4.1":
                 raise ClientVersionMismatchException(
-                    f"The server on {chosen_node.url} has an old version and"
+                    f"The server on {node.url} has an old version and"
                     f" can't perform the command since this command dependent on"
                     f" a cluster transaction which this node doesn't support"
                 )
 
-        return response
+        return responding_node, response
 
     def choose_node_for_request(self, cmd: RavenCommand, session_info: SessionInfo) -> CurrentIndexAndNode:
         # When we disable topology updates we cannot rely on the node tag,
@@ -704,14 +899,14 @@ class RequestExecutor:
     def __unlikely_execute(
         self, command: RavenCommand, topology_update: Union[None, Future[None]], session_info: SessionInfo
     ) -> None:
-        self.__wait_for_topology_update(topology_update)
+        self._wait_for_topology_update(topology_update)
 
         current_index_and_node = self.choose_node_for_request(command, session_info)
         self.execute(
             current_index_and_node.current_node, current_index_and_node.current_index, command, True, session_info
         )
 
-    def __wait_for_topology_update(self, topology_update: Future[None]) -> None:
+    def _wait_for_topology_update(self, topology_update: Future[None]) -> None:
         try:
             if topology_update is None or topology_update.exception():
                 with self.__synchronized_lock:
@@ -778,17 +973,44 @@ class RequestExecutor:
 
     def _get_from_cache(
         self, command: RavenCommand, use_cache: bool, url: str
-    ) -> Tuple[HttpCache.ReleaseCacheItem, Optional[str], Optional[str]]:
+    ) -> Tuple[HttpCache.ReleaseCacheItem, Optional[str], Optional[bytes]]:
         if (
             use_cache
             and command.can_cache
             and command.is_read_request
             and command.response_type == RavenCommandResponseType.OBJECT
         ):
-            return self._cache.get(url)
+            cached_item, change_vector, cached_value = self._cache.get(url)
+            if cached_item.item is None:
+                self._statistics.record_cache_miss()
+            return cached_item, change_vector, cached_value
 
         return HttpCache.ReleaseCacheItem(), None, None
 
+    def _try_get_from_cache(
+        self, command: RavenCommand, cached_item: HttpCache.ReleaseCacheItem, cached_value: Optional[bytes]
+    ) -> bool:
+        aggressive_cache_options = self.aggressive_caching
+        if (
+            aggressive_cache_options is not None
+            and cached_item.age < aggressive_cache_options.duration
+            and not cached_item.might_have_been_modified
+            and command.can_cache_aggressively
+        ):
+            if ItemFlags.NOT_FOUND in cached_item.item.flags:
+                # if this is a cached delete, we only respect it if it _came_ from an aggressively cached
+                # block, otherwise, we'll run the request again
+                if ItemFlags.AGGRESSIVELY_CACHED in cached_item.item.flags:
+                    command.set_response(cached_value, True)
+                    self._statistics.record_cache_hit()
+                    return True
+            else:
+                command.set_response(cached_value, True)
+                self._statistics.record_cache_hit()
+                return True
+
+        return False
+
     @staticmethod
     def __try_get_server_version(response: requests.Response) -> Union[None, str]:
         server_version_header = response.headers.get(constants.Headers.SERVER_VERSION)
@@ -867,7 +1089,7 @@ class RequestExecutor:
                 single_element_list_number_failed_tasks: List[int],
             ) -> (RequestExecutor.IndexAndResponse, int):
                 try:
-                    request, str_ref = self.__create_request(nodes[task_number], command)
+                    request, str_ref = self._create_request(nodes[task_number], command)
                     self._set_request_headers(None, None, request)
                     return self.IndexAndResponse(task_number, command.send(self.http_session, request))
                 except Exception as e:
@@ -902,15 +1124,156 @@ class RequestExecutor:
 
         return preferred_task.result().response
 
+    def __can_hedge(self, command: RavenCommand, request: requests.Request) -> bool:
+        return (
+            self.__is_read_request(command)
+            and command.response_type == RavenCommandResponseType.OBJECT
+            and not command.selected_node_tag
+            and not isinstance(command, Broadcast)
+            # streamed bodies can't be sent twice
+            and (not request.data or isinstance(request.data, (str, bytes)))
+            and self._node_selector is not None
+            and len(self._node_selector.topology.nodes) > 1
+        )
+
+    def __send_hedged(
+        self, chosen_node: CurrentIndexAndNode, command: RavenCommand, request: requests.Request
+    ) -> Tuple[CurrentIndexAndNode, requests.Response]:
+        node = chosen_node.current_node
+        threshold = self.__node_latencies.get_percentile(node, self.conventions.hedge_read_requests_percentile)
+        hedge_node = self._node_selector.get_next_node(node)
+        if threshold is None or hedge_node is None:
+            # not enough samples to tell what is slow for this node yet
+            return chosen_node, self.__send_and_record_latency(node, command, request)
+
+        threshold = max(threshold, self.conventions.hedge_read_requests_min_delay.total_seconds())
+        # the primary send starts right away instead of queueing on the hedge pool, so only its own latency
+        # counts against the threshold; this thread stays free to take whichever node answers first
+        primary_task = Future()
+        primary_task.set_running_or_notify_cancel()
+        threading.Thread(
+            target=self.__run_send,
+            args=(primary_task, node, command, request),
+            name="hedged-request-primary",
+            daemon=True,
+        ).start()
+        try:
+            return chosen_node, primary_task.result(threshold)
+        except FutureTimeoutError:
+            pass
+
+        hedge_request = self._create_request(hedge_node.current_node, command)
+        # a saturated hedge pool means the cluster is slow as a whole, more requests won't help it
+        if hedge_request is None or not self.__hedge_slots.acquire(blocking=False):
+            return chosen_node, primary_task.result()
+
+        hedge_request.headers.update(request.headers)
+        self.number_of_server_requests += 1
+        self.number_of_hedged_requests += 1
+        try:
+            hedge_task = self.__hedge_executor.submit(
+                self.__send_and_record_latency, hedge_node.current_node, command, hedge_request
+            )
+        except BaseException:
+            self.__hedge_slots.release()
+            raise
+        hedge_task.add_done_callback(lambda _: self.__hedge_slots.release())
+
+        nodes = {primary_task: chosen_node, hedge_task: hedge_node}
+        pending = {primary_task, hedge_task}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [task for task in done if self.__is_hedge_winner(task)]
+            if not succeeded:
+                continue
+
+            # the slower response is read and thrown away, the connection goes back to the pool
+            for task in pending:
+                task.add_done_callback(self.__close_response)
+            for task in succeeded[1:]:
+                self.__close_response(task)
+            return nodes[succeeded[0]], succeeded[0].result()
+
+        # neither node answered well, report it the way a request to the chosen node alone would
+        if primary_task.exception() is None:
+            self.__close_response(hedge_task)
+            return chosen_node, primary_task.result()
+        if hedge_task.exception() is None:
+            return hedge_node, hedge_task.result()
+        raise primary_task.exception()
+
+    @staticmethod
+    def __is_hedge_winner(task: Future[requests.Response]) -> bool:
+        # a fast error from an unhealthy node must not beat a slower answer from a healthy one
+        if task.exception() is not None:
+            return False
+        status_code = task.result().status_code
+        return status_code < 400 or status_code == HTTPStatus.NOT_FOUND
+
+    def __run_send(
+        self, task: Future[requests.Response], node: ServerNode, command: RavenCommand, request: requests.Request
+    ) -> None:
+        try:
+            task.set_result(self.__send_and_record_latency(node, command, request))
+        except BaseException as e:
+            task.set_exception(e)
+
+    def __send_and_record_latency(
+        self, node: ServerNode, command: RavenCommand, request: requests.Request
+    ) -> requests.Response:
+        start = time.perf_counter()
+        response = command.send(self.http_session, request)
+        self.__node_latencies.record(node, time.perf_counter() - start)
+        return response
+
+    @staticmethod
+    def __close_response(task: Future[requests.Response]) -> None:
+        if task.exception() is None:
+            task.result().close()
+
+    def _create_request(self, node: ServerNode, command: RavenCommand) -> Optional[requests.Request]:
+        start = time.perf_counter()
+        try:
+            return self.__create_request(node, command)
+        finally:
+            self._statistics.record_serialization(time.perf_counter() - start)
+
     def __create_request(self, node: ServerNode, command: RavenCommand) -> Optional[requests.Request]:
+        command.json_codec = self.conventions.json_codec
         request = command.create_request(node)
+        if request is None:
+            return None  # e.g. multi-get answered entirely from the aggressive cache
+
         # todo: optimize that if - look for the way to make less ifs each time
-        if request.data and not isinstance(request.data, str) and not inspect.isgenerator(request.data):
-            request.data = json.dumps(request.data, default=self.conventions.json_default_method)
+        if (
+            request.data
+            and not isinstance(request.data, (str, bytes))
+            and not inspect.isgenerator(request.data)
+            and not inspect.isasyncgen(request.data)
+        ):
+            request.data = self.conventions.json_codec.dumps_bytes(request.data, self.conventions.json_default_method)
+
+        if self.conventions.use_compression and request.data:
+            self.__compress_request_body(request)
 
         # todo: 1117 - 1133
         return request or None
 
+    def __compress_request_body(self, request: requests.Request) -> None:
+        if constants.Headers.CONTENT_ENCODING in request.headers:
+            return  # already encoded by the command
+
+        if inspect.isgenerator(request.data):
+            request.data = HttpExtensions.gzip_compress_stream(request.data)
+        elif inspect.isasyncgen(request.data):
+            request.data = HttpExtensions.gzip_compress_async_stream(request.data)
+        elif isinstance(request.data, (str, bytes)) and len(request.data) >= self.__MIN_BODY_SIZE_TO_COMPRESS:
+            request.data = HttpExtensions.gzip_compress(request.data)
+        else:
+            return
+
+        request.headers[constants.Headers.CONTENT_ENCODING] = "gzip"
+
     def should_broadcast(self, command: RavenCommand) -> bool:
         if not isinstance(command, Broadcast):
             return False
@@ -921,6 +1284,67 @@ class RequestExecutor:
 
         return True
 
+    class InFlightRead:
+        def __init__(self, key: tuple):
+            self.key = key
+            self.leader_thread_id = threading.get_ident()
+            self.__done = threading.Event()
+            self.__status_code: Optional[int] = None
+            self.__payload: Optional[bytes] = None
+            self.__succeeded = False
+
+        def set_result(self, status_code: int, payload: Optional[bytes]) -> None:
+            self.__status_code = status_code
+            self.__payload = payload
+            self.__succeeded = True
+
+        def complete(self) -> None:
+            self.__done.set()
+
+        def apply_to(self, command: RavenCommand) -> bool:
+            self.__done.wait()
+            if not self.__succeeded:
+                return False
+
+            # each command parses the shared payload on its own - parsed results are mutable and end up in sessions
+            command.status_code = self.__status_code
+            command.set_response(self.__payload, False)
+            return True
+
+    @staticmethod
+    def __is_read_request(command: RavenCommand) -> bool:
+        is_read_request = command.is_read_request
+        return is_read_request() if callable(is_read_request) else is_read_request
+
+    def __can_coalesce(self, command: RavenCommand, request: requests.Request) -> bool:
+        return (
+            self.__is_read_request(command)
+            and command.response_type == RavenCommandResponseType.OBJECT
+            # commands processing the response on their own (headers, status codes) need a response of their own
+            and type(command).process_response is RavenCommand.process_response
+            and (not request.data or isinstance(request.data, (str, bytes)))
+        )
+
+    def __join_in_flight_read(
+        self, chosen_node: ServerNode, request: requests.Request
+    ) -> Tuple[RequestExecutor.InFlightRead, bool]:
+        key = (chosen_node.url, request.method, request.url, request.data or None)
+        with self.__in_flight_reads_lock:
+            in_flight_read = self.__in_flight_reads.get(key)
+            # a retry on the same thread must not wait for itself
+            if in_flight_read is not None and in_flight_read.leader_thread_id != threading.get_ident():
+                return in_flight_read, False
+
+            in_flight_read = RequestExecutor.InFlightRead(key)
+            self.__in_flight_reads[key] = in_flight_read
+            return in_flight_read, True
+
+    def __leave_in_flight_read(self, in_flight_read: RequestExecutor.InFlightRead) -> None:
+        with self.__in_flight_reads_lock:
+            if self.__in_flight_reads.get(in_flight_read.key) is in_flight_read:
+                del self.__in_flight_reads[in_flight_read.key]
+        in_flight_read.complete()
+
     class BroadcastState:
         def __init__(self, command: RavenCommand, index: int, node: ServerNode, request: requests.Request):
             self.command = command
@@ -1003,7 +1427,7 @@ class RequestExecutor:
         should_retry: bool,
     ) -> bool:
         if response.status_code == HTTPStatus.NOT_FOUND:
-            self._cache.set_not_found(url, False)  # todo : check if aggressively cached, don't just pass False
+            self._cache.set_not_found(url, self.aggressive_caching is not None)
             if command.response_type == RavenCommandResponseType.EMPTY:
                 return True
             elif command.response_type == RavenCommandResponseType.OBJECT:
@@ -1059,6 +1483,7 @@ class RequestExecutor:
 
                 command.failed_nodes.clear()
                 index_and_node = self.choose_node_for_request(command, session_info)
+                self._statistics.record_failover()
                 self.execute(index_and_node.current_node, index_and_node.current_index, command, False, session_info)
                 return True
 
@@ -1073,7 +1498,7 @@ class RequestExecutor:
             )
 
         elif response.status_code == HTTPStatus.CONFLICT:
-            data = json.loads(response.text)
+            data = self.conventions.json_codec.loads(response.content)
             message = data.get("Message", None)
             err_type = data.get("Type", None)
 
@@ -1095,6 +1520,7 @@ class RequestExecutor:
                 )
 
             next_node = self.choose_node_for_request(command, session_info)
+            self._statistics.record_failover()
             self.execute(next_node.current_node, next_node.current_index, command, True, session_info)
 
             if node_index is not None:
@@ -1104,7 +1530,7 @@ class RequestExecutor:
         else:
             command.on_response_failure(response)
             raise RuntimeError(
-                json.loads(response.text).get("Message", "Missing message")
+                self.conventions.json_codec.loads(response.content).get("Message", "Missing message")
             )  # todo: Exception dispatcher
 
         return False
@@ -1125,16 +1551,16 @@ class RequestExecutor:
 
             state.command.timeout = self.second_broadcast_attempt_timeout
 
-            # todo: aggressive caching options
+            aggressive_cache_options = self.aggressive_caching
 
             def __run_async() -> None:
-                # todo: aggressive caching options
+                old_value = self.aggressive_caching
+                self.aggressive_caching = aggressive_cache_options
                 try:
                     request = self.execute(state.node, None, state.command, False, session_info, True)
                     state.request = request
                 finally:
-                    # todo: aggressive_caching
-                    pass
+                    self.aggressive_caching = old_value
 
             task = self._thread_pool_executor.submit(__run_async)
             tasks[task] = state
@@ -1187,31 +1613,26 @@ class RequestExecutor:
 
         self.__on_failed_request_invoke(url, e, request, response)
 
+        self._statistics.record_failover()
         self.execute(
             index_node_and_etag.current_node, index_node_and_etag.current_index, command, should_retry, session_info
         )
 
         return True
 
-    @staticmethod
-    def __read_exception_from_server(request: requests.Request, response: requests.Response, e: Exception) -> Exception:
+    def __read_exception_from_server(
+        self, request: requests.Request, response: requests.Response, e: Exception
+    ) -> Exception:
         if response and response.content:
             response_json = None
             try:
                 response_json = response.content.decode("utf-8")
-
-                # todo: change this bs
-                def exception_schema_decoder(dictionary: dict) -> ExceptionDispatcher.ExceptionSchema:
-                    return ExceptionDispatcher.ExceptionSchema(
-                        dictionary.get("url"),
-                        dictionary.get("class"),
-                        dictionary.get("message"),
-                        dictionary.get("error"),
-                    )
-
-                return ExceptionDispatcher.get(
-                    json.loads(response_json, object_hook=exception_schema_decoder), response.status_code, e
+                data = self.conventions.json_codec.loads(response.content)
+                exception_schema = ExceptionDispatcher.ExceptionSchema(
+                    data.get("url"), data.get("class"), data.get("message"), data.get("error")
                 )
+
+                return ExceptionDispatcher.get(exception_schema, response.status_code, e)
             except:
                 exception_schema = ExceptionDispatcher.ExceptionSchema(
                     request.url,
@@ -1241,7 +1662,7 @@ class RequestExecutor:
 
     def _ensure_node_selector(self) -> None:
         if not self._disable_topology_updates:
-            self.__wait_for_topology_update(self._first_topology_update_task)
+            self._wait_for_topology_update(self._first_topology_update_task)
 
         if self._node_selector is None:
             topology = Topology(self.topology_etag, self.topology_nodes)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import bisect
+import copy
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class LatencyHistogram:
+    """
+    Counts durations (in seconds) into fixed buckets growing exponentially from 1 ms to 10 s.
+    Percentiles are estimated as the upper bound of the bucket they fall into.
+    """
+
+    BUCKET_BOUNDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if not self.count:
+            return None
+
+        rank = self.count * percentile / 100
+        cumulative = 0
+        for bound, count in zip(self.BUCKET_BOUNDS, self.bucket_counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        Cumulative (upper bound, count) pairs, the last one with infinite bound - the shape prometheus expects.
+        """
+        result = []
+        cumulative = 0
+        for bound, count in zip(self.BUCKET_BOUNDS + (float("inf"),), self.bucket_counts):
+            cumulative += count
+            result.append((bound, cumulative))
+        return result
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(count={self.count}, mean={self.mean}, p99={self.percentile(99)})"
+
+
+class RequestExecutorStatistics:
+    def __init__(self):
+        self.node_latencies: Dict[str, LatencyHistogram] = {}
+        self.command_latencies: Dict[str, LatencyHistogram] = {}
+        self.number_of_requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.not_modified = 0
+        self.retries = 0
+        self.failovers = 0
+        self.serialization_time = 0.0
+        self.network_time = 0.0
+        self.deserialization_time = 0.0
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(requests={self.number_of_requests}, sent={self.bytes_sent}, "
+            f"received={self.bytes_received}, cache_hits={self.cache_hits}, not_modified={self.not_modified}, "
+            f"cache_misses={self.cache_misses}, retries={self.retries}, failovers={self.failovers})"
+        )
+
+
+class RequestStatisticsCollector:
+    """
+    Collects statistics of requests sent by a request executor, get_statistics returns a snapshot of them.
+    """
+
+    def __init__(self):
+        self.__statistics = RequestExecutorStatistics()
+        self.__lock = threading.Lock()
+
+    def record_request(self, node_url: str, seconds: float, bytes_sent: int, bytes_received: int) -> None:
+        with self.__lock:
+            statistics = self.__statistics
+            histogram = statistics.node_latencies.get(node_url)
+            if histogram is None:
+                histogram = statistics.node_latencies[node_url] = LatencyHistogram()
+            histogram.record(seconds)
+            statistics.number_of_requests += 1
+            statistics.network_time += seconds
+            statistics.bytes_sent += bytes_sent
+            statistics.bytes_received += bytes_received
+
+    def record_command(self, command_name: str, seconds: float) -> None:
+        with self.__lock:
+            histogram = self.__statistics.command_latencies.get(command_name)
+            if histogram is None:
+                histogram = self.__statistics.command_latencies[command_name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def record_serialization(self, seconds: float) -> None:
+        with self.__lock:
+            self.__statistics.serialization_time += seconds
+
+    def record_deserialization(self, seconds: float) -> None:
+        with self.__lock:
+            self.__statistics.deserialization_time += seconds
+
+    def record_cache_hit(self) -> None:
+        with self.__lock:
+            self.__statistics.cache_hits += 1
+
+    def record_cache_miss(self) -> None:
+        with self.__lock:
+            self.__statistics.cache_misses += 1
+
+    def record_not_modified(self) -> None:
+        with self.__lock:
+            self.__statistics.not_modified += 1
+
+    def record_retry(self) -> None:
+        with self.__lock:
+            self.__statistics.retries += 1
+
+    def record_failover(self) -> None:
+        with self.__lock:
+            self.__statistics.failovers += 1
+
+    def get_statistics(self) -> RequestExecutorStatistics:
+        with self.__lock:
+            return copy.deepcopy(self.__statistics)
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__statistics = RequestExecutorStatistics()
@@ -5,8 +5,9 @@ import threading
 import time
 import uuid
 from abc import abstractmethod
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Deque
 from typing import Union, List, Dict
 
 from ravendb.exceptions.exceptions import (
@@ -149,7 +150,7 @@ class NodeSelector:
         server_nodes = state.nodes
         length = min(len(server_nodes), len(state_failures))
         for i in range(length):
-            if state_failures[0] == 0:
+            if state_failures[i] == 0:
                 return CurrentIndexAndNode(i, server_nodes[i])
         return cls.unlikely_everyone_faulted_choice(state)
 
@@ -194,6 +195,21 @@ class NodeSelector:
         self._switch_to_speed_test_phase()
         return self.get_preferred_node()
 
+    def get_next_node(self, node: ServerNode) -> Optional[CurrentIndexAndNode]:
+        state = self._state
+        server_nodes = state.nodes
+        index = next((i for i in range(len(server_nodes)) if server_nodes[i].url == node.url), None)
+        if index is None:
+            return None
+
+        for offset in range(1, len(server_nodes)):
+            i = (index + offset) % len(server_nodes)
+            # nodes read from the topology response keep the role as plain string
+            if state.failures[i] == 0 and str(server_nodes[i].server_role) == str(ServerNode.Role.MEMBER):
+                return CurrentIndexAndNode(i, server_nodes[i])
+
+        return None
+
     def restore_node_index(self, node_index: int) -> None:
         state = self._state
         if len(state.failures) <= node_index:
@@ -292,6 +308,34 @@ class CurrentIndexAndNodeAndEtag:
         self.etag = etag
 
 
+class NodeLatencies:
+    """
+    Keeps the latest response times of every node, hedged reads use them to tell a slow response from a usual one.
+    """
+
+    def __init__(self, max_samples: int = 128, min_samples: int = 16):
+        self.__max_samples = max_samples
+        self.__min_samples = min_samples
+        self.__samples: Dict[str, Deque[float]] = {}
+        self.__lock = threading.Lock()
+
+    def record(self, node: ServerNode, seconds: float) -> None:
+        with self.__lock:
+            samples = self.__samples.get(node.url)
+            if samples is None:
+                samples = self.__samples[node.url] = deque(maxlen=self.__max_samples)
+            samples.append(seconds)
+
+    def get_percentile(self, node: ServerNode, percentile: float) -> Optional[float]:
+        with self.__lock:
+            samples = self.__samples.get(node.url)
+            if samples is None or len(samples) < self.__min_samples:
+                return None
+            samples = sorted(samples)
+
+        return samples[min(len(samples) - 1, int(len(samples) * percentile / 100))]
+
+
 class NodeStatus:
     def __init__(
         self,
@@ -1,4 +1,3 @@
-import json
 from typing import TYPE_CHECKING, Set
 
 import requests
@@ -36,7 +35,7 @@ class AdminJsConsoleOperation(ServerOperation[dict]):
             return False
 
         def set_response(self, response: str, from_cache: bool) -> None:
-            self.result = json.loads(response)
+            self.result = self.json_codec.loads(response)
 
 
 class CreateSampleDataOperation(VoidMaintenanceOperation):
@@ -0,0 +1,59 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+
+class JsonCodec(ABC):
+    """
+    Encodes request bodies and decodes server responses. Set DocumentConventions.json_codec to switch the backend.
+    """
+
+    @abstractmethod
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        pass
+
+    def dumps_bytes(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return self.dumps(obj, default).encode("utf-8")
+
+    @abstractmethod
+    def loads(self, data: JsonInput) -> Any:
+        pass
+
+
+class StandardJsonCodec(JsonCodec):
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return json.dumps(obj, default=default)
+
+    def loads(self, data: JsonInput) -> Any:
+        # json detects utf-8 in bytes on its own, only memoryview needs a copy
+        return json.loads(data if not isinstance(data, memoryview) else data.tobytes())
+
+
+class OrjsonCodec(JsonCodec):
+    # datetime and dataclasses are left for the default method, orjson formats them differently than the server expects
+    _OPTIONS = (
+        (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS) if orjson else 0
+    )
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson package, install it with 'pip install ravendb[orjson]'")
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return self.dumps_bytes(obj, default).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return orjson.dumps(obj, default=default, option=self._OPTIONS)
+
+    def loads(self, data: JsonInput) -> Any:
+        return orjson.loads(data)
+
+
+DEFAULT_JSON_CODEC = StandardJsonCodec()
@@ -1,5 +1,4 @@
 import datetime
-import json
 import uuid
 from typing import Optional
 
@@ -35,7 +34,7 @@ class GetDatabaseTopologyCommand(RavenCommand):
             return
 
         # todo: that's pretty bad way to do that, replace with initialization function that take nested object types
-        self.result: Topology = Utils.initialize_object(json.loads(response), self._result_class, True)
+        self.result: Topology = Utils.initialize_object(self.json_codec.loads(response), self._result_class, True)
         node_list = []
         for node in self.result.nodes:
             node_list.append(Utils.initialize_object(node, ServerNode, True))
@@ -58,7 +57,7 @@ class GetClusterTopologyCommand(RavenCommand[ClusterTopologyResponse]):
         if response is None:
             super()._throw_invalid_response()
 
-        self.result: ClusterTopologyResponse = ClusterTopologyResponse.from_json(json.loads(response))
+        self.result: ClusterTopologyResponse = ClusterTopologyResponse.from_json(self.json_codec.loads(response))
 
     def is_read_request(self) -> bool:
         return True
@@ -93,7 +92,7 @@ class GetTcpInfoCommand(RavenCommand[TcpConnectionInfo]):
         if response is None:
             self._throw_invalid_response()
 
-        self.result = TcpConnectionInfo.from_json(json.loads(response))
+        self.result = TcpConnectionInfo.from_json(self.json_codec.loads(response))
 
     def is_read_request(self) -> bool:
         return True
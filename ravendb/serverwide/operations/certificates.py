@@ -248,7 +248,7 @@ class GetCertificateOperation(ServerOperation[CertificateDefinition]):
             if response is None:
                 return
 
-            certificates = GetCertificatesResponse.from_json(json.loads(response))
+            certificates = GetCertificatesResponse.from_json(self.json_codec.loads(response))
             if len(certificates.results) != 1:
                 self._throw_invalid_response()
 
@@ -280,7 +280,7 @@ class GetCertificatesOperation(ServerOperation[List[CertificateDefinition]]):
             if response is None:
                 return
 
-            certificates = GetCertificatesResponse.from_json(json.loads(response))
+            certificates = GetCertificatesResponse.from_json(self.json_codec.loads(response))
             self.result = certificates.results
 
 
@@ -314,7 +314,7 @@ class GetCertificateMetadataOperation(ServerOperation[CertificateMetadata]):
             if response is None:
                 return
 
-            results = json.loads(response)["Results"]
+            results = self.json_codec.loads(response)["Results"]
             results = list(map(CertificateMetadata.from_json, results))
 
             if len(results) != 1:
@@ -353,7 +353,7 @@ class GetCertificatesMetadataOperation(ServerOperation[List[CertificateMetadata]
             if response is None:
                 return
             self.result = []
-            for metadata in json.loads(response)["Results"]:
+            for metadata in self.json_codec.loads(response)["Results"]:
                 self.result.append(CertificateMetadata.from_json(metadata))
 
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import datetime
 import enum
-import json
 from abc import abstractmethod
 from typing import Generic, TypeVar, TYPE_CHECKING, Optional, List, Dict, Any
 import requests
@@ -16,7 +15,6 @@ from ravendb.http.raven_command import RavenCommand, VoidRavenCommand
 from ravendb.util.util import RaftIdGenerator
 from ravendb.http.topology import RaftCommand
 
-
 if TYPE_CHECKING:
     from ravendb.http.server_node import ServerNode
     from ravendb.http.request_executor import RequestExecutor
@@ -88,7 +86,7 @@ class GetServerWideOperationStateOperation(ServerOperation[dict]):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 return
-            self.result = json.loads(response)
+            self.result = self.json_codec.loads(response)
 
 
 class DatabasePutResult:
@@ -160,7 +158,7 @@ class CreateDatabaseOperation(ServerOperation):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 self._throw_invalid_response()
-            self.result = DatabasePutResult.from_json(json.loads(response))
+            self.result = DatabasePutResult.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return False
@@ -252,7 +250,7 @@ class DeleteDatabaseOperation(ServerOperation[DeleteDatabaseResult]):
             return request
 
         def set_response(self, response: str, from_cache: bool) -> None:
-            self.result = DeleteDatabaseResult.from_json(json.loads(response))
+            self.result = DeleteDatabaseResult.from_json(self.json_codec.loads(response))
 
 
 class BuildNumber:
@@ -288,7 +286,7 @@ class GetBuildNumberOperation(ServerOperation[BuildNumber]):
         def set_response(self, response: str, from_cache: bool) -> None:
             if response is None:
                 self._throw_invalid_response()
-            self.result = BuildNumber.from_json(json.loads(response))
+            self.result = BuildNumber.from_json(self.json_codec.loads(response))
 
 
 class GetDatabaseRecordOperation(ServerOperation[DatabaseRecordWithEtag]):
@@ -313,7 +311,7 @@ class GetDatabaseRecordOperation(ServerOperation[DatabaseRecordWithEtag]):
             if response is None:
                 self.result = None
                 return
-            self.result = DatabaseRecordWithEtag.from_json(json.loads(response))
+            self.result = DatabaseRecordWithEtag.from_json(self.json_codec.loads(response))
 
 
 class GetDatabaseNamesOperation(ServerOperation[List[str]]):
@@ -340,7 +338,7 @@ class GetDatabaseNamesOperation(ServerOperation[List[str]]):
             if response is None:
                 raise ValueError("Invalid response")
 
-            response = json.loads(response)
+            response = self.json_codec.loads(response)
 
             if "Databases" not in response:
                 raise ValueError("Invalid response")
@@ -446,7 +444,7 @@ class PromoteDatabaseNodeOperation(ServerOperation[DatabasePutResult]):
             if response is None:
                 self._throw_invalid_response()
 
-            self.result = DatabasePutResult.from_json(json.loads(response))
+            self.result = DatabasePutResult.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return False
@@ -484,7 +482,7 @@ class AddDatabaseNodeOperation(ServerOperation[DatabasePutResult]):
             if response is None:
                 self._throw_invalid_response()
 
-            self.result = DatabasePutResult.from_json(json.loads(response))
+            self.result = DatabasePutResult.from_json(self.json_codec.loads(response))
 
         def is_read_request(self) -> bool:
             return False
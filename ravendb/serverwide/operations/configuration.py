@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Optional, List, TYPE_CHECKING, Dict
 
 import requests
@@ -16,7 +15,6 @@ from ravendb.serverwide.operations.ongoing_tasks import IServerWideTask, ServerW
 from ravendb.tools.utils import Utils
 from ravendb.util.util import RaftIdGenerator
 
-
 if TYPE_CHECKING:
     from ravendb.documents.conventions import DocumentConventions
 
@@ -64,7 +62,7 @@ class PutServerWideBackupConfigurationOperation(
 
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
             self.result = PutServerWideBackupConfigurationOperation.PutServerWideBackupConfigurationResponse.from_json(
-                json.loads(response)
+                self.json_codec.loads(response)
             )
 
     class PutServerWideBackupConfigurationResponse(ServerWideTaskResponse):
@@ -91,7 +89,8 @@ class GetServerWideBackupConfigurationsOperation(ServerOperation[List[ServerWide
                 return
 
             self.result = [
-                ServerWideBackupConfiguration.from_json(result_json) for result_json in json.loads(response)["Results"]
+                ServerWideBackupConfiguration.from_json(result_json)
+                for result_json in self.json_codec.loads(response)["Results"]
             ]
 
 
@@ -125,7 +124,10 @@ class GetServerWideBackupConfigurationOperation(ServerOperation[ServerWideBackup
             if response is None:
                 return
 
-            results = [ServerWideBackupConfiguration.from_json(bc_json) for bc_json in json.loads(response)["Results"]]
+            results = [
+                ServerWideBackupConfiguration.from_json(bc_json)
+                for bc_json in self.json_codec.loads(response)["Results"]
+            ]
             if not results:
                 return
 
@@ -196,7 +198,7 @@ class GetDatabaseSettingsOperation(MaintenanceOperation[DatabaseSettings]):
                 self.result = None
                 return
 
-            self.result = DatabaseSettings.from_json(json.loads(response))
+            self.result = DatabaseSettings.from_json(self.json_codec.loads(response))
 
 
 class PutDatabaseSettingsOperation(VoidMaintenanceOperation):
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, TYPE_CHECKING, Optional
 
 import requests
@@ -59,7 +58,7 @@ class UpdateDocumentsCompressionConfigurationOperation(MaintenanceOperation[Docu
             if response is None:
                 self._throw_invalid_response()
 
-            self.result = DocumentCompressionConfigurationResult.from_json(json.loads(response))
+            self.result = DocumentCompressionConfigurationResult.from_json(self.json_codec.loads(response))
 
         def get_raft_unique_request_id(self) -> str:
             return RaftIdGenerator.new_id()
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import json
 from datetime import timedelta
 from enum import Enum
 from typing import Optional, Any, Dict, TYPE_CHECKING
@@ -71,7 +70,7 @@ class GetLogsConfigurationOperation(ServerOperation[GetLogsConfigurationResult])
             if response is None:
                 self._throw_invalid_response()
 
-            self.result = GetLogsConfigurationResult.from_json(json.loads(response))
+            self.result = GetLogsConfigurationResult.from_json(self.json_codec.loads(response))
 
 
 class SetLogsConfigurationOperation(VoidServerOperation):
@@ -1,10 +1,12 @@
 from ravendb.documents.indexes.definitions import IndexDefinition
 from ravendb.documents.operations.indexes import PutIndexesOperation
 from ravendb.tests.test_base import TestBase
-from ravendb.changes.observers import ActionObserver
+from ravendb.changes.observers import ActionObserver, DeliveryOptions, Observable, OverflowPolicy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import queue
 import unittest
-from threading import Event
+from threading import Event, Thread
 from time import sleep
 
 
@@ -183,6 +185,199 @@ class TestDatabaseChanges(TestBase):
 
         close_method()
 
+    def test_changes_reach_only_matching_observers(self):
+        changes = self.store.changes()
+        documents_by_id = {}
+        close_methods = []
+        for i in range(1, 51):
+            observer = changes.for_document(f"users/{i}")
+            close_methods.append(observer.subscribe(documents_by_id.setdefault(f"users/{i}", []).append))
+            observer.ensure_subscribe_now()
+
+        prefixed = []
+        observer = changes.for_documents_start_with("USERS/1")
+        close_methods.append(observer.subscribe(prefixed.append))
+        observer.ensure_subscribe_now()
+
+        with self.store.open_session() as session:
+            session.store(User("Idan"), key="Users/1")
+            session.store(User("Shalom"), key="users/2")
+            session.store(User("Oren"), key="users/10")
+            session.save_changes()
+
+        sleep(1)
+        self.assertEqual(["Users/1"], [document.key for document in documents_by_id["users/1"]])
+        self.assertEqual(["users/2"], [document.key for document in documents_by_id["users/2"]])
+        self.assertEqual(["users/10"], [document.key for document in documents_by_id["users/10"]])
+        self.assertEqual(3, sum(len(documents) for documents in documents_by_id.values()))
+        self.assertEqual({"Users/1", "users/10"}, {document.key for document in prefixed})
+
+        for close_method in close_methods:
+            close_method()
+
+    def test_slow_observer_does_not_hold_back_others(self):
+        release = Event()
+        slow_documents = []
+        slow_done = Event()
+        batches = []
+        batches_done = Event()
+        fast_documents = []
+        fast_done = Event()
+
+        def slow_on_next(value):
+            release.wait(10)
+            slow_documents.append(value)
+            if len(slow_documents) == 3:
+                slow_done.set()
+
+        def batched_on_next(batch):
+            batches.append(batch)
+            if sum(len(batch) for batch in batches) == 10:
+                batches_done.set()
+
+        def fast_on_next(value):
+            fast_documents.append(value)
+            if len(fast_documents) == 10:
+                fast_done.set()
+
+        observer = self.store.changes().for_all_documents()
+        close_slow = observer.subscribe(
+            slow_on_next, DeliveryOptions(max_queue_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        )
+        close_batched = observer.subscribe(batched_on_next, DeliveryOptions(batch_interval=timedelta(milliseconds=500)))
+        close_fast = observer.subscribe(fast_on_next)
+        observer.ensure_subscribe_now()
+
+        with self.store.open_session() as session:
+            for i in range(10):
+                session.store(User(f"user {i}"), key=f"users/{i}")
+            session.save_changes()
+
+        self.assertTrue(fast_done.wait(10))
+        self.assertTrue(batches_done.wait(10))
+        self.assertLess(len(batches), 10)
+
+        release.set()
+        self.assertTrue(slow_done.wait(10))
+        # the first change was being delivered, the queue kept only the last two
+        self.assertEqual(["users/0", "users/8", "users/9"], [document.key for document in slow_documents])
+
+        close_slow()
+        close_batched()
+        close_fast()
+
+    def test_coalesced_delivery_keeps_latest_change_per_key(self):
+        delivering = Event()
+        release = Event()
+        received = queue.Queue()
+
+        def on_next(value):
+            delivering.set()
+            release.wait(10)
+            received.put(value)
+
+        with ThreadPoolExecutor() as executor:
+            observable = Observable(executor=executor)(lambda change: True)
+            close = observable.subscribe(on_next, DeliveryOptions(overflow_policy=OverflowPolicy.COALESCE))
+
+            first = User("a")
+            observable.send(first)
+            self.assertTrue(delivering.wait(10))
+
+            # changes are coalesced by their name, the queue keeps the position of the first one
+            changes = [User("b"), User("a"), User("a"), User("b")]
+            for change in changes:
+                observable.send(change)
+            release.set()
+
+            self.assertEqual([first, changes[3], changes[2]], [received.get(timeout=10) for _ in range(3)])
+            self.assertTrue(received.empty())
+            close()
+
+    def test_blocking_delivery_holds_sender_until_observer_catches_up(self):
+        delivering = Event()
+        release = Event()
+        received = queue.Queue()
+
+        def on_next(value):
+            delivering.set()
+            release.wait(10)
+            received.put(value)
+
+        with ThreadPoolExecutor() as executor:
+            observable = Observable(executor=executor)(lambda change: True)
+            close = observable.subscribe(
+                on_next, DeliveryOptions(max_queue_size=1, overflow_policy=OverflowPolicy.BLOCK)
+            )
+
+            changes = [User(f"user {i}") for i in range(3)]
+            observable.send(changes[0])
+            self.assertTrue(delivering.wait(10))
+            observable.send(changes[1])
+
+            # the first change is being delivered and the second one fills the queue
+            sent = Event()
+            sender = Thread(target=lambda: (observable.send(changes[2]), sent.set()))
+            sender.start()
+            self.assertFalse(sent.wait(0.2))
+
+            release.set()
+            self.assertTrue(sent.wait(10))
+            sender.join()
+            self.assertEqual(changes, [received.get(timeout=10) for _ in range(3)])
+            close()
+
+    def test_batched_delivery_does_not_hold_executor_between_batches(self):
+        batches = queue.Queue()
+        received = Event()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            observable = Observable(executor=executor)(lambda change: True)
+            close_batched = observable.subscribe(batches.put, DeliveryOptions(batch_interval=timedelta(seconds=2)))
+            close_queued = observable.subscribe(lambda value: received.set(), DeliveryOptions())
+
+            change = User("a")
+            observable.send(change)
+
+            # the only executor thread isn't waiting for the batch interval to pass
+            self.assertTrue(received.wait(1))
+            self.assertEqual([change], batches.get(timeout=10))
+            close_batched()
+            close_queued()
+
+    def test_queued_observer_is_completed_after_queued_changes(self):
+        delivering = Event()
+        release = Event()
+        received = queue.Queue()
+
+        def on_next(value):
+            delivering.set()
+            release.wait(10)
+            received.put(value)
+
+        with ThreadPoolExecutor() as executor:
+            observable = Observable(executor=executor)(lambda change: True)
+            observer = ActionObserver(on_next=on_next, on_completed=lambda: received.put("completed"))
+            close = observable.subscribe_with_observer(observer, DeliveryOptions())
+
+            changes = [User("a"), User("b")]
+            for change in changes:
+                observable.send(change)
+            self.assertTrue(delivering.wait(10))
+
+            # the second change is still queued, the observer can't be completed before it's delivered
+            close()
+            self.assertTrue(received.empty())
+
+            release.set()
+            self.assertEqual(changes + ["completed"], [received.get(timeout=10) for _ in range(3)])
+
+            close_idle = observable.subscribe_with_observer(
+                ActionObserver(on_next=on_next, on_completed=lambda: received.put("completed")), DeliveryOptions()
+            )
+            close_idle()
+            self.assertEqual("completed", received.get(timeout=10))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+import datetime
+import time
+
+from ravendb.http.misc import AggressiveCacheMode
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestAggressiveCaching(TestBase):
+    def setUp(self):
+        super(TestAggressiveCaching, self).setUp()
+
+    def _store_user(self, name: str = "John"):
+        with self.store.open_session() as session:
+            session.store(User(name=name), "users/1")
+            session.save_changes()
+
+    def test_can_aggressively_cache_loads(self):
+        self._store_user()
+        request_executor = self.store.get_request_executor()
+
+        with self.store.aggressively_cache_for(datetime.timedelta(minutes=5), AggressiveCacheMode.DO_NOT_TRACK_CHANGES):
+            with self.store.open_session() as session:
+                session.load("users/1", User)
+
+            requests_before = request_executor.number_of_server_requests
+            for _ in range(5):
+                with self.store.open_session() as session:
+                    self.assertEqual("John", session.load("users/1", User).name)
+
+            self.assertEqual(requests_before, request_executor.number_of_server_requests)
+
+        with self.store.open_session() as session:
+            session.load("users/1", User)
+        self.assertEqual(requests_before + 1, request_executor.number_of_server_requests)
+
+    def test_can_aggressively_cache_not_found_documents(self):
+        request_executor = self.store.get_request_executor()
+
+        with self.store.aggressively_cache():
+            with self.store.open_session() as session:
+                self.assertIsNone(session.load("users/404", User))
+
+            requests_before = request_executor.number_of_server_requests
+            with self.store.open_session() as session:
+                self.assertIsNone(session.load("users/404", User))
+
+            self.assertEqual(requests_before, request_executor.number_of_server_requests)
+
+    def test_disable_aggressive_caching_goes_to_server(self):
+        self._store_user()
+        request_executor = self.store.get_request_executor()
+
+        with self.store.aggressively_cache():
+            with self.store.open_session() as session:
+                session.load("users/1", User)
+
+            with self.store.disable_aggressive_caching():
+                requests_before = request_executor.number_of_server_requests
+                with self.store.open_session() as session:
+                    session.load("users/1", User)
+
+                self.assertEqual(requests_before + 1, request_executor.number_of_server_requests)
+
+    def test_aggressive_cache_is_invalidated_by_document_changes(self):
+        self._store_user()
+
+        with self.store.aggressively_cache_for(datetime.timedelta(minutes=5)):
+            with self.store.open_session() as session:
+                self.assertEqual("John", session.load("users/1", User).name)
+
+            # make sure the cache listens to changes before the document is modified
+            self.store.changes().for_all_documents().ensure_subscribe_now()
+            self._store_user("Jane")
+
+            name = None
+            for _ in range(50):
+                with self.store.open_session() as session:
+                    name = session.load("users/1", User).name
+                if name == "Jane":
+                    break
+                time.sleep(0.1)
+
+            self.assertEqual("Jane", name)
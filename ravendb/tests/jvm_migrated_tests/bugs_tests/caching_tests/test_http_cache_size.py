@@ -0,0 +1,66 @@
+from ravendb import DocumentStore
+from ravendb.http.http_cache import HttpCache
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestHttpCacheSize(TestBase):
+    def setUp(self):
+        super(TestHttpCacheSize, self).setUp()
+
+    def test_evicts_least_recently_used_items_when_full(self):
+        cache = HttpCache(100)
+        for i in range(10):
+            cache.set(f"url/{i}", "cv", b"x" * 20)
+
+        self.assertLessEqual(cache.size_in_bytes, 100)
+        self.assertEqual(4, len(cache))
+        self.assertEqual(6, cache.number_of_evictions)
+
+        # touch the oldest entry, so the next insert evicts the one after it
+        self.assertIsNotNone(cache.get("url/6")[0].item)
+        cache.set("url/10", "cv", b"x" * 20)
+
+        self.assertIsNotNone(cache.get("url/6")[0].item)
+        self.assertIsNone(cache.get("url/7")[0].item)
+        self.assertEqual(2, cache.number_of_hits)
+        self.assertEqual(1, cache.number_of_misses)
+
+    def test_does_not_cache_items_bigger_than_max_size(self):
+        cache = HttpCache(100)
+        cache.set("url/1", "cv", b"x" * 20)
+        cache.set("url/2", "cv", b"x" * 200)
+
+        self.assertEqual(1, len(cache))
+        self.assertIsNone(cache.get("url/2")[0].item)
+        self.assertEqual(0, cache.number_of_evictions)
+
+    def test_request_executor_cache_honors_max_http_cache_size(self):
+        with self.store.open_session() as session:
+            for i in range(20):
+                session.store(User(name="x" * 100), f"users/{i}")
+            session.save_changes()
+
+        with DocumentStore(self.store.urls, self.store.database) as store:
+            # room for a few responses only
+            store.conventions.max_http_cache_size = 1000
+            urls = []
+            store.add_on_succeed_request(lambda args: urls.append(args.url))
+            store.initialize()
+
+            request_executor = store.get_request_executor()
+            self.assertEqual(1000, request_executor.cache.max_size)
+
+            for i in range(20):
+                with store.open_session() as session:
+                    session.load(f"users/{i}", User)
+
+            cache = request_executor.cache
+            self.assertLessEqual(cache.size_in_bytes, 1000)
+            self.assertGreater(cache.number_of_evictions, 0)
+            self.assertLess(len(cache), 20)
+
+            load_urls = [url for url in urls if "/docs?" in url]
+            self.assertEqual(20, len(load_urls))
+            # the oldest response was evicted, the latest one is still cached
+            self.assertIsNone(cache.get(load_urls[0])[0].item)
+            self.assertIsNotNone(cache.get(load_urls[-1])[0].item)
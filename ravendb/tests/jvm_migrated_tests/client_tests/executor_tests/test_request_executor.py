@@ -1,9 +1,40 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from ravendb import DocumentStore
+from ravendb.documents.commands.crud import GetDocumentsCommand
 from ravendb.documents.conventions import DocumentConventions
+from ravendb.documents.operations.statistics import GetStatisticsOperation
 from ravendb.exceptions.exceptions import DatabaseDoesNotExistException
 from ravendb.http.request_executor import RequestExecutor
 from ravendb.http.server_node import ServerNode
-from ravendb.http.topology import UpdateTopologyParameters
-from ravendb.tests.test_base import TestBase
+from ravendb.http.topology import UpdateTopologyParameters, NodeSelector, Topology
+from ravendb.tests.test_base import TestBase, User
+
+
+class SlowFirstSendCommand(GetDocumentsCommand):
+    def send(self, session: requests.Session, request: requests.Request) -> requests.Response:
+        # only the first node asked is slow, the hedged request to the other one is answered right away
+        if not getattr(self, "delayed", False):
+            self.delayed = True
+            time.sleep(2)
+        return super().send(session, request)
+
+
+class SlowFirstSendFailingHedgeCommand(GetDocumentsCommand):
+    def send(self, session: requests.Session, request: requests.Request) -> requests.Response:
+        # the first node asked is slow, the hedged request gets a fast error back
+        if not getattr(self, "delayed", False):
+            self.delayed = True
+            time.sleep(1)
+            return super().send(session, request)
+        response = requests.Response()
+        response.status_code = 503
+        response._content = b""
+        return response
 
 
 class TestRequestExecutor(TestBase):
@@ -22,3 +53,165 @@ class TestRequestExecutor(TestBase):
 
             with self.assertRaises(DatabaseDoesNotExistException):
                 executor.update_topology_async(update_topology_parameters).result()
+
+    def test_reuses_pooled_connections(self):
+        conventions = DocumentConventions()
+        conventions.http_max_connections_per_node = 2
+
+        with RequestExecutor.create(
+            self.store.urls, self.store.database, conventions, None, None, self.store.thread_pool_executor
+        ) as executor:
+            executor.update_topology_async(UpdateTopologyParameters(ServerNode(self.store.urls[0]))).result()
+
+            for _ in range(10):
+                executor.execute_command(GetStatisticsOperation().get_command(conventions))
+
+            statistics = executor.connection_pool_statistics[self.store.urls[0]]
+            self.assertEqual(2, statistics.max_connections)
+            self.assertEqual(1, statistics.connections_opened)
+            self.assertGreaterEqual(statistics.reused_connections, 9)
+
+    def test_coalesces_identical_concurrent_reads(self):
+        with self.store.open_session() as session:
+            session.store(User(name="John"), "users/1")
+            session.save_changes()
+
+        store = DocumentStore(self.store.urls, self.store.database)
+        store.conventions.coalesce_read_requests = True
+
+        leader_sending = threading.Event()
+        followers_started = threading.Barrier(50)
+
+        def hold_leader(args):
+            # the first load keeps its request open until every follower is loading the same document
+            if "/docs?" in args.url and not leader_sending.is_set():
+                leader_sending.set()
+                followers_started.wait(10)
+                time.sleep(0.5)
+
+        store.add_on_before_request(hold_leader)
+        store.initialize()
+
+        def load(follower: bool):
+            if follower:
+                followers_started.wait(10)
+            with store.open_session() as session:
+                return session.load("users/1", User)
+
+        try:
+            with ThreadPoolExecutor(max_workers=50) as executor:
+                leader = executor.submit(load, False)
+                self.assertTrue(leader_sending.wait(10))
+                followers = [executor.submit(load, True) for _ in range(49)]
+                users = [future.result() for future in [leader] + followers]
+
+            # every session gets its own entity, even when the response was shared
+            self.assertEqual(50, len({id(user) for user in users}))
+            self.assertTrue(all(user.name == "John" for user in users))
+
+            request_executor = store.get_request_executor()
+            self.assertGreater(request_executor.number_of_coalesced_requests, 0)
+            self.assertLess(request_executor.number_of_server_requests, 50)
+        finally:
+            store.close()
+
+    def test_does_not_hedge_reads_without_another_node(self):
+        with self.store.open_session() as session:
+            session.store(User(name="John"), "users/1")
+            session.save_changes()
+
+        store = DocumentStore(self.store.urls, self.store.database)
+        store.conventions.hedge_read_requests = True
+        store.initialize()
+
+        try:
+            for _ in range(50):
+                with store.open_session() as session:
+                    self.assertEqual("John", session.load("users/1", User).name)
+
+            self.assertEqual(0, store.get_request_executor().number_of_hedged_requests)
+        finally:
+            store.close()
+
+    def test_collects_request_statistics(self):
+        with self.store.open_session() as session:
+            session.store(User(name="John"), "users/1")
+            session.save_changes()
+
+        events = []
+        request_executor = self.store.get_request_executor()
+        request_executor.add_on_request_completed(events.append)
+        request_executor.reset_statistics()
+
+        for _ in range(2):
+            with self.store.open_session() as session:
+                session.load("users/1", User)
+
+        statistics = request_executor.statistics
+        self.assertEqual(2, statistics.number_of_requests)
+        self.assertEqual(1, statistics.not_modified)
+        self.assertEqual(2, statistics.command_latencies["GetDocumentsCommand"].count)
+        self.assertEqual(2, sum(histogram.count for histogram in statistics.node_latencies.values()))
+        self.assertGreater(statistics.bytes_received, 0)
+
+        self.assertEqual(2, len(events))
+        self.assertEqual("GetDocumentsCommand", events[0].command_name)
+        self.assertEqual(200, events[0].status_code)
+        self.assertEqual(304, events[1].status_code)
+
+    def test_hedges_read_delayed_by_chosen_node(self):
+        with self.store.open_session() as session:
+            session.store(User(name="John"), "users/1")
+            session.save_changes()
+
+        conventions = DocumentConventions()
+        conventions.hedge_read_requests = True
+
+        with RequestExecutor.create_for_single_node_without_configuration_updates(
+            self.store.urls[0], self.store.database, conventions, None, None, self.store.thread_pool_executor
+        ) as executor:
+            # two members of the same server, so the hedged request has somewhere to go
+            nodes = [
+                ServerNode(self.store.urls[0], self.store.database, tag, ServerNode.Role.MEMBER) for tag in ("A", "B")
+            ]
+            executor._node_selector = NodeSelector(Topology(-1, nodes), self.store.thread_pool_executor)
+
+            # the chosen node needs latency samples before anything is hedged
+            for _ in range(20):
+                executor.execute_command(GetDocumentsCommand.from_single_id("users/1"))
+            self.assertEqual(0, executor.number_of_hedged_requests)
+
+            command = SlowFirstSendCommand.from_single_id("users/1")
+            start = time.perf_counter()
+            executor.execute_command(command)
+
+            self.assertLess(time.perf_counter() - start, 2)
+            self.assertEqual(1, executor.number_of_hedged_requests)
+            self.assertEqual("John", command.result.results[0]["name"])
+
+    def test_hedged_read_does_not_accept_server_error(self):
+        with self.store.open_session() as session:
+            session.store(User(name="John"), "users/1")
+            session.save_changes()
+
+        conventions = DocumentConventions()
+        conventions.hedge_read_requests = True
+
+        with RequestExecutor.create_for_single_node_without_configuration_updates(
+            self.store.urls[0], self.store.database, conventions, None, None, self.store.thread_pool_executor
+        ) as executor:
+            nodes = [
+                ServerNode(self.store.urls[0], self.store.database, tag, ServerNode.Role.MEMBER) for tag in ("A", "B")
+            ]
+            executor._node_selector = NodeSelector(Topology(-1, nodes), self.store.thread_pool_executor)
+
+            for _ in range(20):
+                executor.execute_command(GetDocumentsCommand.from_single_id("users/1"))
+
+            command = SlowFirstSendFailingHedgeCommand.from_single_id("users/1")
+            start = time.perf_counter()
+            executor.execute_command(command)
+
+            self.assertGreaterEqual(time.perf_counter() - start, 1)
+            self.assertEqual(1, executor.number_of_hedged_requests)
+            self.assertEqual("John", command.result.results[0]["name"])
@@ -3,7 +3,8 @@ import datetime
 import queue
 import time
 import unittest
-from threading import Event, Semaphore
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event, Semaphore
 from typing import Optional, List
 
 from ravendb.documents.session.event_args import BeforeRequestEventArgs
@@ -163,6 +164,107 @@ class TestBasicSubscription(TestBase):
             self.assertEqual(27, ages[1])
             self.assertEqual(25, ages[2])
 
+    def test_should_stream_documents_larger_than_receive_buffer(self):
+        name = 'ąę{"\\}😀' * 50_000
+        with self.store.open_session() as session:
+            for i in range(3):
+                session.store(User(name=f"{name}{i}"), f"users/{i}")
+            session.save_changes()
+
+        key = self.store.subscriptions.create_for_class(User)
+        options = SubscriptionWorkerOptions(key)
+        options.receive_buffer_size = 1000
+
+        with self.store.subscriptions.get_subscription_worker(options, User) as subscription:
+            names = queue.Queue()
+            subscription.run(lambda batch: [names.put(item.result.name) for item in batch.items])
+
+            for i in range(3):
+                self.assertEqual(f"{name}{i}", names.get(timeout=self.reasonable_amount_of_time))
+
+    def test_can_process_items_in_parallel(self):
+        with self.store.open_session() as session:
+            for i in range(20):
+                session.store(User(age=i), f"users/{i}")
+            session.save_changes()
+
+        key = self.store.subscriptions.create_for_class(User)
+        options = SubscriptionWorkerOptions(key)
+        options.ignore_subscriber_errors = True
+
+        with self.store.subscriptions.get_subscription_worker(options, User) as subscription:
+            ages = queue.Queue()
+            acknowledged = Event()
+            subscription.add_after_acknowledgment(lambda batch: acknowledged.set())
+
+            def __process_item(item: SubscriptionBatch.Item[User]):
+                if item.result.age == 7:
+                    raise ValueError("failing item")
+                ages.put(item.result.age)
+
+            subscription.run_items(__process_item, 4)
+
+            received = sorted(ages.get(timeout=self.reasonable_amount_of_time) for _ in range(19))
+            self.assertEqual([age for age in range(20) if age != 7], received)
+            self.assertTrue(acknowledged.wait(self.reasonable_amount_of_time))
+
+    def test_concurrent_readers_get_the_same_result(self):
+        with self.store.open_session() as session:
+            for i in range(20):
+                session.store(User(age=i), f"users/{i}")
+            session.save_changes()
+
+        key = self.store.subscriptions.create_for_class(User)
+        options = SubscriptionWorkerOptions(key)
+
+        with self.store.subscriptions.get_subscription_worker(options, User) as subscription:
+            results = queue.Queue()
+            readers = 8
+
+            def __run(batch: SubscriptionBatch):
+                start = Barrier(readers)
+
+                def __read_all():
+                    # every reader hits the not yet converted items at the same time
+                    start.wait()
+                    return [item.result for item in batch.items]
+
+                with ThreadPoolExecutor(readers) as executor:
+                    reads = [executor.submit(__read_all) for _ in range(readers)]
+                    results.put([read.result() for read in reads])
+
+            subscription.run(__run)
+
+            reads = results.get(timeout=self.reasonable_amount_of_time)
+            for entities in zip(*reads):
+                self.assertEqual(1, len({id(entity) for entity in entities}))
+            self.assertEqual(list(range(len(reads[0]))), sorted(entity.age for entity in reads[0]))
+
+    def test_can_skip_entity_conversion(self):
+        with self.store.open_session() as session:
+            session.store(User(name="John", age=31), "users/1")
+            session.save_changes()
+
+        key = self.store.subscriptions.create_for_class(User)
+        options = SubscriptionWorkerOptions(key, skip_entity_conversion=True)
+
+        with self.store.subscriptions.get_subscription_worker(options, User) as subscription:
+            results = queue.Queue()
+
+            def __run(batch: SubscriptionBatch):
+                for item in batch.items:
+                    results.put(item.result)
+                    with batch.open_session() as session:
+                        results.put(session.load(item.key, User))
+
+            subscription.run(__run)
+
+            raw = results.get(timeout=self.reasonable_amount_of_time)
+            loaded = results.get(timeout=self.reasonable_amount_of_time)
+            self.assertEqual("John", raw["name"])
+            self.assertIsInstance(loaded, User)
+            self.assertEqual(31, loaded.age)
+
     def test_can_update_subscription_by_id(self):
         subscription_creation_options = SubscriptionCreationOptions("Created", "from Users")
         self.store.subscriptions.create_for_options(subscription_creation_options)
@@ -2,6 +2,7 @@ import datetime
 import time
 
 from ravendb import MetadataAsDictionary
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions
 from ravendb.primitives import constants
 from ravendb.exceptions.documents.bulkinsert import BulkInsertAbortedException
 from ravendb.tests.test_base import TestBase
@@ -44,6 +45,44 @@ class TestBulkInserts(TestBase):
             self.assertEqual("Mega John", doc3.name)
             self.assertEqual("Mega Jane", doc4.name)
 
+    def test_simple_bulk_insert_with_compression_should_work(self):
+        with self.store.bulk_insert(options=BulkInsertOptions(use_compression=True)) as bulk_insert:
+            for i in range(1000):
+                bulk_insert.store(FooBar(f"John Doe {i}"))
+
+        with self.store.open_session() as session:
+            self.assertEqual("John Doe 0", session.load("FooBars/1-A", FooBar).name)
+            self.assertEqual("John Doe 999", session.load("FooBars/1000-A", FooBar).name)
+
+    def test_bulk_insert_spanning_multiple_buffers_with_escaped_ids(self):
+        with self.store.bulk_insert() as bulk_insert:
+            for i in range(5000):
+                bulk_insert.store_as(FooBar("x" * 500), f'foobars/"quoted"\\{i}')
+
+        with self.store.open_session() as session:
+            self.assertEqual("x" * 500, session.load('foobars/"quoted"\\4999', FooBar).name)
+
+    def test_bulk_insert_with_single_buffer_in_flight(self):
+        with self.store.bulk_insert(options=BulkInsertOptions(max_buffers_in_flight=1)) as bulk_insert:
+            for i in range(5000):
+                bulk_insert.store(FooBar("y" * 1000))
+
+        with self.store.open_session() as session:
+            self.assertEqual("y" * 1000, session.load("FooBars/5000-A", FooBar).name)
+
+        with self.assertRaises(ValueError):
+            BulkInsertOptions(max_buffers_in_flight=0)
+
+    def test_parallel_bulk_insert_should_work(self):
+        with self.store.parallel_bulk_insert(number_of_streams=3) as bulk_insert:
+            self.assertEqual(3, bulk_insert.number_of_streams)
+            keys = [bulk_insert.store(FooBar(f"John Doe {i}")) for i in range(300)]
+
+        self.assertEqual(300, len(set(keys)))
+        with self.store.open_session() as session:
+            foo_bars = session.load(keys, FooBar)
+            self.assertEqual(300, len([foo_bar for foo_bar in foo_bars.values() if foo_bar is not None]))
+
     def test_should_not_accept_ids_ending_with_pipe_line(self):
         with self.store.bulk_insert() as bulk_insert:
             self.assertRaisesWithMessage(
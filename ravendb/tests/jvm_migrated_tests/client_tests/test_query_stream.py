@@ -0,0 +1,84 @@
+import io
+import json
+
+from ravendb.documents.session.query import StreamQueryStatistics
+from ravendb.infrastructure.orders import Employee
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestQueryStream(TestBase):
+    def setUp(self):
+        super().setUp()
+
+    def _insert_users(self, count: int):
+        with self.store.open_session() as session:
+            for i in range(count):
+                session.store(User(f"user{i}", i), f"users/{i}")
+            session.save_changes()
+
+    def test_can_stream_query_results(self):
+        self._insert_users(200)
+        self.wait_for_indexing(self.store)
+
+        with self.store.open_session() as session:
+            stats_holder = []
+            query = session.query(object_type=User)
+            results = list(session.advanced.stream(query, stats_holder.append))
+
+            self.assertEqual(200, len(results))
+            for result in results:
+                self.assertIsInstance(result.document, User)
+                self.assertTrue(result.key.startswith("users/"))
+                self.assertIsNotNone(result.change_vector)
+                self.assertEqual(result.key, result.metadata["@id"])
+
+            stats: StreamQueryStatistics = stats_holder[0]
+            self.assertEqual(200, stats.total_results)
+            self.assertIsNotNone(stats.index_name)
+
+            # streamed entities are never tracked by the session
+            self.assertFalse(session.advanced.is_loaded("users/0"))
+
+    def test_can_stream_raw_query_results(self):
+        self._insert_users(10)
+
+        with self.store.open_session() as session:
+            query = session.advanced.raw_query("from Users where age >= 5", User)
+            names = sorted(result.document.name for result in session.advanced.stream(query))
+            self.assertEqual([f"user{i}" for i in range(5, 10)], names)
+
+    def test_stream_invokes_after_stream_executed_listener(self):
+        self._insert_users(5)
+
+        with self.store.open_session() as session:
+            streamed = []
+            query = session.query(object_type=User).add_after_stream_executed_listener(streamed.append)
+            for _ in session.advanced.stream(query):
+                pass
+
+            self.assertEqual(5, len(streamed))
+
+    def test_can_stream_documents_starting_with(self):
+        with self.store.open_session() as session:
+            for i in range(30):
+                session.store(Employee(first_name=f"employee{i}"), f"employees/{i}")
+            session.store(User("not an employee"), "users/1")
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            results = list(session.advanced.stream_starting_with(Employee, "employees/"))
+            self.assertEqual(30, len(results))
+            self.assertTrue(all(isinstance(result.document, Employee) for result in results))
+
+            paged = list(session.advanced.stream_starting_with(Employee, "employees/", start=10, page_size=5))
+            self.assertEqual(5, len(paged))
+
+    def test_can_stream_query_into_output(self):
+        self._insert_users(20)
+
+        with self.store.open_session() as session:
+            output = io.BytesIO()
+            session.advanced.stream_into(session.query(object_type=User), output)
+
+            json_node = json.loads(output.getvalue().decode("utf-8"))
+            self.assertEqual(20, len(json_node["Results"]))
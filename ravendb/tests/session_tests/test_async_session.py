@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions
+from ravendb.documents.store.async_document_store import AsyncDocumentStore
+from ravendb.http import async_request_executor
+from ravendb.tests.test_base import TestBase
+
+
+class User:
+    def __init__(self, name: str = None, age: int = None):
+        self.name = name
+        self.age = age
+
+
+@unittest.skipIf(async_request_executor.aiohttp is None, "aiohttp is not installed")
+class TestAsyncSession(TestBase):
+    def setUp(self):
+        super(TestAsyncSession, self).setUp()
+        with self.store.open_session() as session:
+            session.store(User("John", 30), "users/1")
+            session.store(User("Jane", 25), "users/2")
+            session.save_changes()
+
+    def _run(self, test):
+        async def run():
+            async with AsyncDocumentStore(self.store.urls, self.store.database) as store:
+                store.initialize()
+                await test(store)
+
+        asyncio.run(run())
+
+    def test_load_and_save_changes(self):
+        async def test(store: AsyncDocumentStore):
+            async with store.open_session() as session:
+                john = await session.load("users/1", User)
+                self.assertEqual("John", john.name)
+                self.assertIsNone(await session.load("users/404", User))
+
+                john.age = 31
+                await session.store(User("Bob", 40), "users/3")
+                await session.save_changes()
+                self.assertFalse(session.has_changes())
+
+        self._run(test)
+
+        with self.store.open_session() as session:
+            self.assertEqual(31, session.load("users/1", User).age)
+            self.assertEqual("Bob", session.load("users/3", User).name)
+
+    def test_query(self):
+        async def test(store: AsyncDocumentStore):
+            async with store.open_session() as session:
+                users = await session.to_list(session.query(object_type=User).wait_for_non_stale_results())
+                self.assertEqual({"John", "Jane"}, {user.name for user in users})
+
+                jane = await session.single(session.query(object_type=User).where_equals("name", "Jane"))
+                self.assertEqual(25, jane.age)
+
+                self.assertEqual(2, await session.count(session.query(object_type=User)))
+
+        self._run(test)
+
+    def test_concurrent_sessions(self):
+        async def load(store: AsyncDocumentStore, key: str):
+            async with store.open_session() as session:
+                return await session.load(key, User)
+
+        async def test(store: AsyncDocumentStore):
+            users = await asyncio.gather(*[load(store, f"users/{i % 2 + 1}") for i in range(20)])
+            self.assertEqual(20, len(users))
+            self.assertEqual({"John", "Jane"}, {user.name for user in users})
+
+        self._run(test)
+
+    def test_bulk_insert(self):
+        async def test(store: AsyncDocumentStore):
+            async with store.bulk_insert(options=BulkInsertOptions(use_compression=True)) as bulk_insert:
+                for i in range(1000):
+                    await bulk_insert.store_as(User(f"user {i}", i), f"bulk/{i}")
+
+        self._run(test)
+
+        with self.store.open_session() as session:
+            self.assertEqual(999, session.load("bulk/999", User).age)
@@ -1,7 +1,10 @@
+import unittest
 from typing import Type, Any
 
 from ravendb import DocumentStore
 from ravendb.infrastructure.orders import Company
+from ravendb.json import codec
+from ravendb.json.codec import OrjsonCodec
 from ravendb.tests.test_base import TestBase
 
 
@@ -38,3 +41,23 @@ class TestConventions(TestBase):
             self.assertIsNone(non_existing_company)
             self.assertEqual("Borpa Corp", custom_id_field_company.name)
             self.assertEqual("Poissoncorp", regular_company.name)
+
+    @unittest.skipIf(codec.orjson is None, "orjson is not installed")
+    def test_orjson_codec(self):
+        store = DocumentStore(self.store.urls, self.store.database)
+        store.conventions.json_codec = OrjsonCodec()
+        store.initialize()
+
+        try:
+            with store.open_session() as session:
+                session.store(Company(name="Zażółć Corp", Id="companies/1"))
+                session.save_changes()
+
+            with store.open_session() as session:
+                self.assertEqual("Zażółć Corp", session.load("companies/1", Company).name)
+                self.assertEqual(1, len(list(session.query(object_type=Company))))
+
+            with self.store.open_session() as session:
+                self.assertEqual("Zażółć Corp", session.load("companies/1", Company).name)
+        finally:
+            store.close()
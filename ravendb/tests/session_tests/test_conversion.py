@@ -1,3 +1,6 @@
+import json
+from enum import Enum
+
 from ravendb.documents.session.event_args import BeforeStoreEventArgs
 from ravendb.tests.test_base import TestBase
 from datetime import datetime, timedelta
@@ -52,3 +55,74 @@ class TestConversion(TestBase):
         with self.store.open_session() as session:
             time = session.load("item/1", object_type=Item)
             self.assertEqual(2, time.val)
+
+    def test_entity_to_dict_matches_json_round_trip(self):
+        class Color(Enum):
+            RED = "red"
+
+        class Holder(object):
+            def __init__(self):
+                self.item = Item((1, 2))
+                self.color = Color.RED
+                self.when = datetime(2020, 1, 1)
+                self.int_keys = {1: "one"}
+                self.tags = {"a"}
+
+        holder = Holder()
+        default = self.store.conventions.json_default_method
+        self.assertEqual(json.loads(json.dumps(holder, default=default)), Utils.entity_to_dict(holder, default))
+
+    def test_entity_to_dict_rejects_circular_reference(self):
+        item = Item(None)
+        item.val = [item]
+        shared = Item(1)
+
+        default = self.store.conventions.json_default_method
+        with self.assertRaises(ValueError):
+            Utils.entity_to_dict(item, default)
+        self.assertEqual([{"val": 1}, {"val": 1}], Utils.entity_to_dict([shared, shared], default))
+
+    def test_initialize_object_reuses_init_introspection(self):
+        for val in range(3):
+            item = Utils.initialize_object({"val": val, "unknown": True}, Item)
+            self.assertEqual(val, item.val)
+            self.assertFalse(hasattr(item, "unknown"))
+
+        time = Utils.initialize_object({"td": "00:00:01"}, Time)
+        self.assertEqual("00:00:01", time.td)
+        self.assertIsNone(time.dt)
+
+    def test_loaded_entity_does_not_share_containers_with_tracked_document(self):
+        with self.store.open_session() as session:
+            session.store(Item({"tags": ["a"]}), "item/2")
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            item = session.load("item/2", object_type=Item)
+            self.assertFalse(session.has_changes())
+
+            item.val["tags"].append("b")
+            self.assertTrue(session.advanced.has_changed(item))
+
+        document = {"name": "John", "tags": ["a", {"b": 1}], "@metadata": {"@id": "items/1"}}
+        copy = Utils.copy_json(document)
+        self.assertEqual(document, copy)
+        self.assertIsNot(document["tags"], copy["tags"])
+        self.assertIsNot(document["tags"][1], copy["tags"][1])
+        self.assertIs(document["name"], copy["name"])
+
+    def test_loaded_document_is_kept_serialized(self):
+        with self.store.open_session() as session:
+            session.store(Item({"tags": ["a"]}), "item/3")
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            item = session.load("item/3", object_type=Item)
+            document_info = session.documents_by_id.get_value("item/3")
+            self.assertTrue(document_info.is_document_frozen)
+            self.assertIs(document_info.metadata, document_info.document["@metadata"])
+            self.assertEqual({"tags": ["a"]}, document_info.document["val"])
+
+            item.val["tags"].append("b")
+            self.assertEqual({"tags": ["a"]}, document_info.document["val"])
+            self.assertTrue(session.advanced.has_changed(item))
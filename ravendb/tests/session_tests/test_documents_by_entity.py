@@ -13,6 +13,14 @@ class TestData:
     data: str
 
 
+@dataclass(eq=True)
+class HashableData:
+    data: str
+
+    def __hash__(self):
+        return hash(self.data)
+
+
 class TestDocumentsByEntity(TestBase):
     def setUp(self):
         super(TestDocumentsByEntity, self).setUp()
@@ -71,3 +79,28 @@ class TestDocumentsByEntity(TestBase):
             self.assertEqual(0, len(session._documents_by_entity))
 
             session.save_changes()
+
+    def test_documents_by_entity_uses_identity(self):
+        with self.store.open_session() as session:
+            first, second = HashableData("same"), HashableData("same")
+            session.store(first, "hashable/1")
+            session.store(second, "hashable/2")
+
+            self.assertEqual(2, len(session._documents_by_entity))
+            self.assertEqual("hashable/1", session._documents_by_entity.get(first).key)
+            self.assertEqual("hashable/2", session._documents_by_entity.get(second).key)
+            self.assertNotIn(HashableData("same"), session._documents_by_entity)
+
+    def test_store_in_before_store(self):
+        with self.store.open_session() as session:
+
+            def before_store(args):
+                if args.document_id == "data/1":
+                    session.store(Data("stored by event"), "data/2")
+
+            session.add_before_store(before_store)
+            session.store(Data("first"), "data/1")
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual("stored by event", session.load("data/2", Data).data)
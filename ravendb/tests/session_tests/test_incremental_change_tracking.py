@@ -0,0 +1,85 @@
+from ravendb.documents.session.entity_write_tracker import EntityWriteTracker
+from ravendb.documents.session.misc import SessionOptions
+from ravendb.tests.test_base import TestBase
+
+
+class Person:
+    def __init__(self, name: str = None, tags: list = None):
+        self.name = name
+        self.tags = tags
+
+
+class Employee(Person):
+    def __init__(self, name: str = None, tags: list = None, company: str = None):
+        super().__init__(name, tags)
+        self.company = company
+
+
+class TestIncrementalChangeTracking(TestBase):
+    def setUp(self):
+        super(TestIncrementalChangeTracking, self).setUp()
+        with self.store.open_session() as session:
+            session.store(Person("John", ["a"]), "people/1")
+            session.store(Person("Jane", ["b"]), "people/2")
+            session.save_changes()
+
+    def _open_session(self):
+        return self.store.open_session(session_options=SessionOptions(incremental_change_tracking=True))
+
+    def test_detects_attribute_assignments(self):
+        with self._open_session() as session:
+            john = session.load("people/1", Person)
+            session.load("people/2", Person)
+            self.assertFalse(session.has_changes())
+
+            john.name = "Johnny"
+            self.assertTrue(session.has_changes())
+
+            john.name = "John"
+            self.assertFalse(session.has_changes())
+
+            john.name = "Johnny"
+            session.save_changes()
+            self.assertFalse(session.has_changes())
+
+        with self.store.open_session() as session:
+            self.assertEqual("Johnny", session.load("people/1", Person).name)
+            self.assertEqual("Jane", session.load("people/2", Person).name)
+
+    def test_in_place_changes_have_to_be_marked(self):
+        with self._open_session() as session:
+            john = session.load("people/1", Person)
+            john.tags.append("c")
+            self.assertFalse(session.has_changes())
+
+            session.advanced.mark_as_changed(john)
+            self.assertTrue(session.has_changes())
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(["a", "c"], session.load("people/1", Person).tags)
+
+    def test_stored_entities_are_saved(self):
+        with self._open_session() as session:
+            session.store(Person("Bob"), "people/3")
+            self.assertTrue(session.has_changes())
+            session.save_changes()
+            self.assertFalse(session.has_changes())
+
+        with self.store.open_session() as session:
+            self.assertEqual("Bob", session.load("people/3", Person).name)
+
+    def test_subclass_of_instrumented_class_reports_write_once(self):
+        tracker = EntityWriteTracker()
+        tracker.watch(Person("John"))
+
+        employee = Employee("Jane")
+        tracker.watch(employee)
+
+        notifications = []
+        mark_dirty = tracker.mark_dirty
+        tracker.mark_dirty = lambda entity: (notifications.append(entity), mark_dirty(entity))
+        employee.company = "Hibernating Rhinos"
+
+        self.assertEqual([employee], notifications)
+        self.assertTrue(tracker.is_dirty(employee))
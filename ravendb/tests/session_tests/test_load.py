@@ -1,3 +1,7 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from ravendb import DocumentStore
 from ravendb.exceptions.exceptions import InvalidOperationException
 from ravendb.tests.test_base import TestBase
 from dataclasses import dataclass
@@ -130,6 +134,64 @@ class TestLoad(TestBase):
         self.assertEqual(1, session.number_of_requests)
         self.assertEqual("some_product", product.name)
 
+    def test_load_batching(self):
+        with self.store.open_session() as session:
+            for i in range(20):
+                session.store(Product(f"products/batched/{i}", f"product {i}"))
+            session.save_changes()
+
+        with DocumentStore(self.store.urls, self.store.database) as store:
+            store.conventions.load_batch_window = datetime.timedelta(milliseconds=50)
+            store.initialize()
+
+            def load(i: int):
+                with store.open_session() as session:
+                    product = session.load(f"products/batched/{i % 20}", Product)
+                    self.assertIsNone(session.load(f"products/missing/{i}", Product))
+                    return product.name
+
+            with ThreadPoolExecutor(20) as executor:
+                names = list(executor.map(load, range(40)))
+
+            self.assertEqual([f"product {i % 20}" for i in range(40)], names)
+            self.assertEqual(80, store.load_batcher.number_of_batched_loads)
+            self.assertLess(store.load_batcher.number_of_batches, 80)
+
+    def test_aggressively_cached_loads_are_not_batched(self):
+        with self.store.open_session() as session:
+            session.store(Product("products/cached", "cached"))
+            session.save_changes()
+
+        with DocumentStore(self.store.urls, self.store.database) as store:
+            store.conventions.load_batch_window = datetime.timedelta(milliseconds=50)
+            store.initialize()
+
+            request_executor = store.get_request_executor()
+            with store.aggressively_cache():
+                with store.open_session() as session:
+                    self.assertEqual("cached", session.load("products/cached", Product).name)
+
+                requests_before = request_executor.number_of_server_requests
+                with store.open_session() as session:
+                    self.assertEqual("cached", session.load("products/cached", Product).name)
+
+            self.assertEqual(requests_before, request_executor.number_of_server_requests)
+            self.assertEqual(0, store.load_batcher.number_of_batched_loads)
+
+    def test_load_ignores_id_case(self):
+        with self.store.open_session() as session:
+            session.store(Product("products/Mixed-Case", "mixed"))
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            product = session.load("PRODUCTS/mixed-case", Product)
+            self.assertIs(product, session.load("products/MIXED-case", Product))
+            self.assertIsNone(session.load("products/Missing", Product))
+            self.assertIsNone(session.load("PRODUCTS/MISSING", Product))
+            self.assertEqual(2, session.number_of_requests)
+            self.assertIn("products/mixed-case", session.documents_by_id)
+            self.assertEqual(["products/Mixed-Case"], list(session.documents_by_id.keys()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import enum
 import time
-from typing import Optional, Dict, Generic, Tuple, TypeVar, Collection, List, Union, Type, TYPE_CHECKING
+from typing import Optional, Dict, Generic, Tuple, TypeVar, Collection, List, Union, Type, TYPE_CHECKING, Set
 
 from ravendb.primitives import constants
 from ravendb.exceptions import exceptions
@@ -10,13 +10,14 @@ from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 import OpenSSL.crypto
 
 try:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Sequence, MutableMapping, MutableSet
 except ImportError:
-    from collections import Iterable, Sequence
+    from collections import Iterable, Sequence, MutableMapping, MutableSet
 
 from ravendb.tools.projection import create_entity_with_mapper
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from threading import Timer
 from copy import deepcopy
 import urllib
@@ -244,6 +245,133 @@ class CaseInsensitiveSet(set):
             self.add(v)
 
 
+class CaseInsensitiveMap(MutableMapping, Generic[_TKey, _TVal]):
+    """
+    Mapping with case-insensitive str keys, meant for session state which is looked up on every load and store.
+    Values are kept under the lowered key, the original key is stored once beside it - iteration and keys()
+    return the original keys without rebuilding anything.
+    """
+
+    __slots__ = ("_values", "_keys")
+
+    def __init__(self, *args, **kwargs):
+        self._values: Dict[_TKey, _TVal] = {}
+        self._keys: Dict[_TKey, _TKey] = {}
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __getitem__(self, key: _TKey) -> _TVal:
+        return self._values[key.lower() if isinstance(key, str) else key]
+
+    def __setitem__(self, key: _TKey, value: _TVal) -> None:
+        folded = key.lower() if isinstance(key, str) else key
+        if folded not in self._values:
+            self._keys[folded] = key
+        self._values[folded] = value
+
+    def __delitem__(self, key: _TKey) -> None:
+        folded = key.lower() if isinstance(key, str) else key
+        del self._values[folded]
+        del self._keys[folded]
+
+    def __contains__(self, key) -> bool:
+        return (key.lower() if isinstance(key, str) else key) in self._values
+
+    def __iter__(self):
+        return iter(self._keys.values())
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+    def get(self, key: _TKey, default: Optional[_TVal] = None) -> Optional[_TVal]:
+        return self._values.get(key.lower() if isinstance(key, str) else key, default)
+
+    _MISSING = object()
+
+    def pop(self, key: _TKey, default=_MISSING) -> _TVal:
+        folded = key.lower() if isinstance(key, str) else key
+        if folded not in self._values:
+            if default is CaseInsensitiveMap._MISSING:
+                raise KeyError(key)
+            return default
+        del self._keys[folded]
+        return self._values.pop(folded)
+
+    def remove(self, key: _TKey) -> Optional[_TVal]:
+        return self.pop(key, None)
+
+    def setdefault(self, key: _TKey, default: Optional[_TVal] = None) -> _TVal:
+        folded = key.lower() if isinstance(key, str) else key
+        if folded not in self._values:
+            self._keys[folded] = key
+            self._values[folded] = default
+            return default
+        return self._values[folded]
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._keys.clear()
+
+    def keys(self):
+        return self._keys.values()
+
+    def values(self):
+        return self._values.values()
+
+    def items(self):
+        return zip(self._keys.values(), self._values.values())
+
+    def copy(self) -> CaseInsensitiveMap[_TKey, _TVal]:
+        result = self.__class__()
+        result._values = self._values.copy()
+        result._keys = self._keys.copy()
+        return result
+
+
+class CaseInsensitiveKeySet(MutableSet):
+    """
+    Set of case-insensitive str keys, the counterpart of CaseInsensitiveMap. Iteration returns the original keys.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, keys: Optional[Iterable] = None):
+        self._keys: Dict = {}
+        if keys is not None:
+            self.update(keys)
+
+    def __contains__(self, key) -> bool:
+        return (key.lower() if isinstance(key, str) else key) in self._keys
+
+    def __iter__(self):
+        return iter(self._keys.values())
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({set(self._keys.values())})"
+
+    def add(self, key) -> None:
+        self._keys.setdefault(key.lower() if isinstance(key, str) else key, key)
+
+    def discard(self, key) -> None:
+        self._keys.pop(key.lower() if isinstance(key, str) else key, None)
+
+    def remove(self, key) -> None:
+        del self._keys[key.lower() if isinstance(key, str) else key]
+
+    def update(self, keys: Iterable) -> None:
+        for key in keys:
+            self._keys.setdefault(key.lower() if isinstance(key, str) else key, key)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
 class DynamicStructure(object):
     def __init__(self, **entries):
         self.__dict__.update(entries)
@@ -330,6 +458,30 @@ class QueryFieldUtil:
         return "".join(sb)
 
 
+_JSON_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+class _InitializerSpec:
+    """
+    What make_initialize_dict needs to know about an __init__, introspected once per class instead of per document
+    """
+
+    __slots__ = ("args", "arg_names", "accepts_kwargs", "defaults", "required_count")
+
+    def __init__(self, entity_init):
+        args, _, keywords, defaults, _, _, _ = inspect.getfullargspec(entity_init)
+        self.args: List[str] = args
+        self.arg_names = frozenset(args)
+        self.accepts_kwargs = bool(keywords)
+        self.defaults = defaults
+        self.required_count = len(args) - len(defaults) if defaults else len(args)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def of(entity_init) -> "_InitializerSpec":
+        return _InitializerSpec(entity_init)
+
+
 class Utils(object):
     primitives = (int, float, bool, str, bytes, bytearray)
     mutable_collections = (list, set)
@@ -374,6 +526,7 @@ class Utils(object):
                 yield item
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def convert_to_snake_case(name):
         s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
         return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
@@ -403,14 +556,18 @@ class Utils(object):
 
     @staticmethod
     def import_class(name) -> Optional[Type]:
-        components = name.split(".")
-        module_name = ".".join(name.split(".")[:-1])
-        mod = None
         try:
-            mod = getattr(__import__(module_name, fromlist=[components[-1]]), components[-1])
+            return Utils._import_class(name)
         except (ImportError, ValueError, AttributeError):
-            pass
-        return mod
+            # failures aren't cached, the module may become importable later
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _import_class(name) -> Type:
+        components = name.split(".")
+        module_name = ".".join(name.split(".")[:-1])
+        return getattr(__import__(module_name, fromlist=[components[-1]]), components[-1])
 
     @staticmethod
     def is_inherit(parent, child):
@@ -494,8 +651,6 @@ class Utils(object):
         if nested_object_types is None:
             return Utils.initialize_object(json_dict, object_type, True)
 
-        entity = DynamicStructure(**json_dict)
-        entity.__class__ = object_type
         entity = Utils.initialize_object(json_dict, object_type, True)
         if nested_object_types:
             Utils.fill_with_nested_object_types(entity, nested_object_types)
@@ -550,7 +705,7 @@ class Utils(object):
         if document is None:
             return None
         metadata = document.get("@metadata")
-        original_document = deepcopy(document)
+        original_document = Utils.copy_json(document)
         type_from_metadata = conventions.try_get_type_from_metadata(metadata)
         mapper = conventions.mappers.get(object_type, None)
 
@@ -585,9 +740,6 @@ class Utils(object):
         if nested_object_types is None and mapper:
             entity = create_entity_with_mapper(document, mapper, object_type)
         else:
-            entity = DynamicStructure(**document)
-            entity.__class__ = object_type
-
             entity = Utils.initialize_object(document, object_type)
 
             if nested_object_types:
@@ -623,21 +775,22 @@ class Utils(object):
 
         set_needed = False
         entity_initialize_dict = {}
-        args, __, keywords, defaults, _, _, _ = inspect.getfullargspec(entity_init)
+        spec = _InitializerSpec.of(entity_init)
+        args = spec.args
         if (len(args) - 1) > len(document):
-            remainder = len(args)
-            if defaults:
-                remainder -= len(defaults)
+            remainder = spec.required_count
+            defaults = spec.defaults
             for i in range(1, remainder):
                 entity_initialize_dict[args[i]] = document.get(args[i], None)
             for i in range(remainder, len(args)):
                 entity_initialize_dict[args[i]] = document.get(args[i], defaults[i - remainder])
         else:
-            if keywords:
+            if spec.accepts_kwargs:
                 entity_initialize_dict = document
             else:
+                arg_names = spec.arg_names
                 for key in document:
-                    if key in args:
+                    if key in arg_names:
                         entity_initialize_dict[key] = document[key]
             if not entity_initialize_dict and len(args) - 1 > 0:
                 set_needed = True
@@ -942,7 +1095,74 @@ class Utils(object):
 
     @staticmethod
     def entity_to_dict(entity, default_method) -> dict:
-        return json.loads(json.dumps(entity, default=default_method))
+        # same result as json.loads(json.dumps(entity, default=default_method)), without the text round trip
+        return Utils._to_json_value(entity, default_method)
+
+    @staticmethod
+    def _to_json_value(value, default_method, markers: Optional[Set[int]] = None):
+        value_type = type(value)
+        if value_type in _JSON_PRIMITIVE_TYPES:
+            return value
+
+        # subclasses are encoded by json module without calling default
+        if value_type not in (dict, list, tuple):
+            if isinstance(value, str):
+                return str.__str__(value)
+            if isinstance(value, int):
+                return int.__int__(value)
+            if isinstance(value, float):
+                return float.__float__(value)
+            if isinstance(value, (dict, list, tuple)):
+                return json.loads(json.dumps(value, default=default_method))
+
+        # containers and objects handed to default are tracked like json module does, so cycles raise the same error
+        if markers is None:
+            markers = set()
+        marker = id(value)
+        if marker in markers:
+            raise ValueError("Circular reference detected")
+        markers.add(marker)
+        try:
+            if value_type is dict:
+                result = {}
+                for key, item in value.items():
+                    if type(key) is not str:
+                        # let json module coerce the keys
+                        return json.loads(json.dumps(value, default=default_method))
+                    result[key] = (
+                        item
+                        if type(item) in _JSON_PRIMITIVE_TYPES
+                        else Utils._to_json_value(item, default_method, markers)
+                    )
+                return result
+
+            if value_type is list or value_type is tuple:
+                return [
+                    item if type(item) in _JSON_PRIMITIVE_TYPES else Utils._to_json_value(item, default_method, markers)
+                    for item in value
+                ]
+
+            return Utils._to_json_value(default_method(value), default_method, markers)
+        finally:
+            markers.discard(marker)
+
+    @staticmethod
+    def copy_json(value):
+        """
+        Copies a parsed json document. Only dicts and lists are copied, the immutable leaves are shared with the
+        original, which makes it considerably cheaper than deepcopy for documents coming from the server.
+        """
+        value_type = type(value)
+        if value_type is dict:
+            return {
+                key: item if type(item) in _JSON_PRIMITIVE_TYPES else Utils.copy_json(item)
+                for key, item in value.items()
+            }
+        if value_type is list:
+            return [item if type(item) in _JSON_PRIMITIVE_TYPES else Utils.copy_json(item) for item in value]
+        if value_type in _JSON_PRIMITIVE_TYPES:
+            return value
+        return deepcopy(value)
 
     @staticmethod
     def add_hours(date: datetime, hours: int):
@@ -1,9 +1,13 @@
 import base64
+import codecs
+import json
+import re
 import socket
 import ssl
-from typing import Tuple, Optional, Callable
+from typing import Any, List, Tuple, Optional, Callable
 
 from ravendb.documents.commands.subscriptions import TcpConnectionInfo
+from ravendb.json.codec import DEFAULT_JSON_CODEC, JsonCodec, StandardJsonCodec
 from ravendb.serverwide.tcp import TcpConnectionHeaderMessage
 
 
@@ -110,3 +114,122 @@ class TcpUtils:
 
         supported_features = TcpUtils.invoke_negotiation(info, operation_type, negotiation_callback, info.url, s)
         return TcpUtils.ConnectSecuredTcpSocketResult(info.url, s, supported_features)
+
+
+class TcpJsonMessageReader:
+    """
+    Reads json messages which the server writes one after another to a tcp connection.
+    Messages which are already received whole are decoded straight from the buffer. A message spread over many
+    reads isn't re-parsed after each of them - only the new text is scanned for its end (braces outside of strings)
+    and the message is decoded once it's complete, so reading stays linear in the size of the message.
+    Codecs other than the standard one can't decode at an offset, they get every message cut out by the scanner.
+    """
+
+    _WHITESPACE = re.compile(r"\s*")
+    # everything up to the next brace - complete strings (which may contain braces) are skipped as a whole
+    _CONTENT = re.compile(r'[^{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^{}"]*)*', re.DOTALL)
+    # rest of a string which didn't fit into previous reads, up to its closing quote
+    _STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+    def __init__(self, receive_buffer_size: int, json_codec: Optional[JsonCodec] = None):
+        self.__receive_buffer_size = receive_buffer_size
+        self.__json_codec = json_codec or DEFAULT_JSON_CODEC
+        self.__decoder = json.JSONDecoder() if isinstance(self.__json_codec, StandardJsonCodec) else None
+        self.reset()
+
+    def reset(self) -> None:
+        # utf-8 sequences can be split between reads, the incremental decoder keeps the incomplete ones
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer = ""
+        self.__position = 0
+        self.__parts: Optional[List[str]] = None
+        self.__depth = 0
+        self.__in_string = False
+        self.__escaped = False
+
+    def read(self, sock: socket.socket) -> Any:
+        while True:
+            if self.__parts is None:
+                buffer = self.__buffer
+                position = self.__position
+                if position < len(buffer) and buffer[position] != "{":
+                    position = self._WHITESPACE.match(buffer, position).end()
+                if position == len(buffer):
+                    self.__buffer = self.__receive(sock)
+                    self.__position = 0
+                    continue
+
+                if self.__decoder is not None:
+                    try:
+                        message, self.__position = self.__decoder.raw_decode(buffer, position)
+                        return message
+                    except json.JSONDecodeError:
+                        pass
+
+                # the message isn't complete yet (or the codec needs it cut out), it's scanned for its end
+                # and from now on only newly received text is scanned
+                self.__parts = []
+                self.__depth = 0
+                self.__in_string = False
+                self.__escaped = False
+                self.__buffer = ""
+                self.__position = 0
+                text = buffer
+                start = position
+            else:
+                text = self.__receive(sock)
+                start = 0
+
+            end = self.__scan(text, start)
+            if end is None:
+                self.__parts.append(text[start:] if start else text)
+                continue
+
+            self.__parts.append(text[start:end])
+            message_text = "".join(self.__parts)
+            self.__parts = None
+            self.__buffer = text
+            self.__position = end
+            return self.__json_codec.loads(message_text)
+
+    def __receive(self, sock: socket.socket) -> str:
+        data = sock.recv(self.__receive_buffer_size)
+        if not data:
+            raise ConnectionAbortedError("Connection was closed by the server")
+        return self.__text_decoder.decode(data)
+
+    def __scan(self, text: str, position: int) -> Optional[int]:
+        end = len(text)
+        while position < end:
+            if self.__in_string:
+                if self.__escaped:
+                    self.__escaped = False
+                    position += 1
+                    continue
+                position = self._STRING_BODY.match(text, position).end()
+                if position == end:
+                    break
+                if text[position] == "\\":
+                    # escaped character comes with the next read
+                    self.__escaped = True
+                    break
+                self.__in_string = False
+                position += 1
+                continue
+
+            position = self._CONTENT.match(text, position).end()
+            if position == end:
+                break
+
+            token = text[position]
+            position += 1
+            if token == '"':
+                # string doesn't end in this read
+                self.__in_string = True
+            elif token == "{":
+                self.__depth += 1
+            else:
+                self.__depth -= 1
+                if self.__depth == 0:
+                    return position
+        return None
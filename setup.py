@@ -25,5 +25,6 @@ setup(
         "websocket-client >= 0.46.0",
         "inflect >= 5.4.0",
     ],
+    extras_require={"async": ["aiohttp >= 3.8"], "orjson": ["orjson >= 3.6"]},
     zip_safe=False,
 )